@@ -0,0 +1,78 @@
+# bench_keyword_matcher.py
+"""
+Benchmark: per-keyword regex scans (the previous analyzer approach) versus the
+precompiled single-pass KeywordMatcher, at 10k repos x 200 keywords.
+
+Run from the repository root:
+    python -m benchmarks.bench_keyword_matcher [--repos 10000] [--keywords 200]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List
+
+from src.keyword_matcher import KeywordMatcher
+from src.github_analyzer import COMPLEXITY_KEYWORDS, DOC_KEYWORDS, MATH_LIBRARIES
+
+
+def make_keywords(n: int, rng: random.Random) -> List[str]:
+    """Real analyzer keywords padded with synthetic one- and two-word terms."""
+    keywords = list(dict.fromkeys(MATH_LIBRARIES + COMPLEXITY_KEYWORDS + DOC_KEYWORDS))
+    syllables = ['al', 'ge', 'bra', 'tor', 'ic', 'lin', 'ear', 'ma', 'trix', 'vec', 'spec', 'tral', 'quant', 'um']
+    while len(keywords) < n:
+        word = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        if rng.random() < 0.2:
+            word += ' ' + ''.join(rng.choice(syllables) for _ in range(2))
+        if word not in keywords:
+            keywords.append(word)
+    return keywords[:n]
+
+
+def make_texts(n: int, keywords: List[str], rng: random.Random) -> List[str]:
+    filler = ['a', 'library', 'for', 'fast', 'python', 'tools', 'with', 'and', 'the', 'data', 'of', 'project']
+    texts = []
+    for _ in range(n):
+        words = [rng.choice(filler) for _ in range(rng.randint(5, 25))]
+        for _ in range(rng.randint(0, 4)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        texts.append(' '.join(words))
+    return texts
+
+
+def per_keyword_scan(texts: List[str], keywords: List[str]) -> List[List[str]]:
+    results = []
+    for text in texts:
+        results.append([kw for kw in keywords if re.search(r'\b' + re.escape(kw) + r'\b', text)])
+    return results
+
+
+def single_pass_scan(texts: List[str], keywords: List[str]) -> List[List[str]]:
+    matcher = KeywordMatcher(keywords)
+    return [matcher.find(text) for text in texts]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repos', type=int, default=10_000)
+    parser.add_argument('--keywords', type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(42)
+    keywords = make_keywords(args.keywords, rng)
+    texts = make_texts(args.repos, keywords, rng)
+
+    timings = {}
+    outputs = {}
+    for name, fn in (('per-keyword re.search', per_keyword_scan), ('KeywordMatcher', single_pass_scan)):
+        start = time.perf_counter()
+        outputs[name] = fn(texts, keywords)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:<24} {timings[name]:8.3f} s")
+    assert outputs['per-keyword re.search'] == outputs['KeywordMatcher'], "matchers disagree"
+    print(f"speedup: {timings['per-keyword re.search'] / timings['KeywordMatcher']:.1f}x "
+          f"({args.repos} texts x {len(keywords)} keywords)")
+
+
+if __name__ == '__main__':
+    main()
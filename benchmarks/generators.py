@@ -0,0 +1,65 @@
+# generators.py
+"""
+Deterministic synthetic inputs for the benchmark suite: GitHub repo metadata lists
+and resume texts shaped like the real data the analyzers and parser see.
+"""
+
+import random
+from typing import Any, Dict, List
+
+from src.scoring_profile import COMPLEXITY_KEYWORDS, DOC_KEYWORDS, MATH_LIBRARIES, MATH_SKILL_KEYWORDS
+
+_FILLER = ['a', 'library', 'for', 'fast', 'python', 'tools', 'with', 'and', 'the', 'data', 'of', 'project',
+           'simple', 'web', 'service', 'experiments', 'notes', 'utilities', 'client', 'api']
+_LANGUAGES = ['Python', 'C++', 'Julia', 'R', 'Rust', 'JavaScript', None]
+_DEGREES = ['Ph.D. in Applied Mathematics', 'M.S. Statistics', 'B.Sc. Physics', 'BA Economics', 'MBA']
+
+
+def _sentence(rng: random.Random, keywords: List[str], words: int, hits: int) -> str:
+    tokens = [rng.choice(_FILLER) for _ in range(words)]
+    for _ in range(hits):
+        tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(keywords))
+    return ' '.join(tokens)
+
+
+def make_repos(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """`n` repos with names, descriptions, topics, language and doc flags."""
+    rng = random.Random(seed)
+    keywords = MATH_LIBRARIES + COMPLEXITY_KEYWORDS + DOC_KEYWORDS
+    repos = []
+    for i in range(n):
+        repos.append({
+            'id': i,
+            'name': f"{rng.choice(_FILLER)}-{rng.choice(COMPLEXITY_KEYWORDS).replace(' ', '-')}-{i}",
+            'description': _sentence(rng, keywords, rng.randint(3, 20), rng.randint(0, 3)) if rng.random() < 0.9 else None,
+            'topics': rng.sample(keywords, rng.randint(0, 4)),
+            'language': rng.choice(_LANGUAGES),
+            'has_wiki': rng.random() < 0.3,
+            'has_pages': rng.random() < 0.1,
+            'has_readme': rng.random() < 0.7,
+        })
+    return repos
+
+
+def make_resume_text(rng: random.Random) -> str:
+    """One resume with the usual headers and a mix of math skills and filler."""
+    lines = [f"Candidate {rng.randrange(10**6)}", "Contact: candidate@example.com", ""]
+    lines.append("Education")
+    lines.extend(rng.sample(_DEGREES, rng.randint(1, 2)))
+    lines.append("")
+    lines.append("Experience")
+    for _ in range(rng.randint(2, 6)):
+        lines.append(_sentence(rng, MATH_SKILL_KEYWORDS, rng.randint(6, 16), rng.randint(0, 2)))
+    lines.append("")
+    lines.append("Projects")
+    for _ in range(rng.randint(1, 3)):
+        lines.append(_sentence(rng, MATH_SKILL_KEYWORDS, rng.randint(5, 12), 1))
+    lines.append("")
+    lines.append("Technical Skills")
+    lines.append(', '.join(rng.sample(MATH_SKILL_KEYWORDS, rng.randint(3, 10))))
+    return '\n'.join(lines)
+
+
+def make_resume_texts(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [make_resume_text(rng) for _ in range(n)]
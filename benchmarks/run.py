@@ -0,0 +1,136 @@
+# run.py
+"""
+Run the benchmark suite and record timings to JSON, optionally comparing against an
+earlier run to flag regressions.
+
+Run from the repository root:
+    python -m benchmarks.run [--sizes 10,1000,100000] [--filter github.] [--repeat 5]
+    python -m benchmarks.run --sizes 10,1000 --compare benchmarks/results/<old>.json
+
+Results default to benchmarks/results/<commit>.json. Exits with status 1 when
+--compare finds a benchmark slower than --threshold times its previous median.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.suite import BENCHMARKS, SIZES
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+MIN_SAMPLE_SECONDS = 0.05
+
+
+def current_commit() -> str:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit or 'unknown'
+
+
+def time_callable(fn, repeat: int) -> Dict[str, Any]:
+    """
+    Time `fn` timeit-style: calls are batched until one sample takes at least
+    MIN_SAMPLE_SECONDS, then `repeat` samples are taken; times are per call.
+    """
+    start = time.perf_counter()
+    fn()  # warm-up, also sizes the batch
+    elapsed = time.perf_counter() - start
+    number = max(1, int(MIN_SAMPLE_SECONDS / elapsed)) if elapsed > 0 else 1000
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {'median': statistics.median(samples), 'min': min(samples), 'mean': statistics.fmean(samples),
+            'repeat': repeat, 'number': number}
+
+
+def run_suite(sizes: Tuple[int, ...] = SIZES, name_filter: str = '', repeat: int = 5,
+              log=None) -> Dict[str, Dict[str, Any]]:
+    """Run matching benchmarks; returns {name: {size: timing}} (fixed-input size key: 'fixed')."""
+    results: Dict[str, Dict[str, Any]] = {}
+    for bench in BENCHMARKS:
+        if name_filter not in bench.name:
+            continue
+        for size in bench.sizes:
+            if size is not None and size not in sizes:
+                continue
+            with bench.prepare(size) as fn:
+                timing = time_callable(fn, repeat)
+            key = 'fixed' if size is None else str(size)
+            results.setdefault(bench.name, {})[key] = timing
+            if log:
+                log(f"{bench.name:<46} {key:>7}  {timing['median'] * 1e3:12.3f} ms")
+    return results
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any], threshold: float) -> Tuple[List[str], int]:
+    """Return report lines and the number of regressions between two result files."""
+    lines = []
+    regressions = 0
+    for name, by_size in current['results'].items():
+        for size, timing in by_size.items():
+            old = previous.get('results', {}).get(name, {}).get(size)
+            if old is None:
+                continue
+            ratio = timing['median'] / old['median'] if old['median'] else float('inf')
+            flag = ''
+            if ratio > threshold:
+                flag = '  REGRESSION'
+                regressions += 1
+            elif ratio < 1 / threshold:
+                flag = '  improved'
+            lines.append(f"{name:<46} {size:>7}  {old['median'] * 1e3:10.3f} -> {timing['median'] * 1e3:10.3f} ms"
+                         f"  ({ratio:.2f}x){flag}")
+    return lines, regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)), help="comma-separated input sizes")
+    parser.add_argument('--filter', default='', help="only run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', help="earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=1.2, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    commit = current_commit()
+    results = run_suite(tuple(int(s) for s in args.sizes.split(',') if s), args.filter, args.repeat, log=print)
+    record = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=2)
+    print(f"results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+        lines, regressions = compare(previous, record, args.threshold)
+        print(f"\ncompared with {previous.get('commit', args.compare)}:")
+        print('\n'.join(lines))
+        if regressions:
+            print(f"{regressions} regression(s) above {args.threshold:.2f}x", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
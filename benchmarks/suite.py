@@ -0,0 +1,145 @@
+# suite.py
+"""
+Benchmark definitions for the parsing, GitHub analysis, scoring and batch hot paths.
+Each benchmark's setup builds its inputs for a given size (untimed) and returns the
+callable that is timed. A setup that holds resources (temporary files) is written as
+a generator instead: it yields the callable and cleans up after the timing.
+"""
+
+import inspect
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from benchmarks.generators import make_repos, make_resume_texts
+from src.github_analyzer import GitHubAnalyzer
+from src.leaderboard import Leaderboard
+from src.resume_parser import ResumeParser, SAMPLE_RESUME_DIR
+from src.skill_scorer import SkillScorer
+
+SIZES = (10, 1_000, 100_000)
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[Optional[int]], Any]  # returns (or yields) the timed callable
+    sizes: Tuple[Optional[int], ...] = SIZES  # (None,) for fixed-input benchmarks
+
+    @contextmanager
+    def prepare(self, size: Optional[int]) -> Iterator[Callable[[], object]]:
+        """The timed callable for `size`; a generator setup is finished (torn down) on exit."""
+        if inspect.isgeneratorfunction(self.setup):
+            with contextmanager(self.setup)(size) as fn:
+                yield fn
+        else:
+            yield self.setup(size)
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, sizes: Tuple[Optional[int], ...] = SIZES):
+    def register(setup: Callable[[Optional[int]], Any]):
+        BENCHMARKS.append(Benchmark(name, setup, sizes))
+        return setup
+    return register
+
+
+def _analyzer() -> GitHubAnalyzer:
+    return GitHubAnalyzer('benchmark')
+
+
+@benchmark('resume.parse_resume')
+def parse_resume(size: int) -> Callable[[], object]:
+    parser, texts = ResumeParser(), make_resume_texts(size)
+    return lambda: [parser.parse_resume(text) for text in texts]
+
+
+@benchmark('resume.extract_skills')
+def extract_skills(size: int) -> Callable[[], object]:
+    parser, texts = ResumeParser(), make_resume_texts(size)
+    return lambda: [parser.extract_skills(text) for text in texts]
+
+
+@benchmark('resume.extract_text[sample_pdfs]', sizes=(None,))
+def extract_text(size: None) -> Callable[[], object]:
+    parser = ResumeParser()
+    pdfs = parser.get_pdf_files()
+    return lambda: [parser.extract_text(pdf) for pdf in pdfs]
+
+
+@benchmark('resume.batch_parse[sample_pdfs]', sizes=(None,))
+def batch_parse(size: None) -> Callable[[], object]:
+    return lambda: ResumeParser(SAMPLE_RESUME_DIR).batch_parse()
+
+
+@benchmark('resume.batch_parse[sample_pdfs,workers=2]', sizes=(None,))
+def batch_parse_parallel(size: None) -> Callable[[], object]:
+    return lambda: ResumeParser(SAMPLE_RESUME_DIR).batch_parse(workers=2)
+
+
+@benchmark('resume.parse_to_jsonl[sample_pdfs]', sizes=(None,))
+def parse_to_jsonl(size: None) -> Iterator[Callable[[], object]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'resumes.jsonl')
+        yield lambda: ResumeParser(SAMPLE_RESUME_DIR).parse_to_jsonl(output, keep_raw_text=False)
+
+
+@benchmark('github.analyze_math_libraries')
+def analyze_math_libraries(size: int) -> Callable[[], object]:
+    analyzer, repos = _analyzer(), make_repos(size)
+    return lambda: analyzer.analyze_math_libraries(repos)
+
+
+@benchmark('github.analyze_repo_complexity')
+def analyze_repo_complexity(size: int) -> Callable[[], object]:
+    analyzer, repos = _analyzer(), make_repos(size)
+    return lambda: analyzer.analyze_repo_complexity(repos)
+
+
+@benchmark('github.analyze_documentation')
+def analyze_documentation(size: int) -> Callable[[], object]:
+    analyzer, repos = _analyzer(), make_repos(size)
+    return lambda: analyzer.analyze_documentation(repos)
+
+
+@benchmark('github.analyze_all')
+def analyze_all(size: int) -> Callable[[], object]:
+    analyzer, repos = _analyzer(), make_repos(size)
+    return lambda: analyzer.analyze_all(repos)
+
+
+def _cohort(size: int) -> List[Dict[str, object]]:
+    # A cohort of `size` candidates, each with a small repo list and a parsed resume
+    parser = ResumeParser()
+    texts = make_resume_texts(size, seed=1)
+    analyses = [_analyzer().analyze_all(make_repos(5, seed=i % 100)) for i in range(min(size, 100))]
+    return [{'id': f"c{i}", 'resume': parser.parse_resume(text), 'github': analyses[i % len(analyses)]}
+            for i, text in enumerate(texts)]
+
+
+@benchmark('scoring.features')
+def scoring_features(size: int) -> Callable[[], object]:
+    scorer, cohort = SkillScorer(), _cohort(size)
+    return lambda: scorer.features(cohort)
+
+
+@benchmark('scoring.score_features')
+def scoring_score_features(size: int) -> Callable[[], object]:
+    scorer = SkillScorer()
+    features = scorer.features(_cohort(size))
+    return lambda: scorer.score_features(features)
+
+
+@benchmark('scoring.score')
+def scoring_score(size: int) -> Callable[[], object]:
+    # The whole cohort path: features from candidate records, then normalize, weight and rank
+    scorer, cohort = SkillScorer(), _cohort(size)
+    return lambda: scorer.score(cohort)
+
+
+@benchmark('ranking.leaderboard_build_top50')
+def leaderboard(size: int) -> Callable[[], object]:
+    scores = [(f"c{i}", float((i * 7919) % 1000)) for i in range(size)]
+    return lambda: Leaderboard(scores).top(50)
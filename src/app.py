@@ -11,10 +11,52 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import streamlit as st
 from src.github_analyzer import GitHubAnalyzer
+from src.github_client import RateLimitError
+from src.github_graphql import create_analyzer
+from src.http_cache import HTTPCache
+from src.skill_scorer import SkillScorer
+from src.doc_content import DocContentFetcher
+from src.source_scanner import SourceScanner
 import pandas as pd
 
 st.set_page_config(page_title="Mathematical Talent Analyzer", layout="wide")
 
+# Scores a profile on its GitHub features only (no resume is uploaded in this view)
+GITHUB_SCORER = SkillScorer(weights={'math_skills': 0, 'degree_level': 0})
+
+# Bounds for cached analysis results on the shared server
+RESULT_CACHE_TTL = 15 * 60
+RESULT_CACHE_MAX_ENTRIES = 64
+
+
+@st.cache_resource
+def get_http_cache() -> HTTPCache:
+    """One on-disk GitHub response cache shared by all sessions."""
+    return HTTPCache()
+
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_github_analysis(username: str, freshness_key: str, deep_scan: bool = False, read_docs: bool = False):
+    """
+    Fetch repos and compute the analysis for `username`. Keyed by the user's repo
+    freshness token, so reruns triggered by widgets reuse the result until the
+    candidate's repositories change or the entry expires. With `deep_scan`, Python
+    repos' source imports also count towards math library usage; with `read_docs`, README
+    and docs/ content adds to the documentation score. With GITHUB_TOKEN
+    set, repos are fetched through GraphQL, which also reports README presence.
+    """
+    analyzer = create_analyzer(username, cache=get_http_cache())
+    analyzer.fetch_profile()
+    repos = analyzer.fetch_repos()
+    if deep_scan:
+        with SourceScanner(analyzer) as scanner:
+            repos = scanner.annotate(repos)
+    if read_docs:
+        with DocContentFetcher(analyzer) as fetcher:
+            repos = fetcher.annotate(repos)
+    return repos, analyzer.analyze_all(repos)
+
+
 # Sidebar with project info and instructions
 with st.sidebar:
     st.image("https://img.icons8.com/fluency/96/brain.png", width=64)
@@ -29,6 +71,10 @@ with st.sidebar:
     <span style='color:#888;'>Enter a username and click <b>Analyze</b>.</span>
     """, unsafe_allow_html=True)
     recruiter_mode = st.checkbox("Recruiter Mode", value=False, help="Show recruiter-focused summary and export tools.")
+    deep_scan = st.checkbox("Deep source scan", value=False,
+                            help="Download Python repos and detect math libraries from their imports (slower on first run).")
+    read_docs = st.checkbox("Read README and docs", value=False,
+                            help="Scan README and docs/ content for documentation keywords, equations and references.")
     if recruiter_mode:
         st.markdown("""
         <div style='background:#eaf6ff; color:#155fa0; border-radius:8px; padding:10px; margin-top:10px; margin-bottom:10px; text-align:center; font-weight:600;'>
@@ -57,12 +103,18 @@ with st.form("github_form"):
     username = st.text_input("🔗 GitHub Username", "")
     submitted = st.form_submit_button("Analyze")
 
+# Keep showing the last analyzed user when other widgets trigger a rerun
 if submitted and username:
+    st.session_state["analyzed_username"] = username
+username = st.session_state.get("analyzed_username", "")
+
+if username:
     try:
-        analyzer = GitHubAnalyzer(username)
+        analyzer = GitHubAnalyzer(username, cache=get_http_cache())
         with st.spinner(f"Fetching GitHub data for {username}..."):
             profile = analyzer.fetch_profile()
-            repos = analyzer.fetch_repos()
+            # Computed once per (user, repo freshness) and reused by the summary, tabs and charts below
+            repos, analysis = load_github_analysis(username, analyzer.fetch_freshness_key(), deep_scan, read_docs)
         st.success(f"Fetched {len(repos)} repositories for {username}.")
 
         col1, col2 = st.columns([1, 2])
@@ -76,25 +128,14 @@ if submitted and username:
             st.markdown(f"[View on GitHub]({profile.get('html_url', '')})")
 
             # --- Math Talent Analyzer Summary ---
-            math_libs = analyzer.analyze_math_libraries(repos)
-            complexity = analyzer.analyze_repo_complexity(repos)
-            documentation = analyzer.analyze_documentation(repos)
-            unique_libs = len([lib for lib, v in math_libs.items() if v["count"] > 0])
-            avg_complexity_level = 0
-            if complexity:
-                levels = []
-                for v in complexity.values():
-                    score = v["score"]
-                    if score == 0:
-                        levels.append(0)
-                    elif score == 1:
-                        levels.append(1)
-                    elif 2 <= score <= 3:
-                        levels.append(2)
-                    else:
-                        levels.append(3)
-                avg_complexity_level = sum(levels) / len(levels)
-            avg_doc_score = sum(v["score"] for v in documentation.values()) / max(1, len(documentation))
+            math_libs = analysis.math_libraries
+            complexity = analysis.complexity
+            documentation = analysis.documentation
+            unique_libs = analysis.unique_libs
+            avg_complexity_level = analysis.avg_complexity_level
+            avg_doc_score = analysis.avg_doc_score
+            repo_frame = analysis.repo_frame
+            level_labels = {0: "None", 1: "Basic", 2: "Advanced", 3: "Research-level"}
 
             # Summarize each metric
             def summarize_libs(n):
@@ -162,6 +203,8 @@ if submitted and username:
                     "<li><span class='badge-yellow'>⚠</span>Minimal or no documentation</li>" if avg_doc_score < 1.5 else "",
                 ])
             ), unsafe_allow_html=True)
+            github_score = GITHUB_SCORER.score([{'id': username, 'github': analysis}])['score'].iloc[0]
+            st.metric("GitHub Math Score", f"{github_score:.0f} / 100")
 
             # --- Export Buttons ---
             import io
@@ -169,6 +212,7 @@ if submitted and username:
             summary_lines = [
                 "Math Talent Analysis Summary",
                 "",
+                f"GitHub Math Score: {github_score:.0f} / 100",
                 f"Math Libraries: {summarize_libs(unique_libs)}",
                 f"Code Complexity: {summarize_complexity(avg_complexity_level)}",
                 f"Documentation: {summarize_doc(avg_doc_score)}",
@@ -288,7 +332,6 @@ if submitted and username:
                 - **Interpretation**: Higher counts indicate more experience with advanced math/science tools.
                 ℹ️ <span style='color:#888;'>Tip: Click column headers to sort tables.</span>
                 """, unsafe_allow_html=True)
-                math_libs = analyzer.analyze_math_libraries(repos)
                 if math_libs:
                     df_libs = pd.DataFrame([
                         {"Library": lib, "Count": v["count"], "Repos": ", ".join(v["repos"])}
@@ -311,21 +354,14 @@ if submitted and username:
                 - **Interpretation**: Higher scores indicate more sophisticated or research-level codebases.
                 ℹ️ <span style='color:#888;'>Hover over column headers for more details.</span>
                 """, unsafe_allow_html=True)
-                complexity = analyzer.analyze_repo_complexity(repos)
                 if complexity:
-                    def complexity_level(score):
-                        if score == 0:
-                            return "None"
-                        elif score == 1:
-                            return "Basic"
-                        elif 2 <= score <= 3:
-                            return "Advanced"
-                        else:
-                            return "Research-level"
-                    df_complex = pd.DataFrame([
-                        {"Repository": repo, "Signals": ", ".join(v["complexity_signals"]), "Score": v["score"], "Complexity Level": complexity_level(v["score"])}
-                        for repo, v in complexity.items()
-                    ])
+                    complex_rows = repo_frame[repo_frame["complexity"] > 0]
+                    df_complex = pd.DataFrame({
+                        "Repository": complex_rows["repository"],
+                        "Signals": complex_rows["complexity_signals"].map(", ".join),
+                        "Score": complex_rows["complexity"],
+                        "Complexity Level": complex_rows["complexity_level"].map(level_labels),
+                    }).reset_index(drop=True)
                     st.dataframe(df_complex, use_container_width=True)
                     st.info("""
                     **Complexity Level:**
@@ -353,12 +389,11 @@ if submitted and username:
                 ℹ️ <span style='color:#888;'>Click pie slices for details.</span>
                 <br>_Scores are heuristically assigned based on repo metadata, descriptions, topics, and README content._
                 """, unsafe_allow_html=True)
-                documentation = analyzer.analyze_documentation(repos)
                 if documentation:
-                    df_doc = pd.DataFrame([
-                        {"Repository": repo, "Score": v["score"], "Notes": v["notes"]}
-                        for repo, v in documentation.items()
-                    ])
+                    doc_rows = repo_frame[repo_frame["documentation"] > 0]
+                    df_doc = doc_rows[["repository", "documentation", "doc_notes"]].rename(columns={
+                        "repository": "Repository", "documentation": "Score", "doc_notes": "Notes",
+                    }).reset_index(drop=True)
                     st.dataframe(df_doc, use_container_width=True)
                     # Pie chart visualization for documentation quality scores
                     import plotly.express as px
@@ -377,21 +412,9 @@ if submitted and username:
             with st.expander("Repository Score Over Time", expanded=False):
                 import plotly.express as px
                 if repos:
-                    repo_scores = []
-                    for repo in repos:
-                        name = repo.get("name", "N/A")
-                        created = repo.get("created_at", None)
-                        complexity_score = complexity.get(name, {}).get("score", 0)
-                        doc_score = documentation.get(name, {}).get("score", 0)
-                        math_score = sum(1 for v in math_libs.values() if name in v["repos"])
-                        total_score = complexity_score + doc_score + math_score
-                        repo_scores.append({"Repository": name, "Created": created, "Total Score": total_score})
-                    df_time = pd.DataFrame(repo_scores)
-                    if not df_time.empty and df_time["Created"].notnull().any():
-                        df_time = df_time[df_time["Created"].notnull()].copy()
-                        df_time["Created"] = pd.to_datetime(df_time["Created"])
-                        df_time = df_time.sort_values("Created")
-                        st.line_chart(df_time.set_index("Created")["Total Score"])
+                    df_time = repo_frame[repo_frame["created_at"].notnull()].sort_values("created_at")
+                    if not df_time.empty:
+                        st.line_chart(df_time.set_index("created_at")["total"].rename("Total Score"))
                     else:
                         st.info("No repository creation dates available for trend analysis.")
 
@@ -399,26 +422,11 @@ if submitted and username:
         try:
             import plotly.graph_objects as go
             import plotly.express as px
-            math_libs = analyzer.analyze_math_libraries(repos)
-            complexity = analyzer.analyze_repo_complexity(repos)
-            documentation = analyzer.analyze_documentation(repos)
+            repo_frame = analysis.repo_frame
             # Aggregate metrics for radar chart
-            unique_libs = len([lib for lib, v in math_libs.items() if v["count"] > 0])
-            avg_complexity_level = 0
-            levels = []
-            for v in complexity.values():
-                score = v["score"]
-                if score == 0:
-                    levels.append(0)
-                elif score == 1:
-                    levels.append(1)
-                elif 2 <= score <= 3:
-                    levels.append(2)
-                else:
-                    levels.append(3)
-            if levels:
-                avg_complexity_level = sum(levels) / len(levels)
-            avg_doc_score = sum(v["score"] for v in documentation.values()) / max(1, len(documentation))
+            unique_libs = analysis.unique_libs
+            avg_complexity_level = analysis.avg_complexity_level
+            avg_doc_score = analysis.avg_doc_score
             radar_metrics = {
                 "Math Library Diversity": unique_libs,
                 "Avg. Complexity Level (0-3)": avg_complexity_level,
@@ -457,11 +465,9 @@ if submitted and username:
             # Pie chart: distribution of complexity levels
             st.markdown("#### Complexity Level Distribution")
             level_labels = {0: "None", 1: "Basic", 2: "Advanced", 3: "Research-level"}
-            # Defensive: always define levels
-            if 'levels' not in locals() or not isinstance(levels, list):
-                levels = []
-            if levels:
-                level_counts = pd.Series([level_labels.get(l, "Other") for l in levels]).value_counts()
+            levels = repo_frame.loc[repo_frame["complexity"] > 0, "complexity_level"]
+            if not levels.empty:
+                level_counts = levels.map(level_labels).fillna("Other").value_counts()
             else:
                 level_counts = pd.Series(["None"]).value_counts()
             if level_counts.sum() == 0:
@@ -478,8 +484,8 @@ if submitted and username:
             # Pie chart: distribution of documentation quality
             st.markdown("#### Documentation Quality Distribution")
             doc_labels = {0: "None", 1: "Minimal", 2: "Some usage/examples", 3: "Detailed", 4: "Exceptional"}
-            doc_scores = [min(int(v["score"]), 4) for v in documentation.values()]
-            doc_counts = pd.Series([doc_labels.get(s, "Other") for s in doc_scores]).value_counts()
+            doc_scores = repo_frame.loc[repo_frame["documentation"] > 0, "documentation"].clip(upper=4)
+            doc_counts = doc_scores.map(doc_labels).fillna("Other").value_counts()
             pie2 = px.pie(
                 names=doc_counts.index,
                 values=doc_counts.values,
@@ -491,6 +497,8 @@ if submitted and username:
         except Exception as radar_exc:
             st.info(f"Radar chart could not be rendered: {radar_exc}")
 
+    except RateLimitError as e:
+        st.error(f"GitHub rate limit reached. Please retry after {e.retry_at:%Y-%m-%d %H:%M:%S} UTC.")
     except Exception as e:
         st.error(f"Error analyzing GitHub profile: {e}")
 
@@ -0,0 +1,196 @@
+# async_github_analyzer.py
+"""
+Module providing an asyncio/httpx counterpart of GitHubAnalyzer for screening many
+candidates at once. All analyzers in a batch share one connection pool, one
+request semaphore and one rate-limit budget; results are yielded per user in
+completion order.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from src.github_analyzer import GitHubAnalysis, GitHubAnalyzer, GITHUB_API_URL
+from src.github_client import (
+    DEFAULT_MAX_RETRIES, RateLimiter, RateLimitError, get_shared_rate_limiter, request_headers,
+)
+from src.http_cache import HTTPCache
+from src.scoring_profile import ScoringProfile
+
+
+def create_async_client(concurrency: int = 8) -> httpx.AsyncClient:
+    """Create a keep-alive async client whose pool fits `concurrency` requests."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    return httpx.AsyncClient(limits=limits, timeout=10, headers=request_headers())
+
+
+class AsyncGitHubAnalyzer:
+    """
+    Async counterpart of GitHubAnalyzer: `fetch_profile`, `fetch_repos` and `analyze_user`
+    are coroutines. It wraps a GitHubAnalyzer (`analyzer`) for URL building, response and
+    cache handling, the retry policy and the analyze_* methods, but is not one itself, so
+    nothing that takes a GitHubAnalyzer can end up calling a coroutine synchronously.
+    Cache reads and writes run in a worker thread to keep SQLite I/O off the event loop.
+    Use as an async context manager when it owns its client.
+    """
+    def __init__(self, username: str, client: Optional[httpx.AsyncClient] = None,
+                 api_url: str = GITHUB_API_URL, max_workers: int = 8,
+                 cache: Optional[HTTPCache] = None, rate_limiter: Optional[RateLimiter] = None,
+                 token: Optional[str] = None, max_retries: int = DEFAULT_MAX_RETRIES,
+                 semaphore: Optional[asyncio.Semaphore] = None,
+                 scoring_profile: Optional[ScoringProfile] = None):
+        self.analyzer = GitHubAnalyzer(username, api_url=api_url, max_workers=max_workers, cache=cache,
+                                       rate_limiter=rate_limiter or get_shared_rate_limiter(), token=token,
+                                       max_retries=max_retries, scoring_profile=scoring_profile)
+        self._owns_client = client is None
+        self.client = client or create_async_client(self.analyzer.max_workers)
+        self.semaphore = semaphore or asyncio.Semaphore(self.analyzer.max_workers)
+
+    @property
+    def username(self) -> str:
+        return self.analyzer.username
+
+    @property
+    def profile(self) -> Dict[str, Any]:
+        return self.analyzer.profile
+
+    async def __aenter__(self) -> 'AsyncGitHubAnalyzer':
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _request(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """Async counterpart of GitHubAnalyzer._request, bounded by the shared semaphore."""
+        analyzer = self.analyzer
+        headers = {**request_headers(analyzer.token), **headers}
+        for attempt in range(analyzer.max_retries + 1):
+            wait = analyzer.rate_limiter.delay(url)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                async with self.semaphore:
+                    response = await self.client.get(url, headers=headers)
+            except httpx.HTTPError as e:
+                await asyncio.sleep(analyzer._retry_wait(url, attempt, error=e))
+                continue
+            retry = analyzer._retry_wait(url, attempt, response)
+            if retry is None:
+                return response
+            await asyncio.sleep(retry)
+
+    async def _get(self, url: str) -> Tuple[Any, Dict[str, str]]:
+        analyzer = self.analyzer
+        if analyzer.cache is None:
+            response = await self._request(url, {})
+            return analyzer._read_response(url, None, response)
+        entry, result = await asyncio.to_thread(analyzer._cached, url)
+        if result is not None:
+            return result
+        response = await self._request(url, analyzer._conditional_headers(entry))
+        return await asyncio.to_thread(analyzer._read_response, url, entry, response)
+
+    async def _get_json(self, url: str) -> Any:
+        return (await self._get(url))[0]
+
+    async def fetch_profile(self) -> Dict[str, Any]:
+        """Fetch the user's public GitHub profile data."""
+        data = await self._get_json(self.analyzer._profile_url())
+        self.analyzer.profile = data if isinstance(data, dict) else {}
+        return self.analyzer.profile
+
+    async def _fetch_repo_pages(self, pages: List[int]) -> List[Tuple[Any, Dict[str, str]]]:
+        return list(await asyncio.gather(*(self._get(self.analyzer._repos_page_url(page)) for page in pages)))
+
+    async def fetch_repos(self, public_repos: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Fetch all public repositories, requesting pages concurrently (see GitHubAnalyzer)."""
+        analyzer = self.analyzer
+        page_count = analyzer._known_page_count(public_repos)
+        if page_count is not None:
+            pages = await self._fetch_repo_pages(list(range(1, page_count + 1)))
+        else:
+            first = await self._get(analyzer._repos_page_url(1))
+            pages = [first] + await self._fetch_repo_pages(list(range(2, analyzer._last_page_number(first[1]) + 1)))
+        next_url = pages[-1][1].get('next')
+        while next_url:
+            page = await self._get(next_url)
+            pages.append(page)
+            next_url = page[1].get('next')
+        return analyzer._merge_repo_pages(pages)
+
+    def analyze_all(self, repos: List[Dict[str, Any]]) -> GitHubAnalysis:
+        """Run the three (CPU-only) analyses over already fetched repos; see GitHubAnalyzer.analyze_all."""
+        return self.analyzer.analyze_all(repos)
+
+    async def analyze_user(self) -> Dict[str, Any]:
+        """Fetch profile and repos, then run all three analyses."""
+        profile = await self.fetch_profile()
+        repos = await self.fetch_repos()
+        return {
+            'username': self.username,
+            'profile': profile,
+            'repo_count': len(repos),
+            **self.analyze_all(repos).to_dict(),
+        }
+
+
+async def analyze_many(usernames: Iterable[str], concurrency: int = 8,
+                       api_url: str = GITHUB_API_URL, cache: Optional[HTTPCache] = None,
+                       client: Optional[httpx.AsyncClient] = None,
+                       rate_limiter: Optional[RateLimiter] = None,
+                       token: Optional[str] = None,
+                       scoring_profile: Optional[ScoringProfile] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Analyze many GitHub users concurrently, yielding each result as soon as it is done.
+    At most `concurrency` users are in flight and at most `concurrency` requests are open
+    at once; `usernames` is consumed lazily so arbitrarily long inputs run in bounded memory.
+    Per-user failures are yielded as {'username', 'error'} records (plus the HTTP 'status'
+    when GitHub returned one); RateLimitError stops
+    the batch since every remaining user would fail the same way.
+    """
+    concurrency = max(1, concurrency)
+    owns_client = client is None
+    client = client or create_async_client(concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = rate_limiter or get_shared_rate_limiter()
+
+    async def run(username: str) -> Dict[str, Any]:
+        analyzer = AsyncGitHubAnalyzer(
+            username, client=client, api_url=api_url, max_workers=concurrency, cache=cache,
+            rate_limiter=rate_limiter, token=token, semaphore=semaphore, scoring_profile=scoring_profile
+        )
+        try:
+            return await analyzer.analyze_user()
+        except RateLimitError:
+            raise
+        except Exception as e:
+            record = {'username': username, 'error': str(e)}
+            if getattr(e, 'status', None) is not None:
+                record['status'] = e.status
+            return record
+
+    names = iter(usernames)
+    pending = set()
+    try:
+        while True:
+            for username in names:
+                pending.add(asyncio.ensure_future(run(username)))
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if owns_client:
+            await client.aclose()
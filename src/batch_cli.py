@@ -0,0 +1,238 @@
+# batch_cli.py
+"""
+Command-line entry point for headless batch analysis of GitHub usernames.
+
+Reads a CSV (with a `username` column, or usernames in the first column) or a
+newline-separated list, analyzes users concurrently, and streams one record per
+candidate to JSONL or CSV as each finishes. Progress is checkpointed so an
+interrupted run can be resumed with --resume; users that failed with a transient
+error are retried on resume, so their retried record follows the earlier error.
+
+Usage:
+    python -m src.batch_cli usernames.csv -o results.jsonl --concurrency 8
+    python -m src.batch_cli usernames.csv -o results.jsonl --resume
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+from collections import defaultdict, deque
+from typing import Any, Dict, IO, Iterator, List, Optional, Set, Tuple
+
+from src.async_github_analyzer import analyze_many
+from src.github_analyzer import GITHUB_API_URL
+from src.github_client import RateLimitError
+from src.http_cache import HTTPCache
+from src.scoring_profile import load_profile
+
+USERNAME_COLUMNS = ('username', 'github', 'github_username', 'login')
+CSV_FIELDS = [
+    'username', 'name', 'public_repos', 'repo_count', 'unique_libs', 'libraries',
+    'complex_repos', 'avg_complexity_score', 'documented_repos', 'avg_doc_score', 'error',
+]
+# Client errors that would fail the same way on a retry; anything else is retried on --resume
+PERMANENT_ERROR_STATUSES = (400, 404, 410, 422, 451)
+
+
+def read_usernames(stream: IO[str]) -> Iterator[str]:
+    """Lazily yield usernames from a CSV or newline-separated list."""
+    column = 0
+    for i, row in enumerate(csv.reader(stream)):
+        if i == 0:
+            header = [cell.strip().lower() for cell in row]
+            matches = [header.index(name) for name in USERNAME_COLUMNS if name in header]
+            if matches:
+                column = matches[0]
+                continue
+        if len(row) <= column:
+            continue
+        username = row[column].strip()
+        if username and not username.startswith('#'):
+            yield username
+
+
+def to_csv_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten an analysis record into one CSV row."""
+    if 'error' in record:
+        return {'username': record['username'], 'error': record['error']}
+    profile = record.get('profile', {})
+    complexity = record.get('complexity', {})
+    documentation = record.get('documentation', {})
+    return {
+        'username': record['username'],
+        'name': profile.get('name') or '',
+        'public_repos': profile.get('public_repos', ''),
+        'repo_count': record.get('repo_count', 0),
+        'unique_libs': len(record.get('math_libraries', {})),
+        'libraries': ';'.join(sorted(record.get('math_libraries', {}))),
+        'complex_repos': len(complexity),
+        'avg_complexity_score': round(sum(v['score'] for v in complexity.values()) / max(1, len(complexity)), 3),
+        'documented_repos': len(documentation),
+        'avg_doc_score': round(sum(v['score'] for v in documentation.values()) / max(1, len(documentation)), 3),
+        'error': '',
+    }
+
+
+class Checkpoint:
+    """
+    Resumable progress over an ordered input: every line before `offset` is done, plus
+    the (few) out-of-order completions in `done` past it, minus the lines in `retry` that
+    failed transiently. Completion order is concurrent, so `done` stays bounded by the
+    number of users in flight and `retry` by the number of failures, not by the input size.
+    Records are flushed before the checkpoint is saved, so resuming never loses output;
+    a crash between the two can at worst repeat a record.
+    """
+    def __init__(self, path: str, offset: int = 0, done: Optional[Set[int]] = None,
+                 retry: Optional[Set[int]] = None):
+        self.path = path
+        self.offset = offset
+        self.done = set(done or ())
+        self.retry = set(retry or ())
+
+    @classmethod
+    def load(cls, path: str) -> 'Checkpoint':
+        if not os.path.exists(path):
+            return cls(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return cls(path, state.get('offset', 0), set(state.get('done', [])), set(state.get('retry', [])))
+
+    def is_done(self, index: int) -> bool:
+        return (index < self.offset or index in self.done) and index not in self.retry
+
+    def mark_done(self, index: int, retry: bool = False) -> None:
+        """Record `index` as finished; `retry` keeps it pending for the next resumed run."""
+        if retry:
+            self.retry.add(index)
+        else:
+            self.retry.discard(index)
+        if index >= self.offset:
+            self.done.add(index)
+        while self.offset in self.done:
+            self.done.discard(self.offset)
+            self.offset += 1
+
+    def save(self) -> None:
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'offset': self.offset, 'done': sorted(self.done), 'retry': sorted(self.retry)}, f)
+        os.replace(tmp, self.path)
+
+
+class RecordWriter:
+    """Streams records to JSONL or CSV, flushing after each one."""
+    def __init__(self, stream: IO[str], fmt: str, write_header: bool = True):
+        self.stream = stream
+        self.fmt = fmt
+        self.csv = None
+        if fmt == 'csv':
+            self.csv = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            if write_header:
+                self.csv.writeheader()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        if self.csv is not None:
+            self.csv.writerow(to_csv_row(record))
+        else:
+            self.stream.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.stream.flush()
+
+
+async def run_batch(usernames: Iterator[str], writer: RecordWriter, checkpoint: Optional[Checkpoint] = None,
+                    concurrency: int = 8, **analyzer_options: Any) -> Tuple[int, int]:
+    """
+    Analyze `usernames`, writing each record as it completes and checkpointing progress.
+    Error records are checkpointed for retry unless their status is permanent.
+    Returns (records written, error records).
+    """
+    in_flight: Dict[str, deque] = defaultdict(deque)
+
+    def pending() -> Iterator[str]:
+        for index, username in enumerate(usernames):
+            if checkpoint is not None and checkpoint.is_done(index):
+                continue
+            in_flight[username].append(index)
+            yield username
+
+    written = errors = 0
+    async for record in analyze_many(pending(), concurrency=concurrency, **analyzer_options):
+        writer.write(record)
+        written += 1
+        errors += 'error' in record
+        indices = in_flight[record['username']]
+        index = indices.popleft()
+        if not indices:
+            del in_flight[record['username']]
+        if checkpoint is not None:
+            transient = 'error' in record and record.get('status') not in PERMANENT_ERROR_STATUSES
+            checkpoint.mark_done(index, retry=transient)
+            checkpoint.save()
+    return written, errors
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Batch-analyze GitHub usernames for mathematical talent signals.")
+    parser.add_argument('input', help="CSV or newline-separated file of GitHub usernames ('-' for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="output file (default: stdout)")
+    parser.add_argument('--format', choices=('jsonl', 'csv'), default=None,
+                        help="output format (default: from the output extension, else jsonl)")
+    parser.add_argument('--concurrency', type=int, default=8, help="users analyzed in parallel")
+    parser.add_argument('--resume', action='store_true', help="continue from the checkpoint next to the output file")
+    parser.add_argument('--checkpoint', help="checkpoint path (default: <output>.ckpt)")
+    parser.add_argument('--cache', nargs='?', const='', default=None,
+                        help="cache GitHub responses on disk (optionally at the given path)")
+    parser.add_argument('--profile', help="scoring profile (JSON or YAML) with custom keyword sets")
+    parser.add_argument('--api-url', default=GITHUB_API_URL, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    fmt = args.format or ('csv' if args.output.lower().endswith('.csv') else 'jsonl')
+    to_stdout = args.output == '-'
+    if args.resume and to_stdout:
+        print("--resume requires --output to be a file", file=sys.stderr)
+        return 2
+    checkpoint = None
+    if not to_stdout:
+        checkpoint_path = args.checkpoint or args.output + '.ckpt'
+        checkpoint = Checkpoint.load(checkpoint_path) if args.resume else Checkpoint(checkpoint_path)
+    resuming = args.resume and os.path.exists(args.output) and os.path.getsize(args.output) > 0
+    if resuming and not os.path.exists(checkpoint.path):
+        # Starting over from line 0 would append a duplicate of every record already written
+        print(f"--resume found {args.output} but no checkpoint at {checkpoint.path}; "
+              "pass --checkpoint or run without --resume to overwrite the output", file=sys.stderr)
+        return 2
+    cache = HTTPCache(args.cache or None) if args.cache is not None else None
+    scoring_profile = load_profile(args.profile) if args.profile else None
+
+    in_stream = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8', newline='')
+    out_stream = sys.stdout if to_stdout else open(args.output, 'a' if resuming else 'w', encoding='utf-8', newline='')
+    try:
+        writer = RecordWriter(out_stream, fmt, write_header=not resuming)
+        written, errors = asyncio.run(run_batch(
+            read_usernames(in_stream), writer, checkpoint, concurrency=args.concurrency,
+            api_url=args.api_url, cache=cache, scoring_profile=scoring_profile
+        ))
+    except RateLimitError as e:
+        print(f"Stopped: {e}. Re-run with --resume to continue.", file=sys.stderr)
+        return 3
+    except KeyboardInterrupt:
+        print("Interrupted. Re-run with --resume to continue.", file=sys.stderr)
+        return 130
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+        if cache is not None:
+            cache.close()
+    print(f"Analyzed {written} users ({errors} errors).", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+# candidate_index.py
+"""
+Module providing a persistent full-text index over parsed candidates.
+Resume sections and GitHub repo text are stored in a SQLite FTS5 inverted index
+(term -> positional postings), giving boolean, phrase and BM25-ranked queries with
+incremental add/delete, without re-parsing any resumes.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.disk_cache import default_cache_dir
+
+FIELDS = ('skills', 'education', 'experience', 'repos')
+# BM25 column weights: explicit skills count most, free-form repo text least
+DEFAULT_FIELD_WEIGHTS = {'skills': 3.0, 'education': 1.0, 'experience': 1.5, 'repos': 1.0}
+
+_QUERY_TOKEN = re.compile(r'(-?)(?:(\w+):)?("[^"]*"|\S+)')
+# Characters the index tokenizer keeps; a term without any tokenizes to nothing
+_TOKEN_CHAR = re.compile(r"[\w+#]")
+
+
+def repo_text(repos: Iterable[Mapping[str, Any]]) -> str:
+    """Searchable text for a candidate's GitHub repos: name, description, topics, language."""
+    parts = []
+    for repo in repos:
+        topics = repo.get('topics')
+        parts.append(' '.join(filter(None, [
+            str(repo.get('name') or ''), str(repo.get('description') or ''),
+            ' '.join(map(str, topics)) if isinstance(topics, list) else '', str(repo.get('language') or ''),
+        ])))
+    return '\n'.join(parts)
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def to_fts_query(query: str) -> str:
+    """
+    Translate a search string into an FTS5 expression. Words and "quoted phrases" are
+    ANDed; OR between two items makes them alternatives; a leading '-' excludes an
+    item; 'field:term' restricts a term to one of FIELDS. Terms are always quoted, so
+    user input cannot inject FTS5 syntax.
+    """
+    groups: List[List[str]] = []
+    excluded: List[str] = []
+    pending_or = False
+    for negate, field, term in _QUERY_TOKEN.findall(query):
+        if term == 'OR' and not negate and not field:
+            pending_or = bool(groups)
+            continue
+        term = term[1:-1] if term.startswith('"') and term.endswith('"') and len(term) >= 2 else term
+        if not _TOKEN_CHAR.search(term):  # empty or punctuation only: would match nothing
+            continue
+        if field and field not in FIELDS:
+            raise ValueError(f"Unknown field {field!r}; expected one of {', '.join(FIELDS)}")
+        item = f"{field} : {_quote(term)}" if field else _quote(term)
+        if negate:
+            excluded.append(item)
+        elif pending_or:
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+        pending_or = False
+    if not groups:
+        raise ValueError("Query needs at least one term to match")
+    expression = ' AND '.join(group[0] if len(group) == 1 else '(' + ' OR '.join(group) + ')' for group in groups)
+    for item in excluded:
+        expression = f"({expression}) NOT {item}"
+    return expression
+
+
+class CandidateIndex:
+    """
+    Persistent inverted index of candidates, keyed by candidate id.
+    `add` replaces a candidate's entry, so re-indexing an updated resume is safe.
+    Safe to share between threads of one process.
+    """
+    def __init__(self, path: Optional[str] = None, field_weights: Optional[Mapping[str, float]] = None):
+        self.path = path or os.path.join(default_cache_dir(), 'candidates.sqlite')
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        weights = {**DEFAULT_FIELD_WEIGHTS, **(field_weights or {})}
+        self._bm25 = f"bm25(candidate_text, {', '.join(str(float(weights[f])) for f in FIELDS)})"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            " id INTEGER PRIMARY KEY, candidate TEXT UNIQUE NOT NULL, updated_at REAL NOT NULL)"
+        )
+        try:
+            # '+' and '#' are kept inside tokens so 'c++' and 'c#' stay searchable
+            self._conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS candidate_text USING fts5({', '.join(FIELDS)},"
+                " tokenize=\"unicode61 tokenchars '+#'\")"
+            )
+        except sqlite3.OperationalError as e:
+            raise RuntimeError("CandidateIndex requires SQLite built with FTS5") from e
+        self._conn.commit()
+
+    def _upsert(self, candidate_id: str, fields: Mapping[str, str]) -> None:
+        """Replace one candidate's row (lock held, caller commits)."""
+        row = self._conn.execute("SELECT id FROM candidates WHERE candidate = ?", (candidate_id,)).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM candidate_text WHERE rowid = ?", (row[0],))
+            self._conn.execute("UPDATE candidates SET updated_at = ? WHERE id = ?", (time.time(), row[0]))
+            rowid = row[0]
+        else:
+            rowid = self._conn.execute(
+                "INSERT INTO candidates (candidate, updated_at) VALUES (?, ?)", (candidate_id, time.time())
+            ).lastrowid
+        self._conn.execute(
+            f"INSERT INTO candidate_text (rowid, {', '.join(FIELDS)}) VALUES (?, ?, ?, ?, ?)",
+            (rowid, *(fields.get(f, '') for f in FIELDS))
+        )
+
+    @staticmethod
+    def _fields(resume: Optional[Mapping[str, Any]], repos: Optional[Iterable[Mapping[str, Any]]]) -> Dict[str, str]:
+        resume = resume or {}
+        return {
+            'skills': '\n'.join(resume.get('skills', [])),
+            'education': '\n'.join(resume.get('education', [])),
+            'experience': '\n'.join(resume.get('experience', [])),
+            'repos': repo_text(repos or []),
+        }
+
+    def add(self, candidate_id: str, resume: Optional[Mapping[str, Any]] = None,
+            repos: Optional[Iterable[Mapping[str, Any]]] = None) -> None:
+        """Index (or re-index) a candidate from a parsed resume and/or their GitHub repos."""
+        self.add_many([(candidate_id, resume, repos)])
+
+    def add_many(self, candidates: Iterable[Tuple[str, Optional[Mapping[str, Any]],
+                                                  Optional[Iterable[Mapping[str, Any]]]]]) -> int:
+        """Index many (candidate_id, resume, repos) entries in one transaction; returns the count."""
+        count = 0
+        with self._lock:
+            for candidate_id, resume, repos in candidates:
+                self._upsert(candidate_id, self._fields(resume, repos))
+                count += 1
+            self._conn.commit()
+        return count
+
+    def delete(self, candidate_id: str) -> bool:
+        """Remove a candidate; returns False if it was not indexed."""
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM candidates WHERE candidate = ?", (candidate_id,)).fetchone()
+            if not row:
+                return False
+            self._conn.execute("DELETE FROM candidate_text WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM candidates WHERE id = ?", (row[0],))
+            self._conn.commit()
+        return True
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[Tuple[str, float]]:
+        """
+        Return (candidate_id, relevance) for the best BM25 matches of `query` (see
+        to_fts_query for the syntax), most relevant first. `limit=None` returns all.
+        """
+        sql = (
+            f"SELECT c.candidate, -{self._bm25} FROM candidate_text"
+            " JOIN candidates c ON c.id = candidate_text.rowid"
+            f" WHERE candidate_text MATCH ? ORDER BY {self._bm25}"
+        )
+        params: Tuple[Any, ...] = (to_fts_query(query),)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            return [(candidate, score) for candidate, score in self._conn.execute(sql, params)]
+
+    def match(self, query: str) -> List[str]:
+        """Return every candidate matching `query` as a boolean filter (unranked, by id)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT c.candidate FROM candidate_text JOIN candidates c ON c.id = candidate_text.rowid"
+                " WHERE candidate_text MATCH ? ORDER BY c.candidate", (to_fts_query(query),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def optimize(self) -> None:
+        """Merge index segments after large bulk loads for faster queries."""
+        with self._lock:
+            self._conn.execute("INSERT INTO candidate_text (candidate_text) VALUES ('optimize')")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def __contains__(self, candidate_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM candidates WHERE candidate = ?", (candidate_id,)
+            ).fetchone() is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
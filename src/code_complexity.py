@@ -0,0 +1,298 @@
+# code_complexity.py
+"""
+Module for code-level complexity analysis of a candidate's Python repositories with radon:
+cyclomatic complexity, maintainability index and Halstead metrics. Results are memoized
+per git blob SHA. A repo's file list comes from the git trees API, so after a push only
+the changed blobs are downloaded and analyzed; a repo seen for the first time (or with
+many changes) is streamed from its archive instead (see source_scanner). Analysis runs
+in a process pool.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.disk_cache import DiskCache, default_cache_dir
+from src.github_analyzer import GitHubAnalyzer
+from src.source_scanner import (
+    DEFAULT_MAX_FILE_BYTES, DEFAULT_MAX_TOTAL_BYTES, SCANNED_LANGUAGES,
+    BatchPool, SourceArchive, head_sha, is_source, map_repos, repo_full_name,
+)
+
+try:
+    from radon.complexity import cc_rank, cc_visit
+    from radon.metrics import h_visit, mi_visit
+    from radon.raw import analyze as raw_metrics
+    from radon.visitors import Function
+except ImportError:  # optional: only needed for code-level analysis
+    cc_visit = None
+
+# Bump when the metrics change so memoized file results are not reused
+METRICS_VERSION = 1
+# Changed files fetched one by one as blobs; more than this streams the archive instead
+DEFAULT_MAX_BLOB_REQUESTS = 16
+
+
+class CodeMetrics(NamedTuple):
+    """Complexity metrics for one file, or aggregated over a repo or candidate."""
+    files: int
+    sloc: int                  # source lines of code
+    functions: int             # functions and methods
+    complexity_total: int      # summed cyclomatic complexity of the functions
+    max_complexity: int
+    maintainability: float     # maintainability index (0-100), weighted by sloc
+    halstead_volume: float
+    halstead_effort: float
+    halstead_bugs: float       # Halstead's estimate of delivered bugs
+
+    @property
+    def avg_complexity(self) -> float:
+        return self.complexity_total / self.functions if self.functions else 0.0
+
+    @property
+    def rank(self) -> str:
+        """radon's A (simple) to F (very complex) grade for the average function."""
+        return cc_rank(self.avg_complexity) if cc_visit is not None else ''
+
+
+EMPTY_METRICS = CodeMetrics(0, 0, 0, 0, 0, 0.0, 0.0, 0.0, 0.0)
+
+
+def combine(metrics: Iterable[CodeMetrics]) -> CodeMetrics:
+    """Aggregate file (or repo) metrics; the maintainability index is averaged by sloc."""
+    metrics = list(metrics)
+    sloc = sum(m.sloc for m in metrics)
+    return CodeMetrics(
+        files=sum(m.files for m in metrics),
+        sloc=sloc,
+        functions=sum(m.functions for m in metrics),
+        complexity_total=sum(m.complexity_total for m in metrics),
+        max_complexity=max((m.max_complexity for m in metrics), default=0),
+        maintainability=sum(m.maintainability * m.sloc for m in metrics) / sloc if sloc else 0.0,
+        halstead_volume=sum(m.halstead_volume for m in metrics),
+        halstead_effort=sum(m.halstead_effort for m in metrics),
+        halstead_bugs=sum(m.halstead_bugs for m in metrics),
+    )
+
+
+def source_metrics(source: str) -> Optional[CodeMetrics]:
+    """Metrics for one Python source file; None if it does not parse (or is too deeply nested to)."""
+    try:
+        functions = [block for block in cc_visit(source) if isinstance(block, Function)]
+        halstead = h_visit(source).total
+        sloc = raw_metrics(source).sloc
+        maintainability = mi_visit(source, True)
+    except (SyntaxError, ValueError, TypeError, RecursionError, MemoryError):
+        return None
+    return CodeMetrics(
+        files=1,
+        sloc=sloc,
+        functions=len(functions),
+        complexity_total=sum(f.complexity for f in functions),
+        max_complexity=max((f.complexity for f in functions), default=0),
+        maintainability=float(maintainability),
+        halstead_volume=float(halstead.volume),
+        halstead_effort=float(halstead.effort),
+        halstead_bugs=float(halstead.bugs),
+    )
+
+
+def analyze_blobs(blobs: List[Tuple[str, bytes]]) -> List[Tuple[str, Optional[List[float]]]]:
+    """(blob SHA, metrics as a list) per (blob SHA, content) pair; runs in worker processes."""
+    results = []
+    for blob_sha, data in blobs:
+        metrics = source_metrics(data.decode('utf-8', errors='replace'))
+        results.append((blob_sha, list(metrics) if metrics is not None else None))
+    return results
+
+
+def blob_sha(data: bytes) -> str:
+    """The git blob SHA of `data` (as listed in git trees), computed locally."""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class RepoComplexity(NamedTuple):
+    repository: str
+    sha: Optional[str]       # analyzed commit; None if the repo has no commits
+    metrics: CodeMetrics
+    truncated: bool          # the byte budget stopped the scan early
+
+
+class CodeComplexityAnalyzer:
+    """
+    Runs radon over the Python files of a user's repos (Python and Jupyter repos only),
+    reusing `analyzer`'s session, token and rate-limit budget. A repo whose head commit
+    was analyzed before costs one conditional request. Otherwise its tree is listed and
+    only files with unseen blob SHAs are analyzed, in `workers` processes: up to
+    `max_blob_requests` of them are fetched as blobs, while a repo with nothing analyzed
+    yet or more changes than that streams its archive. Raises ImportError if radon is
+    not installed.
+    """
+    def __init__(self, analyzer: GitHubAnalyzer, cache: Optional[DiskCache] = None, workers: int = 2,
+                 max_file_bytes: int = DEFAULT_MAX_FILE_BYTES, max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+                 max_blob_requests: int = DEFAULT_MAX_BLOB_REQUESTS):
+        if cc_visit is None:
+            raise ImportError("radon is required for code complexity analysis (pip install radon)")
+        self.analyzer = analyzer
+        self._owns_cache = cache is None
+        self.cache = cache if cache is not None else DiskCache(os.path.join(default_cache_dir(), 'complexity.sqlite'))
+        self.pool = BatchPool(workers)
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.max_blob_requests = max_blob_requests
+        self.blobs_fetched = 0
+        self.files_analyzed = 0
+        self.files_reused = 0
+        self.failed: Dict[str, str] = {}  # repos that could not be analyzed: {name: error}
+
+    def _repo_key(self, sha: str) -> str:
+        return f"repo:v{METRICS_VERSION}:{sha}:{self.max_file_bytes}:{self.max_total_bytes}"
+
+    @staticmethod
+    def _blob_key(sha: str) -> str:
+        return f"blob:v{METRICS_VERSION}:{sha}"
+
+    def _analyze_new(self, blobs: Iterable[Tuple[str, bytes]], copies: Dict[str, int]) -> List[CodeMetrics]:
+        """Analyze (blob SHA, content) pairs, memoizing each; `copies` counts the files per blob."""
+        metrics: List[CodeMetrics] = []
+        for results in self.pool.map_batches(analyze_blobs, blobs):
+            for digest, values in results:
+                self.files_analyzed += 1
+                # Unparsable files are memoized as [] so they are not retried
+                self.cache.set(self._blob_key(digest), values or [])
+                if values:
+                    metrics.extend([CodeMetrics(*values)] * copies[digest])
+        return metrics
+
+    def _analyze_archive(self, full_name: str, sha: str) -> Tuple[CodeMetrics, bool]:
+        """Stream the archive at `sha`, analyzing files whose blob SHA is not memoized yet."""
+        archive = SourceArchive(self.analyzer, full_name, sha, self.max_file_bytes, self.max_total_bytes,
+                                extensions=('.py',))
+        metrics: List[CodeMetrics] = []
+        copies: Dict[str, int] = {}  # unseen blob SHA -> files with that content
+
+        def unseen() -> Iterator[Tuple[str, bytes]]:
+            for _, data in archive:
+                digest = blob_sha(data)
+                if digest in copies:
+                    copies[digest] += 1
+                    continue
+                memo = self.cache.get(self._blob_key(digest))
+                if memo is None:
+                    copies[digest] = 1
+                    yield digest, data
+                else:
+                    self.files_reused += 1
+                    if memo:
+                        metrics.append(CodeMetrics(*memo))
+
+        metrics.extend(self._analyze_new(unseen(), copies))
+        return combine(metrics), archive.truncated
+
+    def _tree_files(self, full_name: str, sha: str) -> Optional[Tuple[List[str], bool]]:
+        """
+        Blob SHAs of the Python files in the tree at `sha` (within the same limits as the
+        archive) and whether the byte budget cut the list short; None if the tree is
+        unavailable or too large for GitHub to list in full.
+        """
+        tree = self.analyzer._get_json(f"{self.analyzer.api_url}/repos/{full_name}/git/trees/{sha}?recursive=1")
+        if not isinstance(tree, dict) or tree.get('truncated') or not isinstance(tree.get('tree'), list):
+            return None
+        digests: List[str] = []
+        total = 0
+        for entry in tree['tree']:
+            if entry.get('type') != 'blob':
+                continue
+            size = entry.get('size') or 0
+            total += size
+            if total > self.max_total_bytes:
+                return digests, True
+            if size <= self.max_file_bytes and is_source(entry.get('path', ''), ('.py',), in_archive=False):
+                digests.append(entry['sha'])
+        return digests, False
+
+    def _fetch_blob(self, full_name: str, digest: str) -> Optional[bytes]:
+        payload = self.analyzer._get_json(f"{self.analyzer.api_url}/repos/{full_name}/git/blobs/{digest}")
+        if not isinstance(payload, dict) or payload.get('encoding') != 'base64':
+            return None
+        try:
+            return base64.b64decode(payload.get('content') or '')
+        except (binascii.Error, ValueError):
+            return None
+
+    def _analyze_tree(self, full_name: str, sha: str) -> Optional[Tuple[CodeMetrics, bool]]:
+        """
+        Analyze the repo at `sha` from its tree listing, downloading only unseen blobs;
+        None when the tree is unavailable or the changes are better streamed from the archive.
+        """
+        listing = self._tree_files(full_name, sha)
+        if listing is None:
+            return None
+        digests, truncated = listing
+        copies = Counter(digests)
+        unseen = []
+        known: List[Tuple[int, list]] = []
+        for digest, count in copies.items():
+            memo = self.cache.get(self._blob_key(digest))
+            if memo is None:
+                unseen.append(digest)
+            else:
+                known.append((count, memo))
+        if unseen and (len(unseen) > self.max_blob_requests or len(unseen) == len(copies)):
+            return None
+        metrics: List[CodeMetrics] = []
+        for count, memo in known:
+            self.files_reused += count
+            if memo:
+                metrics.extend([CodeMetrics(*memo)] * count)
+
+        def fetched() -> Iterator[Tuple[str, bytes]]:
+            for digest in unseen:
+                data = self._fetch_blob(full_name, digest)
+                self.blobs_fetched += 1
+                if data is not None:
+                    yield digest, data
+
+        metrics.extend(self._analyze_new(fetched(), copies))
+        return combine(metrics), truncated
+
+    def analyze_repo(self, repo: Dict[str, Any]) -> RepoComplexity:
+        """Metrics for `repo` at its default-branch head."""
+        name = repo.get('name', '')
+        sha = head_sha(self.analyzer, repo)
+        if sha is None:
+            return RepoComplexity(name, None, EMPTY_METRICS, False)
+        cached = self.cache.get(self._repo_key(sha))
+        if cached is not None:
+            return RepoComplexity(name, sha, CodeMetrics(*cached['metrics']), cached['truncated'])
+        full_name = repo_full_name(self.analyzer, repo)
+        metrics, truncated = self._analyze_tree(full_name, sha) or self._analyze_archive(full_name, sha)
+        self.cache.set(self._repo_key(sha), {'metrics': list(metrics), 'truncated': truncated})
+        return RepoComplexity(name, sha, metrics, truncated)
+
+    def analyze(self, repos: List[Dict[str, Any]]) -> Dict[str, RepoComplexity]:
+        """
+        Analyze the Python/Jupyter repos among `repos` concurrently; returns {repo name: RepoComplexity}.
+        Repos that cannot be analyzed are left out and recorded in `failed`.
+        """
+        targets = [repo for repo in repos if repo.get('language') in SCANNED_LANGUAGES and repo.get('size', 1)]
+        results = map_repos(self.analyze_repo, targets, self.analyzer.max_workers, self.failed)
+        return {result.repository: result for result in results if result is not None}
+
+    def analyze_candidate(self, repos: List[Dict[str, Any]]) -> CodeMetrics:
+        """Metrics aggregated over all of a candidate's analyzed repos."""
+        return combine(result.metrics for result in self.analyze(repos).values())
+
+    def close(self) -> None:
+        self.pool.close()
+        if self._owns_cache:
+            self.cache.close()
+
+    def __enter__(self) -> 'CodeComplexityAnalyzer':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,153 @@
+# disk_cache.py
+"""
+Module providing a persistent, size-bounded key/value cache backed by SQLite.
+Values are stored as JSON; least-recently-used entries are evicted once the cache
+grows past its byte budget. Hit/miss counters are kept for monitoring.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    """Return the directory for persistent caches (override with MTA_CACHE_DIR)."""
+    return os.environ.get(
+        'MTA_CACHE_DIR',
+        os.path.join(os.path.expanduser('~'), '.cache', 'math-talent-analyzer')
+    )
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    stored_at: float
+
+
+class DiskCache:
+    """
+    SQLite-backed JSON cache with LRU eviction by total stored size.
+    Safe to share between threads of one process.
+    """
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL with relaxed syncing keeps per-lookup access-time updates cheap
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the stored entry for `key` (value and store time), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return CacheEntry(json.loads(row[0]), row[1])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default`."""
+        entry = self.get_entry(key)
+        return default if entry is None else entry.value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, evicting old entries if over budget."""
+        payload = json.dumps(value, separators=(',', ':'))
+        size = len(payload.encode('utf-8')) + len(key)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now)
+            )
+            self._size += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly stored (e.g. after successful revalidation)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size -= row[0]
+                self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._size = 0
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits its budget (lock held)."""
+        while self._size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                break
+            for key, size in rows:
+                if self._size <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size -= size
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and current footprint."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self),
+            'size_bytes': self.size_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
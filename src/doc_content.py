@@ -0,0 +1,206 @@
+# doc_content.py
+"""
+Module for the optional documentation content stage: fetches each repo's README and
+docs/ index concurrently and scans them for documentation keywords, equations (LaTeX
+or math blocks) and references (DOIs, arXiv ids, citations). Scans are cached by blob
+SHA, so re-analyzing a candidate whose docs have not changed costs almost nothing.
+"""
+
+import base64
+import binascii
+import os
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.disk_cache import DiskCache, default_cache_dir
+from src.github_analyzer import GitHubAnalyzer
+from src.github_client import GitHubAPIError
+from src.github_graphql import docs_index
+from src.source_scanner import map_repos, repo_full_name
+
+# Bump when the scan changes so cached results are not reused
+SCAN_VERSION = 1
+DEFAULT_MAX_CHARS = 200_000  # text scanned per document
+
+_EQUATION = re.compile(
+    r'\$\$.+?\$\$'                                                   # display math
+    r'|\\begin\{(?:equation|align|gather|multline|eqnarray)\*?\}'   # LaTeX environments
+    r'|```math'                                                      # GitHub math blocks
+    r'|\\\[.+?\\\]|\\\(.+?\\\)'                                      # \[ \] and \( \)
+    r'|(?<![\w$\\])\$(?=\S)[^$\n]*?[\\^_][^$\n]*?(?<=\S)\$(?!\w)',   # inline $...$ with TeX syntax
+    re.DOTALL
+)
+_REFERENCE = re.compile(
+    r'\bdoi\.org/[^\s)\]>]+|\bdoi:\s*10\.\d{4,}/[^\s)\]>]+'
+    r'|\barxiv\.org/(?:abs|pdf)/[\w./-]+|\barxiv:\s*\d{4}\.\d{4,5}'
+    r'|\\cite[pt]?\{[^}]*\}',
+    re.IGNORECASE
+)
+
+
+def count_equations(text: str) -> int:
+    return len(_EQUATION.findall(text))
+
+
+def count_references(text: str) -> int:
+    """Distinct DOIs, arXiv ids and \\cite commands."""
+    return len({match.lower().rstrip('.,;') for match in _REFERENCE.findall(text)})
+
+
+def decode_content(payload: Any) -> Optional[str]:
+    """Text of a contents/blob API payload (base64-encoded), or None."""
+    if not isinstance(payload, dict) or not isinstance(payload.get('content'), str):
+        return None
+    if payload.get('encoding') not in ('base64', None):
+        return None
+    try:
+        return base64.b64decode(payload['content']).decode('utf-8', errors='replace')
+    except (binascii.Error, ValueError):
+        return None
+
+
+class DocContent(NamedTuple):
+    repository: str
+    has_readme: bool
+    readme_sha: Optional[str]
+    docs_index: Optional[str]      # path of the docs/ index file, if any
+    keywords: Tuple[str, ...]      # documentation keywords found in the content
+    equations: int
+    references: int
+
+    def as_signals(self) -> Dict[str, Any]:
+        """The form stored on a repo as 'doc_content' (read by documentation scoring)."""
+        return {'keywords': list(self.keywords), 'docs_index': self.docs_index,
+                'equations': self.equations, 'references': self.references}
+
+
+class DocContentFetcher:
+    """
+    Fetches and scans README and docs/ index content for `analyzer`'s repos with at most
+    `max_workers` requests in flight, through the analyzer's session and HTTP cache
+    (so unchanged documents are revalidated with conditional requests). Repos fetched
+    through GraphQL already carry their README and docs index blob SHAs; if those scans
+    are cached, the repo needs no request at all. Keywords come from the analyzer's
+    scoring profile.
+    """
+    def __init__(self, analyzer: GitHubAnalyzer, cache: Optional[DiskCache] = None, max_workers: int = 8,
+                 max_chars: int = DEFAULT_MAX_CHARS):
+        self.analyzer = analyzer
+        self._owns_cache = cache is None
+        self.cache = cache if cache is not None else DiskCache(os.path.join(default_cache_dir(), 'doc_content.sqlite'))
+        self.max_workers = max(1, max_workers)
+        self.max_chars = max_chars
+        self.failed: Dict[str, str] = {}  # repos whose documents could not be fetched: {name: error}
+
+    def _cache_key(self, sha: str) -> str:
+        # Keywords depend on the profile's keyword set, so its digest is part of the key
+        return f"doc:v{SCAN_VERSION}:{self.analyzer.scoring.digest[:16]}:{self.max_chars}:{sha}"
+
+    def scan_text(self, text: str) -> Dict[str, Any]:
+        """Keywords, equation and reference counts for one document."""
+        text = text[:self.max_chars]
+        return {
+            'keywords': self.analyzer.scoring.doc_matcher.find(text.lower()),
+            'equations': count_equations(text),
+            'references': count_references(text),
+        }
+
+    def _scan_document(self, base: str, sha: Optional[str],
+                       path: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        (blob SHA, scan) for a document: from the cache when its SHA is known, else
+        fetched from its blob (or, with no SHA yet, its `path` under `base`) and scanned.
+        The scan is None if the document does not exist.
+        """
+        if sha:
+            cached = self.cache.get(self._cache_key(sha))
+            if cached is not None:
+                return sha, cached
+        payload = self.analyzer._get_json(f"{base}/git/blobs/{sha}" if sha else f"{base}/{path}")
+        sha = sha or (payload.get('sha') if isinstance(payload, dict) else None)
+        if sha:
+            cached = self.cache.get(self._cache_key(sha))
+            if cached is not None:
+                return sha, cached
+        text = decode_content(payload)
+        if text is None:
+            return sha, None
+        result = self.scan_text(text)
+        if sha:
+            self.cache.set(self._cache_key(sha), result)
+        return sha, result
+
+    def _docs_index(self, repo: Dict[str, Any], base: str) -> Tuple[Optional[str], Optional[str]]:
+        if 'docs_index_path' in repo:  # known from the GraphQL fetch
+            return repo['docs_index_path'], repo.get('docs_index_sha')
+        listing = self.analyzer._get_json(f"{base}/contents/docs")
+        return docs_index(listing) if isinstance(listing, list) else (None, None)
+
+    def fetch_repo(self, repo: Dict[str, Any]) -> DocContent:
+        """Fetch and scan one repo's README and docs/ index."""
+        name = repo.get('name', '')
+        base = f"{self.analyzer.api_url}/repos/{repo_full_name(self.analyzer, repo)}"
+        scans = []
+        readme_sha, readme = repo.get('readme_sha'), None
+        if repo.get('has_readme', True):  # GraphQL fetches record absent READMEs as False
+            readme_sha, readme = self._scan_document(base, readme_sha, 'readme')
+            if readme is not None:
+                scans.append(readme)
+        docs_path, docs_sha = self._docs_index(repo, base)
+        if docs_path:
+            _, docs = self._scan_document(base, docs_sha, f"contents/{docs_path}")
+            if docs is not None:
+                scans.append(docs)
+            else:
+                docs_path = None
+        keywords = list(dict.fromkeys(kw for scan in scans for kw in scan['keywords']))
+        return DocContent(
+            repository=name,
+            has_readme=readme is not None,
+            readme_sha=readme_sha if readme is not None else None,
+            docs_index=docs_path,
+            keywords=tuple(keywords),
+            equations=sum(scan['equations'] for scan in scans),
+            references=sum(scan['references'] for scan in scans),
+        )
+
+    def fetch(self, repos: List[Dict[str, Any]]) -> Dict[str, DocContent]:
+        """
+        Fetch all repos' documentation concurrently; returns {repo name: DocContent}.
+        A repo whose documents cannot be fetched or decoded gets an empty DocContent
+        and is recorded in `failed`.
+        """
+        results = map_repos(self.fetch_repo, repos, self.max_workers, self.failed,
+                            errors=(GitHubAPIError, ValueError))
+        contents = {}
+        for repo, result in zip(repos, results):
+            name = repo.get('name', '')
+            contents[name] = result or DocContent(name, False, None, None, (), 0, 0)
+        return contents
+
+    def annotate(self, repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return copies of `repos` with a 'doc_content' entry, which documentation scoring
+        uses for extra keywords, docs/, equation and reference points. `has_readme` is
+        set when a README was found.
+        """
+        contents = self.fetch(repos)
+        annotated = []
+        for repo in repos:
+            content = contents.get(repo.get('name', ''))
+            if content is None:
+                annotated.append(repo)
+            else:
+                annotated.append({**repo, 'has_readme': repo.get('has_readme') or content.has_readme,
+                                  'doc_content': content.as_signals()})
+        return annotated
+
+    def close(self) -> None:
+        if self._owns_cache:
+            self.cache.close()
+
+    def __enter__(self) -> 'DocContentFetcher':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,98 @@
+# document_readers.py
+"""
+Module for detecting resume file formats from their content and reading DOCX and
+plain-text resumes. PDF and DOCX are sniffed from magic bytes rather than extensions;
+plain text has no magic bytes, so it also needs a text extension. DOCX text is
+streamed straight from the paragraph XML without rendering the document.
+"""
+
+import mmap
+import os
+import re
+import zipfile
+from typing import Iterator, Optional
+from xml.etree.ElementTree import iterparse
+
+PDF = 'pdf'
+DOCX = 'docx'
+TEXT = 'text'
+
+TEXT_EXTENSIONS = ('.txt', '.text', '.md')
+
+_SNIFF_BYTES = 4096
+_UTF8_BOM = b'\xef\xbb\xbf'
+_UTF16_BOMS = (b'\xff\xfe', b'\xfe\xff')
+_NON_ASCII_DECODED = re.compile('[^\x00-\x7f\ufffd]')
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_DOCX_BODY = 'word/document.xml'
+
+
+class UnsupportedFormatError(ValueError):
+    """Raised for files that are not PDF, DOCX or plain text."""
+
+
+def sniff_format(path: str) -> Optional[str]:
+    """Return PDF, DOCX or TEXT for a readable resume file, or None for anything else."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError:
+        return None
+    # Some generators put junk before the header; PDF readers accept it in the first 1 KB
+    if b'%PDF-' in head[:1024]:
+        return PDF
+    if head.startswith(b'PK\x03\x04'):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                archive.getinfo(_DOCX_BODY)
+        except (KeyError, zipfile.BadZipFile, OSError):
+            return None
+        return DOCX
+    if not head or not path.lower().endswith(TEXT_EXTENSIONS):
+        return None
+    # UTF-16 text is full of NULs, so only its BOM tells it apart from binary junk
+    if head.startswith(_UTF16_BOMS) or b'\x00' not in head:
+        return TEXT
+    return None
+
+
+def decode_text(data: bytes) -> str:
+    """Decode a text resume: UTF-8/UTF-16 by BOM, else UTF-8, else a Windows-1252/Latin-1 export."""
+    if data.startswith(_UTF8_BOM):
+        return str(data[3:], 'utf-8', errors='replace')
+    if data.startswith(_UTF16_BOMS):
+        return str(data, 'utf-16', errors='replace')
+    text = str(data, 'utf-8', errors='replace')
+    # No valid multi-byte sequence at all means a single-byte encoding, not a few corrupt bytes
+    if '\ufffd' in text and not _NON_ASCII_DECODED.search(text):
+        try:
+            return str(data, 'cp1252')
+        except UnicodeDecodeError:
+            return str(data, 'latin-1')
+    return text
+
+
+def iter_docx_paragraphs(path: str) -> Iterator[str]:
+    """Yield each paragraph of a DOCX file as a line of text (with trailing newline)."""
+    with zipfile.ZipFile(path) as archive, archive.open(_DOCX_BODY) as xml:
+        parts = []
+        for event, element in iterparse(xml, events=('end',)):
+            tag = element.tag
+            if tag == _WORD_NS + 't':
+                parts.append(element.text or '')
+            elif tag == _WORD_NS + 'tab':
+                parts.append('\t')
+            elif tag in (_WORD_NS + 'br', _WORD_NS + 'cr'):
+                parts.append('\n')
+            elif tag == _WORD_NS + 'p':
+                yield ''.join(parts) + '\n'
+                parts = []
+                element.clear()
+
+
+def read_text_file(path: str) -> str:
+    """Read a text resume through a memory map and decode it with decode_text."""
+    if os.path.getsize(path) == 0:
+        return ''
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return decode_text(data[:])
@@ -0,0 +1,83 @@
+# extraction_cache.py
+"""
+Module for caching extracted resume text and parsed fields across runs.
+Entries are keyed by a hash of the file content, so renamed or copied files still hit;
+a (path, size, mtime) index avoids re-hashing files that have not changed.
+"""
+
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from src.disk_cache import DiskCache, DEFAULT_MAX_BYTES, default_cache_dir
+
+# Bump when extraction or parsing changes so stale results are not reused
+PARSER_VERSION = 1
+_HASH_BLOCK = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Size-bounded persistent cache of parsed resume records (including raw text).
+    Keeps its own hit/miss counters for a per-run hit-rate report.
+    """
+    def __init__(self, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.store = DiskCache(path or os.path.join(default_cache_dir(), 'extraction.sqlite'), max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, path: str) -> str:
+        """Return the content key for `path`, hashing the file only if it changed."""
+        stat = os.stat(path)
+        stat_key = f"stat:{os.path.abspath(path)}"
+        known = self.store.get(stat_key)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            sha = known[2]
+        else:
+            sha = file_sha256(path)
+            self.store.set(stat_key, [stat.st_size, stat.st_mtime_ns, sha])
+        return f"content:v{PARSER_VERSION}:{sha}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record for a content key, or None."""
+        record = self.store.get(key)
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        """Cache a parsed record; the file-specific 'filename' is not stored."""
+        self.store.set(key, {k: v for k, v in record.items() if k != 'filename'})
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.store),
+            'size_bytes': self.store.size_bytes,
+            'evictions': self.store.evictions,
+        }
+
+    def report(self) -> str:
+        """One-line summary of this run's cache effectiveness."""
+        stats = self.stats()
+        return (
+            f"Extraction cache: {stats['hits']}/{stats['hits'] + stats['misses']} hits "
+            f"({stats['hit_rate']:.1%}), {stats['size_bytes'] / 1e6:.1f} MB in {stats['entries']} entries, "
+            f"{stats['evictions']} evicted"
+        )
+
+    def close(self) -> None:
+        self.store.close()
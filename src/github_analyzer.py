@@ -8,36 +8,284 @@ Module for analyzing GitHub repositories for mathematical sophistication using c
 """
 
 
+import math
+import re
+import time
 import requests
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.github_client import (
+    GitHubAPIError, RateLimitError, RateLimiter, DEFAULT_MAX_RETRIES,
+    backoff_delay, decode_json, default_token, get_shared_rate_limiter,
+    get_shared_session, parse_links, rate_limit_reset, request_headers,
+)
+from src.http_cache import HTTPCache
+from src.scoring_profile import (  # keyword sets re-exported for existing importers
+    COMPLEXITY_KEYWORDS, DEFAULT_COMPLEXITY_THRESHOLDS, DEFAULT_PROFILE, DOC_KEYWORDS, MATH_LIBRARIES,
+    CompiledProfile, ScoringProfile, compile_profile,
+)
+
+GITHUB_API_URL = "https://api.github.com"
+REPOS_PER_PAGE = 100  # GitHub's maximum page size for /users/{user}/repos
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-z0-9 ]')
+_PAGE_PARAM = re.compile(r'[?&]page=(\d+)')
+
 
 class GitHubAnalyzer:
     """
     Analyze GitHub profiles and repositories for mathematical and technical sophistication.
+    HTTP requests go through a shared pooled session and rate-limit budget unless
+    `session`/`rate_limiter` are given. Fetch methods raise `RateLimitError` when the
+    budget is exhausted and `GitHubAPIError` on persistent failures; missing users
+    yield empty results. Keyword sets and documentation points come from
+    `scoring_profile` (the default profile unless given).
     """
-    def __init__(self, username: str):
+    def __init__(self, username: str, api_url: str = GITHUB_API_URL, max_workers: int = 8,
+                 cache: Optional[HTTPCache] = None, session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[RateLimiter] = None, token: Optional[str] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 scoring_profile: Optional[ScoringProfile] = None):
         self.username = username
+        self.api_url = api_url.rstrip('/')
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.session = session or get_shared_session()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.token = token if token is not None else default_token()
+        self.max_retries = max_retries
+        self.profile: Dict[str, Any] = {}
+        self.scoring: CompiledProfile = compile_profile(scoring_profile or DEFAULT_PROFILE)
+
+    def _retry_wait(self, url: str, attempt: int, response: Any = None,
+                    error: Optional[Exception] = None) -> Optional[float]:
+        """
+        Decide what to do after a request attempt: return seconds to wait before retrying,
+        or None to accept `response`. Raises once retries are exhausted or the rate-limit
+        reset is too far away.
+        """
+        can_retry = attempt < self.max_retries
+        if error is not None:
+            if can_retry:
+                return backoff_delay(attempt)
+            raise GitHubAPIError(f"Request to {url} failed: {error}", url=url) from error
+        self.rate_limiter.update(response.headers)
+        reset_at = rate_limit_reset(response.status_code, response.headers)
+        if reset_at is not None:
+            wait = max(0.0, reset_at - time.time())
+            if can_retry and wait <= self.rate_limiter.max_wait:
+                return wait
+            raise RateLimitError(reset_at, url)
+        if response.status_code >= 500 and can_retry:
+            return backoff_delay(attempt)
+        return None
+
+    def _request(self, url: str, headers: Dict[str, str], stream: bool = False,
+                 payload: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        GET `url` (or POST `payload` as JSON) through the shared session, pacing against
+        the rate-limit budget and retrying transient failures with jittered exponential
+        backoff. With `stream`, the body is left unread for the caller to consume (and close).
+        """
+        headers = {**request_headers(self.token), **headers}
+        resource = 'core' if payload is None else 'graphql'  # the only POST endpoint used is GraphQL
+        for attempt in range(self.max_retries + 1):
+            wait = self.rate_limiter.delay(url, resource=resource)
+            if wait:
+                time.sleep(wait)
+            try:
+                if payload is not None:
+                    response = self.session.post(url, headers=headers, json=payload, timeout=10, stream=stream)
+                else:
+                    response = self.session.get(url, headers=headers, timeout=10, stream=stream)
+            except requests.RequestException as e:
+                time.sleep(self._retry_wait(url, attempt, error=e))
+                continue
+            retry = self._retry_wait(url, attempt, response)
+            if retry is None:
+                return response
+            response.close()
+            time.sleep(retry)
+
+    def _cached(self, url: str) -> Tuple[Any, Optional[Tuple[Any, Dict[str, str]]]]:
+        """Return (cache entry, result) where result is set if the entry is still fresh."""
+        entry = self.cache.lookup(url) if self.cache else None
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            return entry, (entry.value['body'], parse_links(entry.value['headers'].get('Link')))
+        return entry, None
+
+    def _conditional_headers(self, entry: Any) -> Dict[str, str]:
+        return self.cache.conditional_headers(entry) if self.cache else {}
+
+    def _read_response(self, url: str, entry: Any, response: Any) -> Tuple[Any, Dict[str, str]]:
+        """Turn a (requests or httpx) response into (JSON, links), updating the cache."""
+        if response.status_code == 304 and entry is not None:
+            self.cache.record_revalidated(url)
+            return entry.value['body'], parse_links(entry.value['headers'].get('Link'))
+        if response.status_code == 404:
+            return None, {}
+        if response.status_code >= 400:
+            raise GitHubAPIError(
+                f"GitHub API returned {response.status_code} for {url}", status=response.status_code, url=url
+            )
+        data = decode_json(response, url)
+        if self.cache:
+            self.cache.store_response(url, data, response.headers)
+        return data, parse_links(response.headers.get('Link'))
+
+    def _get(self, url: str) -> Tuple[Any, Dict[str, str]]:
+        """
+        Helper to GET a URL and return (JSON, response links); (None, {}) if not found.
+        With a cache attached, fresh entries are served locally and stale ones are
+        revalidated with a conditional request.
+        """
+        entry, result = self._cached(url)
+        if result is not None:
+            return result
+        response = self._request(url, self._conditional_headers(entry))
+        return self._read_response(url, entry, response)
 
     def _get_json(self, url: str) -> Any:
         """Helper to GET a URL and return JSON or None on error."""
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return None
+        return self._get(url)[0]
+
+    def _profile_url(self) -> str:
+        return f"{self.api_url}/users/{self.username}"
 
     def fetch_profile(self) -> Dict[str, Any]:
         """Fetch the user's public GitHub profile data using the GitHub REST API."""
-        url = f"https://api.github.com/users/{self.username}"
-        data = self._get_json(url)
-        return data if isinstance(data, dict) else {}
+        data = self._get_json(self._profile_url())
+        self.profile = data if isinstance(data, dict) else {}
+        return self.profile
 
-    def fetch_repos(self) -> List[Dict[str, Any]]:
-        """Fetch the user's public repositories and metadata using the GitHub REST API."""
-        url = f"https://api.github.com/users/{self.username}/repos"
-        data = self._get_json(url)
-        return data if isinstance(data, list) else []
+    def fetch_freshness_key(self) -> str:
+        """
+        Return a cheap token that changes whenever the user's repositories change:
+        profile update time and repo count plus the most recent push. Costs at most
+        two small requests, both cacheable and revalidated conditionally.
+        """
+        profile = self.profile or self.fetch_profile()
+        latest = self._get_json(f"{self.api_url}/users/{self.username}/repos?sort=pushed&per_page=1")
+        pushed_at = latest[0].get('pushed_at') if isinstance(latest, list) and latest else None
+        return f"{profile.get('updated_at')}|{profile.get('public_repos')}|{pushed_at}"
+
+    def _repos_page_url(self, page: int) -> str:
+        return f"{self.api_url}/users/{self.username}/repos?per_page={REPOS_PER_PAGE}&page={page}"
+
+    def _known_page_count(self, public_repos: Optional[int]) -> Optional[int]:
+        """Number of repo pages implied by `public_repos` or the fetched profile, if known."""
+        if public_repos is None:
+            public_repos = self.profile.get('public_repos')
+        if isinstance(public_repos, int) and public_repos >= 0:
+            return max(1, math.ceil(public_repos / REPOS_PER_PAGE))
+        return None
+
+    @staticmethod
+    def _last_page_number(links: Dict[str, str]) -> int:
+        match = _PAGE_PARAM.search(links.get('last', ''))
+        return int(match.group(1)) if match else 1
+
+    @staticmethod
+    def _merge_repo_pages(pages: List[Tuple[Any, Dict[str, str]]]) -> List[Dict[str, Any]]:
+        """Concatenate pages in order, dropping repos that shifted across pages mid-listing."""
+        repos, seen = [], set()
+        for data, _ in pages:
+            if not isinstance(data, list):
+                continue
+            for repo in data:
+                key = repo.get('id', repo.get('full_name', repo.get('name')))
+                if key in seen:
+                    continue
+                seen.add(key)
+                repos.append(repo)
+        return repos
+
+    def _fetch_repo_pages(self, pages: List[int]) -> List[Tuple[Any, Dict[str, str]]]:
+        """Fetch the given repo pages concurrently, returning (JSON, links) in page order."""
+        urls = [self._repos_page_url(page) for page in pages]
+        if len(urls) <= 1:
+            return [self._get(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            return list(pool.map(self._get, urls))
+
+    def fetch_repos(self, public_repos: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch all of the user's public repositories and metadata using the GitHub REST API.
+        Pages are requested concurrently once the total is known, either from `public_repos`,
+        from a previously fetched profile, or from the `last` link of the first page.
+        Repos created since the count was taken are picked up by following `next` links.
+        """
+        page_count = self._known_page_count(public_repos)
+        if page_count is not None:
+            pages = self._fetch_repo_pages(list(range(1, page_count + 1)))
+        else:
+            first = self._get(self._repos_page_url(1))
+            pages = [first] + self._fetch_repo_pages(list(range(2, self._last_page_number(first[1]) + 1)))
+        next_url = pages[-1][1].get('next')
+        while next_url:
+            page = self._get(next_url)
+            pages.append(page)
+            next_url = page[1].get('next')
+        return self._merge_repo_pages(pages)
+
+    def analyze_all(self, repos: List[Dict[str, Any]],
+                    texts: Optional[List['RepoText']] = None) -> 'GitHubAnalysis':
+        """
+        Compute all three metrics in a single traversal of `repos`.
+        Each repo's text fields are lowercased and combined once, then scanned by the
+        scoring profile's precompiled matchers for libraries, complexity signals and
+        documentation keywords. Pass `texts` from normalize_repos to re-analyze the same
+        repos (e.g. under another profile) without normalizing them again.
+        """
+        scoring = self.scoring
+        thresholds = scoring.profile.complexity_thresholds
+        math_libraries = {lib: {'count': 0, 'repos': []} for lib in scoring.profile.math_libraries}
+        complexity = {}
+        documentation = {}
+        repo_scores = []
+        for repo, text in zip(repos, texts if texts is not None else map(_normalize_repo, repos)):
+            name = repo.get('name', '')
+            libraries = scoring.library_matcher.find(text.library_text)
+            for lib in libraries:
+                math_libraries[lib]['count'] += 1
+                math_libraries[lib]['repos'].append(name)
+            signals = scoring.complexity_matcher.find(text.complexity_text)
+            if signals:
+                complexity[repo.get('name', 'unknown')] = {
+                    'complexity_signals': signals,
+                    'score': len(signals)
+                }
+            doc = scoring.score_documentation(repo, text.description)
+            if doc['score'] > 0:
+                documentation[repo.get('name', 'unknown')] = doc
+            repo_scores.append(RepoScore(
+                repository=name or 'unknown',
+                created_at=repo.get('created_at'),
+                pushed_at=repo.get('pushed_at'),
+                math=len(libraries),
+                libraries=tuple(libraries),
+                complexity=len(signals),
+                complexity_signals=tuple(signals),
+                complexity_level=complexity_level(len(signals), thresholds),
+                documentation=doc['score'],
+                doc_notes=doc['notes'],
+                total=len(libraries) + len(signals) + doc['score'],
+            ))
+        return GitHubAnalysis(
+            # Remove unused libraries for cleaner output
+            math_libraries={lib: data for lib, data in math_libraries.items() if data['count'] > 0},
+            complexity=complexity,
+            documentation=documentation,
+            complexity_thresholds=thresholds,
+            repo_scores=tuple(repo_scores),
+        )
 
     def analyze_math_libraries(self, repos: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -45,29 +293,7 @@ class GitHubAnalyzer:
         Scans repo metadata (topics, description, language) for common libraries.
         Returns a dict: {library: {count: int, repos: [repo_names]}}
         """
-        math_libs = [
-            'numpy', 'scipy', 'sympy', 'pandas', 'matplotlib', 'networkx',
-            'statsmodels', 'sklearn', 'tensorflow', 'pytorch', 'jax', 'theano',
-            'cvxpy', 'numba', 'sage', 'gmpy2', 'mpmath', 'random', 'itertools'
-        ]
-        result = {lib: {'count': 0, 'repos': []} for lib in math_libs}
-        for repo in repos:
-            text = ''
-            # Combine topics, description, and language for simple matching
-            if 'topics' in repo and isinstance(repo['topics'], list):
-                text += ' '.join(repo['topics']).lower() + ' '
-            if 'description' in repo and repo['description']:
-                text += repo['description'].lower() + ' '
-            if 'language' in repo and repo['language']:
-                text += str(repo['language']).lower() + ' '
-            import re
-            for lib in math_libs:
-                if re.search(r'\b' + re.escape(lib) + r'\b', text):
-                    result[lib]['count'] += 1
-                    result[lib]['repos'].append(repo.get('name', ''))
-        # Remove unused libraries for cleaner output
-        filtered = {lib: data for lib, data in result.items() if data['count'] > 0}
-        return filtered
+        return self.analyze_all(repos).math_libraries
 
     def analyze_repo_complexity(self, repos: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -75,32 +301,7 @@ class GitHubAnalyzer:
         Scans repo metadata (topics, description, name) for advanced algorithm/complexity keywords.
         Returns a dict: {repo_name: {complexity_signals: [keywords], score: int}}
         """
-        keywords = [
-            "dynamic programming", "graph", "optimization", "gradient", "convex",
-            "neural network", "regression", "classification", "clustering", "bayesian",
-            "simulation", "eigenvalue", "sparse", "differential", "stochastic",
-            "combinatorial", "cryptography", "probabilistic", "reinforcement",
-            "theory"
-        ]
-        result = {}
-        for repo in repos:
-            topics = repo.get('topics', [])
-            if not isinstance(topics, list):
-                topics = []
-            text = ' '.join(str(topic).lower() for topic in topics) + ' '
-            if 'description' in repo and repo['description']:
-                text += repo['description'].lower() + ' '
-            if 'name' in repo and repo['name']:
-                text += str(repo['name']).lower() + ' '
-            import re
-            cleaned_text = re.sub(r'[^a-z0-9 ]', ' ', text)
-            signals = list({kw for kw in keywords if re.search(r'\b' + re.escape(kw) + r'\b', cleaned_text)})
-            if signals:
-                result[repo.get('name', 'unknown')] = {
-                    'complexity_signals': signals,
-                    'score': len(signals)
-                }
-        return result
+        return self.analyze_all(repos).complexity
 
     def analyze_documentation(self, repos: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -108,42 +309,134 @@ class GitHubAnalyzer:
         Uses metadata fields (has_readme, description length, keywords) to estimate quality.
         Returns a dict: {repo_name: {score: int, notes: str}}
         """
-        doc_keywords = [
-            'theory', 'algorithm', 'proof', 'complexity', 'references',
-            'equation', 'formula', 'notation', 'background', 'analysis', 'derivation',
-            'convergence', 'optimization', 'statistical', 'probability', 'model', 'objective'
-        ]
-        result = {}
-        for repo in repos:
-            notes = []
-            score = 0
-            # Heuristic: longer description = better docs
-            desc = repo.get('description', '')
-            if desc and len(desc) > 40:
-                score += 1
-                notes.append('Long description')
-            # Heuristic: presence of doc-related keywords
-            desc_l = desc.lower() if desc else ''
-            found = [kw for kw in doc_keywords if kw in desc_l]
-            if found:
-                score += len(found)
-                notes.append(f"Keywords: {', '.join(found)}")
-            # Heuristic: has_wiki or has_pages flags
-            if repo.get('has_wiki'):
-                score += 1
-                notes.append('Wiki enabled')
-            if repo.get('has_pages'):
-                score += 1
-                notes.append('Pages enabled')
-            # Heuristic: README presence (if available in repo data)
-            if repo.get('has_readme', False):
-                score += 2
-                notes.append('README detected')
-            if score > 0:
-                result[repo.get('name', 'unknown')] = {
-                    'score': score,
-                    'notes': '; '.join(notes)
-                }
-        return result
+        return self.analyze_all(repos).documentation
+
+
+class RepoScore(NamedTuple):
+    """One repo's metric scores, recorded during the analyze_all traversal."""
+    repository: str
+    created_at: Optional[str]
+    pushed_at: Optional[str]
+    math: int                  # math libraries detected
+    libraries: Tuple[str, ...]
+    complexity: int            # complexity signals found
+    complexity_signals: Tuple[str, ...]
+    complexity_level: int
+    documentation: int         # documentation score
+    doc_notes: str
+    total: int
+
+
+REPO_FRAME_COLUMNS = list(RepoScore._fields)
+
+
+class RepoText(NamedTuple):
+    """Lowercased text views of one repo, built once and shared by all metrics."""
+    library_text: str     # topics, description, language
+    complexity_text: str  # topics, description, name; punctuation stripped
+    description: str
+
+
+def _normalize_repo(repo: Dict[str, Any]) -> RepoText:
+    topics = repo.get('topics', [])
+    topics_l = ' '.join(str(topic) for topic in topics).lower() if isinstance(topics, list) else ''
+    desc_l = repo['description'].lower() if repo.get('description') else ''
+    language_l = str(repo['language']).lower() if repo.get('language') else ''
+    name_l = str(repo['name']).lower() if repo.get('name') else ''
+    # Libraries found in the repo's source by a deep scan (see source_scanner)
+    source_l = ' '.join(repo.get('source_libraries') or [])
+    return RepoText(
+        library_text=f"{topics_l} {desc_l} {language_l} {source_l}",
+        complexity_text=_NON_ALPHANUMERIC.sub(' ', f"{topics_l} {desc_l} {name_l}"),
+        description=desc_l,
+    )
+
+
+def normalize_repos(repos: List[Dict[str, Any]]) -> List[RepoText]:
+    """Normalize repos once for repeated analysis (see GitHubAnalyzer.analyze_all)."""
+    return [_normalize_repo(repo) for repo in repos]
+
+
+def complexity_level(score: int, thresholds: Tuple[int, ...] = DEFAULT_COMPLEXITY_THRESHOLDS) -> int:
+    """Map a repo's complexity score to a level: 0=None, 1=Basic, 2=Advanced, 3=Research-level."""
+    return sum(score >= threshold for threshold in thresholds)
+
+
+@dataclass(frozen=True)
+class GitHubAnalysis:
+    """
+    Immutable result of GitHubAnalyzer.analyze_all: the three metric dicts plus the
+    profile-level aggregates shown in the UI. Treat the dicts as read-only.
+    """
+    math_libraries: Dict[str, Any]
+    complexity: Dict[str, Any]
+    documentation: Dict[str, Any]
+    complexity_thresholds: Tuple[int, ...] = DEFAULT_COMPLEXITY_THRESHOLDS
+    repo_scores: Tuple[RepoScore, ...] = ()
+
+    @property
+    def unique_libs(self) -> int:
+        return len(self.math_libraries)
+
+    @property
+    def complexity_levels(self) -> List[int]:
+        return [complexity_level(v['score'], self.complexity_thresholds) for v in self.complexity.values()]
+
+    @property
+    def avg_complexity_level(self) -> float:
+        levels = self.complexity_levels
+        return sum(levels) / len(levels) if levels else 0
+
+    @property
+    def avg_doc_score(self) -> float:
+        return sum(v['score'] for v in self.documentation.values()) / max(1, len(self.documentation))
+
+    @cached_property
+    def repo_frame(self) -> pd.DataFrame:
+        """
+        Per-repo scores, one row per analyzed repo (including repos that scored zero),
+        with `created_at`/`pushed_at` parsed as UTC timestamps. Built once per analysis.
+        """
+        frame = pd.DataFrame(list(self.repo_scores), columns=REPO_FRAME_COLUMNS)
+        for column in ('created_at', 'pushed_at'):
+            frame[column] = pd.to_datetime(frame[column], utc=True, errors='coerce')
+        return frame
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'math_libraries': self.math_libraries,
+            'complexity': self.complexity,
+            'documentation': self.documentation,
+        }
+
+
+def analysis_features(analyses: Sequence[Optional[GitHubAnalysis]]) -> np.ndarray:
+    """
+    (unique_libs, avg_complexity_level, avg_doc_score) for many analyses as an n x 3 array,
+    matching the GitHubAnalysis properties (zeros for None). The per-repo scores of the
+    whole cohort are flattened once, so levels and means are computed in bulk.
+    """
+    n = len(analyses)
+    present = [a for a in analyses if a is not None]
+    libs = np.fromiter((len(a.math_libraries) if a is not None else 0 for a in analyses), dtype=float, count=n)
+    complexity_counts = np.fromiter((len(a.complexity) if a is not None else 0 for a in analyses), dtype=np.int64, count=n)
+    doc_counts = np.fromiter((len(a.documentation) if a is not None else 0 for a in analyses), dtype=np.int64, count=n)
+    complexity_scores = np.fromiter((v['score'] for a in present for v in a.complexity.values()), dtype=float)
+    doc_scores = np.fromiter((v['score'] for a in present for v in a.documentation.values()), dtype=float)
+
+    # complexity_level counts the thresholds a score reaches, i.e. its rank among the sorted thresholds
+    groups: Dict[Tuple[int, ...], int] = {}
+    group_ids = np.fromiter((groups.setdefault(a.complexity_thresholds if a is not None else (), len(groups))
+                             for a in analyses), dtype=np.int64, count=n)
+    score_groups = np.repeat(group_ids, complexity_counts)
+    levels = np.zeros(len(complexity_scores))
+    for thresholds, group in groups.items():
+        in_group = score_groups == group if len(groups) > 1 else slice(None)
+        levels[in_group] = np.searchsorted(np.sort(thresholds), complexity_scores[in_group], side='right')
+
+    level_sums = np.bincount(np.repeat(np.arange(n), complexity_counts), weights=levels, minlength=n)
+    doc_sums = np.bincount(np.repeat(np.arange(n), doc_counts), weights=doc_scores, minlength=n)
+    avg_levels = np.divide(level_sums, complexity_counts, out=np.zeros(n), where=complexity_counts > 0)
+    return np.column_stack([libs, avg_levels, doc_sums / np.maximum(doc_counts, 1)])
 
 # Implementation will be modular and tested in /tests/test_github_analyzer.py
@@ -0,0 +1,208 @@
+# github_client.py
+"""
+Module with the HTTP plumbing shared by the GitHub analyzers:
+- a pooled keep-alive `requests` session shared across analyzers
+- rate-limit bookkeeping from X-RateLimit-* headers, with request pacing
+- jittered exponential backoff for transient failures
+- structured errors (`GitHubAPIError`, `RateLimitError`) instead of silent None results
+"""
+
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_WAIT = 60.0
+USER_AGENT = 'math-talent-analyzer'
+
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API cannot be reached or returns an unexpected error."""
+    def __init__(self, message: str, status: Optional[int] = None, url: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.url = url
+
+
+class RateLimitError(GitHubAPIError):
+    """Raised when the rate limit is exhausted and the reset is too far away to wait for."""
+    def __init__(self, reset_at: float, url: Optional[str] = None):
+        self.reset_at = reset_at
+        super().__init__(
+            f"GitHub API rate limit exceeded; retry at {self.retry_at.isoformat(timespec='seconds')}",
+            status=403, url=url
+        )
+
+    @property
+    def retry_at(self) -> datetime:
+        return datetime.fromtimestamp(self.reset_at, tz=timezone.utc)
+
+
+def default_token() -> Optional[str]:
+    """Return the API token from GITHUB_TOKEN, if set."""
+    return os.environ.get('GITHUB_TOKEN') or None
+
+
+def request_headers(token: Optional[str] = None) -> Dict[str, str]:
+    headers = {'Accept': 'application/vnd.github+json', 'User-Agent': USER_AGENT}
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+    return headers
+
+
+def parse_links(header: Optional[str]) -> Dict[str, str]:
+    """Parse an RFC 8288 Link header into {rel: url}."""
+    if not header:
+        return {}
+    return {
+        link['rel']: link['url']
+        for link in requests.utils.parse_header_links(header)
+        if 'rel' in link and 'url' in link
+    }
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry attempt."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def rate_limit_reset(status: int, headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Return the epoch time after which a 403/429 response may be retried, or None if the
+    response is not a rate-limit rejection (primary or secondary limit).
+    """
+    if status not in (403, 429):
+        return None
+    now = time.time() if now is None else now
+    retry_after = headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return now + float(retry_after)
+        except ValueError:
+            pass
+    if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset'):
+        try:
+            return float(headers['X-RateLimit-Reset'])
+        except ValueError:
+            pass
+    if status == 429:
+        return now + 60.0
+    return None
+
+
+class RateLimiter:
+    """
+    Tracks the remaining request budgets reported by GitHub and paces requests so each
+    budget lasts until its window resets. GitHub keeps a separate budget per resource
+    (`core` for REST, `graphql`, `search`, ...), named by X-RateLimit-Resource, so an
+    exhausted GraphQL budget does not hold back REST calls. Safe to share between
+    threads and analyzers.
+    """
+    def __init__(self, pace_below: int = 100, max_wait: float = DEFAULT_MAX_WAIT):
+        self.pace_below = pace_below
+        self.max_wait = max_wait
+        self._budgets: Dict[str, List[Any]] = {}  # resource -> [remaining, reset_at]
+        self._lock = threading.Lock()
+
+    def budget(self, resource: str = 'core') -> Tuple[Optional[int], Optional[float]]:
+        """(remaining, reset_at) last recorded for `resource`, or (None, None)."""
+        with self._lock:
+            remaining, reset_at = self._budgets.get(resource, (None, None))
+            return remaining, reset_at
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return self.budget()[0]
+
+    @property
+    def reset_at(self) -> Optional[float]:
+        return self.budget()[1]
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the budget from a response's X-RateLimit-Remaining/Reset/Resource headers."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_i, reset_f = int(remaining), float(reset)
+        except ValueError:
+            return
+        resource = headers.get('X-RateLimit-Resource') or 'core'
+        with self._lock:
+            budget = self._budgets.get(resource)
+            # Responses can arrive out of order: a later reset starts a new window,
+            # within the same window keep the lowest count, ignore older windows
+            if budget is None or reset_f > budget[1]:
+                self._budgets[resource] = [remaining_i, reset_f]
+            elif reset_f == budget[1]:
+                budget[0] = min(budget[0], remaining_i)
+
+    def delay(self, url: Optional[str] = None, now: Optional[float] = None, resource: str = 'core') -> float:
+        """
+        Seconds to wait before the next request against `resource`'s budget. Reserves one
+        unit of that budget. Raises RateLimitError if it is exhausted and the reset is
+        beyond `max_wait`.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            budget = self._budgets.get(resource)
+            if budget is None or budget[1] <= now:
+                return 0.0
+            remaining, reset_at = budget
+            window = reset_at - now
+            if remaining <= 0:
+                if window > self.max_wait:
+                    raise RateLimitError(reset_at, url)
+                return window
+            wait = window / remaining if remaining < self.pace_below else 0.0
+            budget[0] -= 1
+            return min(wait, self.max_wait)
+
+
+_shared_lock = threading.Lock()
+_shared_session: Optional[requests.Session] = None
+_shared_limiter: Optional[RateLimiter] = None
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Create a keep-alive session whose connection pool fits `pool_size` concurrent requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(request_headers())
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled session."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate-limit budget."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+
+def decode_json(response: Any, url: str) -> Any:
+    """Decode a response body, surfacing malformed payloads as GitHubAPIError."""
+    try:
+        return response.json()
+    except ValueError as e:
+        raise GitHubAPIError(f"Invalid JSON from {url}", status=response.status_code, url=url) from e
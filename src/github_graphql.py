@@ -0,0 +1,213 @@
+# github_graphql.py
+"""
+Module providing a GraphQL fetch path for GitHub profiles and repositories.
+One request returns the profile together with the first 100 repositories, including
+topics, primary language, timestamps, README presence and Pages deployments; each further request
+returns another 100. A candidate therefore costs O(repos / 100) requests instead of
+the REST path's O(repos) for per-repo fields. Results use the REST field names, so
+the analysis code is shared.
+"""
+
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.github_analyzer import GITHUB_API_URL, REPOS_PER_PAGE, GitHubAnalyzer
+from src.github_client import GitHubAPIError, RateLimitError, decode_json, default_token
+
+# README extensions in display priority; any file named readme (any case) counts
+README_EXTENSIONS = ('.md', '.markdown', '.rst', '.txt', '')
+# Files treated as the landing page of a docs/ directory, in priority order
+DOCS_INDEX_NAMES = ('index.md', 'index.rst', 'README.md', 'README.rst', 'index.txt', 'README')
+
+_REPOSITORIES = f'''
+  repositories(first: $first, after: $after, privacy: PUBLIC, ownerAffiliations: [OWNER],
+               orderBy: {{field: NAME, direction: ASC}}) {{
+    totalCount
+    pageInfo {{ hasNextPage endCursor }}
+    nodes {{
+      name nameWithOwner description url homepageUrl
+      createdAt pushedAt updatedAt
+      isFork isArchived hasWikiEnabled stargazerCount forkCount diskUsage
+      primaryLanguage {{ name }}
+      defaultBranchRef {{ name }}
+      repositoryTopics(first: 20) {{ nodes {{ topic {{ name }} }} }}
+      pages: deployments(environments: ["github-pages"], first: 1) {{ totalCount }}
+      root: object(expression: "HEAD:") {{ ... on Tree {{ entries {{ name oid type }} }} }}
+      docs: object(expression: "HEAD:docs") {{ ... on Tree {{ entries {{ name oid type }} }} }}
+    }}
+  }}'''
+
+PROFILE_QUERY = f'''
+query($login: String!, $first: Int!, $after: String) {{
+  repositoryOwner(login: $login) {{
+    login url avatarUrl
+    ... on User {{
+      name bio location company websiteUrl createdAt updatedAt
+      followers {{ totalCount }}
+      following {{ totalCount }}
+    }}
+    ... on Organization {{ name description location websiteUrl createdAt updatedAt }}
+{_REPOSITORIES}
+  }}
+}}'''
+
+REPOS_QUERY = f'''
+query($login: String!, $first: Int!, $after: String) {{
+  repositoryOwner(login: $login) {{
+{_REPOSITORIES}
+  }}
+}}'''
+
+
+def graphql_url(api_url: str) -> str:
+    """GraphQL endpoint for a REST API root (GitHub Enterprise serves it at /api/graphql)."""
+    api_url = api_url.rstrip('/')
+    if api_url.endswith('/api/v3'):
+        return api_url[:-len('/v3')] + '/graphql'
+    return api_url + '/graphql'
+
+
+def profile_from_graphql(owner: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a repositoryOwner node to the REST /users/{user} field names."""
+    return {
+        'login': owner.get('login'),
+        'name': owner.get('name'),
+        'bio': owner.get('bio', owner.get('description')),
+        'location': owner.get('location'),
+        'company': owner.get('company'),
+        'blog': owner.get('websiteUrl'),
+        'html_url': owner.get('url'),
+        'avatar_url': owner.get('avatarUrl'),
+        'created_at': owner.get('createdAt'),
+        'updated_at': owner.get('updatedAt'),
+        'public_repos': (owner.get('repositories') or {}).get('totalCount'),
+        'followers': (owner.get('followers') or {}).get('totalCount'),
+        'following': (owner.get('following') or {}).get('totalCount'),
+    }
+
+
+def repo_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a repository node to the REST field names, plus `has_readme` and, when a
+    README exists, its `readme_path` and blob `readme_sha`, and the docs/ index file's
+    `docs_index_path` and `docs_index_sha` (None without one). GraphQL has no Pages
+    flag, so `has_pages` means the repo has deployments to the github-pages environment,
+    which every Pages site (branch or Actions built) records.
+    """
+    readme = readme_entry((node.get('root') or {}).get('entries') or [])
+    repo = {
+        'name': node.get('name'),
+        'full_name': node.get('nameWithOwner'),
+        'description': node.get('description'),
+        'html_url': node.get('url'),
+        'homepage': node.get('homepageUrl'),
+        'language': (node.get('primaryLanguage') or {}).get('name'),
+        'topics': [t['topic']['name'] for t in (node.get('repositoryTopics') or {}).get('nodes', [])],
+        'created_at': node.get('createdAt'),
+        'pushed_at': node.get('pushedAt'),
+        'updated_at': node.get('updatedAt'),
+        'fork': node.get('isFork'),
+        'archived': node.get('isArchived'),
+        'has_wiki': node.get('hasWikiEnabled'),
+        'has_pages': bool((node.get('pages') or {}).get('totalCount')),
+        'stargazers_count': node.get('stargazerCount'),
+        'forks_count': node.get('forkCount'),
+        'size': node.get('diskUsage'),
+        'default_branch': (node.get('defaultBranchRef') or {}).get('name'),
+        'has_readme': readme is not None,
+    }
+    if readme is not None:
+        repo['readme_path'], repo['readme_sha'] = readme.get('name'), readme.get('oid')
+    repo['docs_index_path'], repo['docs_index_sha'] = docs_index((node.get('docs') or {}).get('entries') or [])
+    return repo
+
+
+def readme_entry(entries: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The README among a root tree's entries (matched case-insensitively), or None."""
+    readmes = []
+    for entry in entries:
+        stem, extension = os.path.splitext(str(entry.get('name', '')).lower())
+        if entry.get('type') == 'blob' and stem == 'readme':
+            rank = README_EXTENSIONS.index(extension) if extension in README_EXTENSIONS else len(README_EXTENSIONS)
+            readmes.append((rank, entry))
+    return min(readmes, key=lambda item: item[0])[1] if readmes else None
+
+
+def docs_index(entries: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+    """(path, blob SHA) of the index file among a docs/ directory's entries, or (None, None)."""
+    blobs = {entry.get('name'): entry for entry in entries if entry.get('type') in ('blob', 'file')}
+    for name in DOCS_INDEX_NAMES:
+        if name in blobs:
+            return f"docs/{name}", blobs[name].get('oid') or blobs[name].get('sha')
+    return None, None
+
+
+class GitHubGraphQLAnalyzer(GitHubAnalyzer):
+    """
+    GitHubAnalyzer that fetches the profile and repositories through the GraphQL API.
+    `fetch_profile` also retrieves the first page of repositories, which `fetch_repos`
+    reuses, so a user with up to 100 repos costs a single request. GraphQL requires
+    a token. Responses are not stored in the HTTP cache (it only holds GET requests).
+    """
+    def __init__(self, username: str, api_url: str = GITHUB_API_URL, **kwargs: Any):
+        super().__init__(username, api_url=api_url, **kwargs)
+        self.graphql_url = graphql_url(self.api_url)
+        self._first_page: Optional[Dict[str, Any]] = None
+
+    def _query(self, query: str, after: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Run `query` for this user and return the repositoryOwner node (None if no such user)."""
+        variables = {'login': self.username, 'first': REPOS_PER_PAGE, 'after': after}
+        response = self._request(self.graphql_url, {}, payload={'query': query, 'variables': variables})
+        if response.status_code >= 400:
+            raise GitHubAPIError(
+                f"GitHub GraphQL API returned {response.status_code}", status=response.status_code, url=self.graphql_url
+            )
+        body = decode_json(response, self.graphql_url)
+        errors = body.get('errors') or []
+        if any(error.get('type') == 'RATE_LIMITED' for error in errors):
+            reset = response.headers.get('X-RateLimit-Reset')
+            raise RateLimitError(float(reset) if reset else time.time() + 60.0, self.graphql_url)
+        data = body.get('data')
+        if data is None:
+            messages = '; '.join(str(error.get('message')) for error in errors) or 'no data returned'
+            raise GitHubAPIError(f"GitHub GraphQL query failed: {messages}", url=self.graphql_url)
+        return data.get('repositoryOwner')
+
+    def fetch_profile(self) -> Dict[str, Any]:
+        """Fetch the user's profile (and the first page of repositories) in one request."""
+        owner = self._query(PROFILE_QUERY)
+        self._first_page = (owner or {}).get('repositories')
+        self.profile = profile_from_graphql(owner) if owner else {}
+        return self.profile
+
+    def _repo_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the repository nodes page by page, following the cursors."""
+        page = self._first_page
+        self._first_page = None  # later calls fetch fresh data
+        if page is None:
+            page = (self._query(REPOS_QUERY) or {}).get('repositories')
+        while page:
+            yield [node for node in page.get('nodes') or [] if node]
+            info = page.get('pageInfo') or {}
+            if not info.get('hasNextPage'):
+                break
+            page = (self._query(REPOS_QUERY, after=info.get('endCursor')) or {}).get('repositories')
+
+    def fetch_repos(self, public_repos: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch all of the user's public repositories, 100 per request, following the
+        page cursors (`public_repos` is accepted for compatibility and ignored).
+        """
+        pages = [([repo_from_graphql(node) for node in nodes], {}) for nodes in self._repo_pages()]
+        return self._merge_repo_pages(pages)
+
+
+def create_analyzer(username: str, **kwargs: Any) -> GitHubAnalyzer:
+    """The GraphQL analyzer when a token is available (GraphQL requires one), else the REST analyzer."""
+    token = kwargs.get('token')
+    if token is None:
+        token = default_token()
+    if token:
+        return GitHubGraphQLAnalyzer(username, **kwargs)
+    return GitHubAnalyzer(username, **kwargs)
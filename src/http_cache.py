@@ -0,0 +1,81 @@
+# http_cache.py
+"""
+Module for caching GitHub API responses on disk with ETag/Last-Modified revalidation.
+Fresh entries (younger than the TTL) are served without a request; stale entries are
+revalidated with a conditional request, and a 304 reply reuses the stored body.
+"""
+
+import os
+import time
+from typing import Any, Dict, Optional
+
+from src.disk_cache import DiskCache, CacheEntry, DEFAULT_MAX_BYTES, default_cache_dir
+
+DEFAULT_TTL = 3600.0
+# Response headers worth keeping alongside the body
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Link')
+
+
+class HTTPCache:
+    """
+    Persistent response cache keyed by URL.
+    Tracks fresh hits, successful revalidations (304) and misses (full downloads).
+    """
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.store = DiskCache(path or os.path.join(default_cache_dir(), 'http.sqlite'), max_bytes)
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Return the stored entry for `url` (fresh or stale), or None."""
+        return self.store.get_entry(url)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def conditional_headers(self, entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for revalidating `entry`."""
+        if entry is None:
+            return {}
+        headers = {}
+        stored = entry.value.get('headers', {})
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+        return headers
+
+    def record_hit(self) -> None:
+        self.hits += 1
+
+    def record_revalidated(self, url: str) -> None:
+        self.revalidated += 1
+        self.store.touch(url)
+
+    def store_response(self, url: str, body: Any, headers: Any) -> None:
+        """Store a 200 response body with its validators (counts as a miss)."""
+        self.misses += 1
+        kept = {name: headers[name] for name in CACHED_HEADERS if headers.get(name)}
+        self.store.set(url, {'body': body, 'headers': kept})
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/revalidation/miss counters and the store's footprint."""
+        requests_seen = self.hits + self.revalidated + self.misses
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.revalidated) / requests_seen if requests_seen else 0.0,
+            'entries': len(self.store),
+            'size_bytes': self.store.size_bytes,
+            'evictions': self.store.evictions,
+        }
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def close(self) -> None:
+        self.store.close()
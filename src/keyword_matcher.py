@@ -0,0 +1,160 @@
+# keyword_matcher.py
+"""
+Module providing a precompiled multi-keyword matcher used by the analyzers.
+A keyword set is compiled once into a single trie-shaped regular expression, so each
+text is scanned in one pass regardless of how many keywords the set contains. Whole
+cohorts of texts can be matched in bulk with array operations (see match_matrix).
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+# Bytes that `\b` treats as word characters in ASCII text
+_ASCII_WORD = np.zeros(256, dtype=np.uint8)
+_ASCII_WORD[list(b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')] = 1
+_KEYWORD_START = 2  # byte-class bit set by each matcher for its keywords' first bytes
+_CHUNK_CHARS = 1 << 22  # bounds the temporary arrays of match_matrix
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex alternation that shares common prefixes (e.g. 'gra(?:dient|ph)').
+    Longer keywords are tried before their prefixes, and the engine can still fall
+    back to a shorter keyword when a longer one fails a trailing boundary check.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return body + '?' if len(branches) == 1 and len(body) == 1 else '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of keywords occur in a text, in a single scan.
+
+    With `word_boundary=True` a keyword only matches as a whole word (equivalent to
+    re.search(r'\\b' + re.escape(kw) + r'\\b', text)); otherwise any substring occurrence
+    counts (equivalent to `kw in text`). Keywords are expected to be lowercase words
+    separated by spaces; texts should be lowercased by the caller.
+    """
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = True):
+        self.keywords: List[str] = list(dict.fromkeys(kw for kw in keywords if kw))
+        self.word_boundary = word_boundary
+        self._rank = {kw: i for i, kw in enumerate(self.keywords)}
+        boundary = r'\b' if word_boundary else ''
+        # A lookahead match is zero-width, so scanning resumes at the next character and
+        # overlapping occurrences (e.g. 'dynamic programming' and 'programming') are all seen
+        self._pattern = re.compile(f"(?={boundary}({_trie_pattern(self.keywords)}){boundary})") if self.keywords else None
+        # Keywords that are prefixes of another keyword are implied when the longer one
+        # matches at the same position, since the scan reports only one hit per position
+        self._implied: Dict[str, List[str]] = {}
+        for kw in self.keywords:
+            inner = [
+                other for other in self.keywords
+                if other != kw and other in kw
+                and (not word_boundary or re.search(r'\b' + re.escape(other) + r'\b', kw))
+            ]
+            if inner:
+                self._implied[kw] = inner
+        # match_matrix compares bytes directly; that is exact only for ASCII whole-word keywords
+        self._byte_keywords: List[bytes] = []
+        self._byte_classes = _ASCII_WORD.copy()
+        if word_boundary and all(kw.isascii() for kw in self.keywords):
+            self._byte_keywords = [kw.encode() for kw in self.keywords]
+            self._byte_classes[[kw[0] for kw in self._byte_keywords]] |= _KEYWORD_START
+
+    def find(self, text: str) -> List[str]:
+        """Return the keywords occurring in `text`, in keyword-list order."""
+        if self._pattern is None or not text:
+            return []
+        found = set(self._pattern.findall(text))
+        if self._implied:
+            for kw in list(found):
+                found.update(self._implied.get(kw, ()))
+        return sorted(found, key=self._rank.__getitem__)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (position, keyword) for every occurrence in `text`, in text order."""
+        if self._pattern is None or not text:
+            return
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            yield match.start(), keyword
+            for inner in self._implied.get(keyword, ()):
+                if keyword.startswith(inner):
+                    yield match.start(), inner
+
+    def match_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Boolean matrix with a row per text and a column per keyword (in keyword-list order),
+        True where find() would report the keyword. ASCII texts are concatenated and matched
+        with array comparisons at word boundaries, a few million characters at a time;
+        other texts, and substring matchers, fall back to find().
+        """
+        matrix = np.zeros((len(texts), len(self.keywords)), dtype=bool)
+        bulk: List[int] = []
+        size = 0
+        for row, text in enumerate(texts):
+            if not text:
+                continue
+            if self._byte_keywords and text.isascii():
+                bulk.append(row)
+                size += len(text) + 1
+                if size >= _CHUNK_CHARS:
+                    self._match_ascii(texts, bulk, matrix)
+                    bulk, size = [], 0
+            else:
+                for kw in self.find(text):
+                    matrix[row, self._rank[kw]] = True
+        if bulk:
+            self._match_ascii(texts, bulk, matrix)
+        return matrix
+
+    def _match_ascii(self, texts: Sequence[str], rows: List[int], matrix: np.ndarray) -> None:
+        chunk = [texts[row] for row in rows]
+        codes = np.frombuffer('\n'.join(chunk).encode('ascii'), dtype=np.uint8)
+        lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk)) + 1
+        row_starts = np.cumsum(lengths) - lengths
+        row_ids = np.asarray(rows)
+        classes = self._byte_classes[codes]
+        word = np.zeros(len(codes) + 2, dtype=bool)
+        word[1:-1] = classes & 1
+        boundary = word[1:] != word[:-1]  # boundary[i]: `\b` holds just before codes[i]
+        # Every position a keyword can start at, sorted by its first two bytes
+        starts = np.flatnonzero(boundary[:-1] & (classes >= _KEYWORD_START))
+        padded = np.append(codes, np.uint8(0))
+        prefixes = (padded[starts].astype(np.uint16) << 8) | padded[starts + 1]
+        order = np.argsort(prefixes, kind='stable')
+        starts, prefixes = starts[order], prefixes[order]
+        for column, kw in enumerate(self._byte_keywords):
+            # A one-byte keyword takes every second byte; keep the bounds uint16 so the
+            # search does not upcast the whole prefix array
+            low = np.uint16(kw[0] << 8 | (kw[1] if len(kw) > 1 else 0))
+            high = low if len(kw) > 1 else low | np.uint16(0xFF)
+            hits = starts[np.searchsorted(prefixes, low):np.searchsorted(prefixes, high, side='right')]
+            hits = hits[hits + len(kw) <= len(codes)]
+            for offset in range(2, len(kw)):
+                hits = hits[codes[hits + offset] == kw[offset]]
+            hits = hits[boundary[hits + len(kw)]]
+            matrix[row_ids[np.searchsorted(row_starts, hits, side='right') - 1], column] = True
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords, word_boundary={self.word_boundary})"
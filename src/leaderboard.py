@@ -0,0 +1,205 @@
+# leaderboard.py
+"""
+Module providing an incrementally maintained candidate ranking.
+Scores are kept in an indexable skiplist ordered best-first, so inserting or
+re-scoring one candidate, reading the top K and answering rank/percentile queries
+all run in O(log n) (plus K for top-K), without re-sorting the cohort.
+"""
+
+import random
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+_MAX_LEVELS = 32
+Key = Tuple[float, str]  # (-score, candidate id): ascending order is best-first
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key: Optional[Key], levels: int):
+        self.key = key
+        self.next: List[Optional['_Node']] = [None] * levels
+        # width[i]: number of bottom-level steps skipped by next[i]
+        self.width = [1] * levels
+
+
+class _IndexableSkiplist:
+    """Sorted multiset of keys with O(log n) insert, remove, rank and select."""
+
+    def __init__(self):
+        self.head = _Node(None, _MAX_LEVELS)
+        self.levels = 1
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, keys: Iterable[Key]) -> '_IndexableSkiplist':
+        """Build from keys already in ascending order in O(n)."""
+        skiplist = cls()
+        last = [skiplist.head] * _MAX_LEVELS
+        last_position = [-1] * _MAX_LEVELS
+        position = -1
+        for position, key in enumerate(keys):
+            levels = skiplist._random_levels()
+            node = _Node(key, levels)
+            for level in range(levels):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+            skiplist.levels = max(skiplist.levels, levels)
+        skiplist.size = position + 1
+        for level in range(skiplist.levels):
+            last[level].width[level] = skiplist.size - last_position[level]
+        return skiplist
+
+    @staticmethod
+    def _random_levels() -> int:
+        levels = 1
+        while levels < _MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+        return levels
+
+    def _path(self, key: Key) -> Tuple[List[_Node], List[int]]:
+        """Per level, the last node before `key` and its bottom-level index (head = -1)."""
+        update = [self.head] * _MAX_LEVELS
+        index = [-1] * _MAX_LEVELS
+        node, position = self.head, -1
+        for level in range(self.levels - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            index[level] = position
+        return update, index
+
+    def insert(self, key: Key) -> None:
+        levels = self._random_levels()
+        update, index = self._path(key)
+        if levels > self.levels:
+            for level in range(self.levels, levels):
+                update[level] = self.head
+                index[level] = -1
+                self.head.width[level] = self.size + 1
+            self.levels = levels
+        node = _Node(key, levels)
+        position = index[0] + 1  # bottom-level index of the new node
+        for level in range(levels):
+            previous = update[level]
+            node.next[level] = previous.next[level]
+            previous.next[level] = node
+            node.width[level] = previous.width[level] - (position - index[level]) + 1
+            previous.width[level] = position - index[level]
+        for level in range(levels, self.levels):
+            update[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key: Key) -> None:
+        update, _ = self._path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for level in range(self.levels):
+            previous = update[level]
+            if previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+        self.size -= 1
+
+    def rank(self, key: Key) -> int:
+        """Number of keys strictly less than `key`."""
+        return self._path(key)[1][0] + 1
+
+    def __getitem__(self, index: int) -> Key:
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        node, position = self.head, -1
+        for level in range(self.levels - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+        return node.key
+
+    def __iter__(self) -> Iterator[Key]:
+        node = self.head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+
+class Leaderboard:
+    """
+    Live ranking of candidates by score (higher is better; ties by candidate id).
+    `add` inserts or re-scores a candidate in O(log n); optional per-candidate records
+    (e.g. the scorer row or analysis summary) are returned alongside top-K results.
+    """
+    def __init__(self, scores: Optional[Iterable[Tuple[str, float]]] = None):
+        # An initial cohort is sorted once and bulk-loaded; later changes are incremental
+        self._scores: Dict[str, float] = {candidate_id: float(score) for candidate_id, score in scores or ()}
+        self._index = _IndexableSkiplist.from_sorted(sorted((-score, cid) for cid, score in self._scores.items()))
+        self._records: Dict[str, Any] = {}
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, column: str = 'score') -> 'Leaderboard':
+        """Build a leaderboard from a SkillScorer result (candidate ids as the index)."""
+        return cls(zip(frame.index.astype(str), frame[column].astype(float)))
+
+    def add(self, candidate_id: str, score: float, record: Any = None) -> None:
+        """Insert a candidate or update its score (and record, if given)."""
+        previous = self._scores.get(candidate_id)
+        if previous is not None:
+            if previous == score:
+                if record is not None:
+                    self._records[candidate_id] = record
+                return
+            self._index.remove((-previous, candidate_id))
+        self._index.insert((-float(score), candidate_id))
+        self._scores[candidate_id] = float(score)
+        if record is not None:
+            self._records[candidate_id] = record
+
+    def remove(self, candidate_id: str) -> None:
+        score = self._scores.pop(candidate_id)
+        self._index.remove((-score, candidate_id))
+        self._records.pop(candidate_id, None)
+
+    def score(self, candidate_id: str) -> float:
+        return self._scores[candidate_id]
+
+    def rank(self, candidate_id: str) -> int:
+        """1-based position of the candidate (candidates with equal scores share no rank)."""
+        return self._index.rank((-self._scores[candidate_id], candidate_id)) + 1
+
+    def percentile(self, candidate_id: str) -> float:
+        """Percentage of the other candidates scoring strictly lower (0-100)."""
+        if len(self) <= 1:
+            return 100.0
+        score = self._scores[candidate_id]
+        # Everything ranked after the last candidate with this score scores lower
+        lower = len(self) - self._index.rank((-score, '\U0010ffff'))
+        return 100.0 * lower / (len(self) - 1)
+
+    def score_at_percentile(self, percentile: float) -> float:
+        """Score needed to be in the top (100 - percentile)% of the cohort."""
+        if not self._scores:
+            raise ValueError("Leaderboard is empty")
+        position = round((1 - percentile / 100) * (len(self) - 1))
+        return -self._index[min(max(position, 0), len(self) - 1)][0]
+
+    def top(self, k: int) -> List[Tuple[str, float, Any]]:
+        """The best `k` candidates as (id, score, record) tuples, best first."""
+        result = []
+        for negative_score, candidate_id in self._index:
+            if len(result) >= k:
+                break
+            result.append((candidate_id, -negative_score, self._records.get(candidate_id)))
+        return result
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, candidate_id: object) -> bool:
+        return candidate_id in self._scores
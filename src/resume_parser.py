@@ -3,51 +3,125 @@
 Module for parsing resumes in PDF, DOCX, or text format and extracting relevant information such as education, experience, projects, publications, and skills.
 """
 
+import json
 import os
-from typing import List, Dict, Any
+import signal
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
 import pypdf
 
+from src.document_readers import DOCX, PDF, UnsupportedFormatError, iter_docx_paragraphs, read_text_file, sniff_format
+from src.extraction_cache import ExtractionCache
+from src.resume_sections import segment_sections
+
 SAMPLE_RESUME_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'sample_resumes')
 
+
+class ExtractionTimeout(TimeoutError):
+    """Raised when extracting one file exceeds the parser's per-file timeout."""
+
 class ResumeParser:
     """
-    Batch parser for resumes in PDF format.
+    Batch parser for resumes in PDF, DOCX or plain-text format.
     Extracts structured information for downstream analysis.
     """
-    def __init__(self, resume_dir: str = SAMPLE_RESUME_DIR):
+    def __init__(self, resume_dir: str = SAMPLE_RESUME_DIR, cache: Optional[ExtractionCache] = None,
+                 max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                 timeout: Optional[float] = None, max_memory_mb: Optional[int] = None):
+        """
+        `max_pages` (PDF pages) and `max_chars` cap how much of each file is extracted; `timeout` bounds
+        the wall-clock seconds spent per file. `max_memory_mb` caps the address space of
+        the worker processes (POSIX only); with it set, even `workers=1` parses in a
+        single-worker pool so the cap never applies to the calling process.
+        """
         self.resume_dir = resume_dir
+        self.cache = cache
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+
+    def iter_pdf_files(self) -> Iterator[str]:
+        """Lazily yield PDF file paths in the resume directory."""
+        with os.scandir(self.resume_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith('.pdf'):
+                    yield os.path.join(self.resume_dir, entry.name)
 
     def get_pdf_files(self) -> List[str]:
         """Return list of PDF file paths in the resume directory."""
-        try:
-            files = os.listdir(self.resume_dir)
-        except Exception as e:
-            raise
-        return [
-            os.path.join(self.resume_dir, f)
-            for f in files
-            if f.lower().endswith('.pdf')
-        ]
-
-    def extract_text(self, pdf_path: str) -> str:
-        """Extract all text from a PDF file using pypdf."""
-        text = ""
+        return list(self.iter_pdf_files())
+
+    def iter_resume_files(self) -> Iterator[str]:
+        """Lazily yield paths of PDF, DOCX and text files, detected by content rather than extension."""
+        with os.scandir(self.resume_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                path = os.path.join(self.resume_dir, entry.name)
+                if sniff_format(path) is not None:
+                    yield path
+
+    def get_resume_files(self) -> List[str]:
+        """Return the PDF, DOCX and text file paths in the resume directory."""
+        return list(self.iter_resume_files())
+
+    def iter_page_text(self, pdf_path: str) -> Iterator[str]:
+        """Yield the text of each page in turn, stopping after `max_pages` pages."""
         with open(pdf_path, 'rb') as f:
             reader = pypdf.PdfReader(f)
-            for page in reader.pages:
-                text += page.extract_text() or ""
-        return text
+            for number, page in enumerate(reader.pages):
+                if self.max_pages is not None and number >= self.max_pages:
+                    break
+                yield page.extract_text() or ""
+
+    def extract_text(self, path: str) -> str:
+        """
+        Extract text from a PDF, DOCX or plain-text file (format sniffed from its content),
+        streaming pages or paragraphs up to the parser's `max_pages`/`max_chars` limits.
+        Raises ExtractionTimeout past `timeout` seconds.
+        """
+        file_format = sniff_format(path)
+        if file_format is None:
+            raise UnsupportedFormatError(f"{path}: not a PDF, DOCX or text file")
+        chunks = []
+        length = 0
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        with _time_limit(self.timeout, path):
+            if file_format == PDF:
+                parts = self.iter_page_text(path)
+            elif file_format == DOCX:
+                parts = iter_docx_paragraphs(path)
+            else:
+                parts = iter([read_text_file(path)])
+            for text in parts:
+                chunks.append(text)
+                length += len(text)
+                if self.max_chars is not None and length >= self.max_chars:
+                    break
+                # Checked between pages where the alarm-based limit is unavailable
+                if deadline is not None and time.monotonic() > deadline:
+                    raise ExtractionTimeout(f"{path}: extraction exceeded {self.timeout}s")
+        text = "".join(chunks)
+        return text if self.max_chars is None else text[:self.max_chars]
 
     def parse_resume(self, text: str) -> Dict[str, Any]:
         """
-        Stub: Parse resume text into structured data.
-        Returns a dictionary with keys: name, education, experience, skills, etc.
+        Parse resume text into structured data.
+        Returns a dictionary with keys: name, education, experience, skills, raw_text.
+        The text is segmented once and every field is read from the section index.
         """
+        sections = segment_sections(text)
         return {
-            'name': self.extract_name(text),
-            'education': self.extract_education(text),
-            'experience': self.extract_experience(text),
-            'skills': self.extract_skills(text),
+            'name': sections.first_line(),
+            'education': sections.section('education'),
+            'experience': sections.section('experience'),
+            'skills': _split_skills(sections.section('skills')),
             'raw_text': text
         }
 
@@ -66,90 +140,283 @@ class ResumeParser:
         Extract education section from resume text.
         Looks for 'Education' header and grabs lines until the next section header or end.
         """
-        lines = [line.strip() for line in text.split('\n')]
-        education_headers = ["education", "academic background", "degrees"]
-        all_headers = education_headers + ["experience", "skills", "projects", "publications", "work experience", "professional experience"]
-        # Find the start of the education section
-        start = None
-        for i, line in enumerate(lines):
-            if any(h in line.lower() for h in education_headers):
-                start = i + 1
-                break
-        if start is None:
-            return []
-        # Find the end of the education section
-        end = None
-        for j in range(start, len(lines)):
-            if any(h in lines[j].lower() for h in all_headers if h not in education_headers):
-                end = j
-                break
-        section = lines[start:end] if end else lines[start:]
-        # Filter out empty lines
-        return [l for l in section if l.strip()]
+        return segment_sections(text).section('education')
 
     def extract_experience(self, text: str) -> List[str]:
         """
         Extract experience section from resume text.
         Looks for 'Experience' header and grabs lines until the next section header or end.
         """
-        lines = [line.strip() for line in text.split('\n')]
-        experience_headers = ["experience", "work experience", "professional experience"]
-        all_headers = experience_headers + ["education", "skills", "projects", "publications", "academic background", "degrees"]
-        start = None
-        for i, line in enumerate(lines):
-            if any(h in line.lower() for h in experience_headers):
-                start = i + 1
-                break
-        if start is None:
-            return []
-        end = None
-        for j in range(start, len(lines)):
-            if any(h in lines[j].lower() for h in all_headers if h not in experience_headers):
-                end = j
-                break
-        section = lines[start:end] if end else lines[start:]
-        return [l for l in section if l.strip()]
+        return segment_sections(text).section('experience')
+
     def extract_skills(self, text: str) -> List[str]:
         """
         Extract skills section from resume text.
         Looks for 'Skills' header and grabs lines until the next section header or end.
         Splits comma-separated lists.
         """
-        lines = [line.strip() for line in text.split('\n')]
-        skills_headers = ["skills", "technical skills", "core competencies"]
-        all_headers = skills_headers + ["education", "experience", "projects", "publications", "work experience", "professional experience", "academic background", "degrees"]
-        start = None
-        for i, line in enumerate(lines):
-            if any(h in line.lower() for h in skills_headers):
-                start = i + 1
-                break
-        if start is None:
-            return []
-        end = None
-        for j in range(start, len(lines)):
-            if any(h in lines[j].lower() for h in all_headers if h not in skills_headers):
-                end = j
-                break
-        section = lines[start:end] if end else lines[start:]
-        # Split comma-separated skills and flatten
-        skills = []
-        for l in section:
-            for skill in l.split(","):
-                s = skill.strip()
-                if s:
-                    skills.append(s)
-        return skills
-
-    def batch_parse(self) -> List[Dict[str, Any]]:
-        """
-        Parse all PDF resumes in the directory and return a list of structured results.
-        """
-        results = []
-        for pdf_path in self.get_pdf_files():
-            text = self.extract_text(pdf_path)
-            parsed = self.parse_resume(text)
-            parsed['filename'] = os.path.basename(pdf_path)
-            results.append(parsed)
-        return results
+        return _split_skills(segment_sections(text).section('skills'))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes parse uncached; the parent process reads and fills the cache
+        state = self.__dict__.copy()
+        state['cache'] = None
+        return state
+
+    def _parse_uncached(self, path: str) -> Dict[str, Any]:
+        try:
+            parsed = self.parse_resume(self.extract_text(path))
+        except Exception as e:
+            return _error_record(path, f"{type(e).__name__}: {e}")
+        parsed['filename'] = os.path.basename(path)
+        return parsed
+
+    def _cache_lookup(self, path: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (content key, cached record or None); (None, None) without a cache."""
+        if self.cache is None:
+            return None, None
+        try:
+            key = self._cache_key(path)
+        except OSError:
+            return None, None
+        record = self.cache.get(key)
+        if record is not None:
+            record['filename'] = os.path.basename(path)
+        return key, record
+
+    def _cache_key(self, path: str) -> str:
+        key = self.cache.key_for(path)
+        if self.max_pages is not None or self.max_chars is not None:
+            # Truncated extractions must not be served to a parser with other limits
+            key += f":pages={self.max_pages}:chars={self.max_chars}"
+        return key
+
+    def _cache_store(self, key: Optional[str], record: Dict[str, Any]) -> None:
+        if self.cache is not None and key is not None and 'error' not in record:
+            self.cache.put(key, record)
+
+    def parse_file(self, path: str) -> Dict[str, Any]:
+        """
+        Extract and parse one resume file, reusing the cached result for unchanged content.
+        Failures are isolated: instead of raising, an empty record with an 'error'
+        message is returned for the file (and not cached). Runs in the calling process,
+        so `max_memory_mb` does not apply; iter_parse applies it.
+        """
+        key, record = self._cache_lookup(path)
+        if record is None:
+            record = self._parse_uncached(path)
+            self._cache_store(key, record)
+        return record
+
+    def _parse_chunk(self, paths: List[str]) -> List[Dict[str, Any]]:
+        return [self._parse_uncached(path) for path in paths]
+
+    def _submit_chunk(self, pool: ProcessPoolExecutor, chunk: List[str]) -> '_PendingChunk':
+        """Resolve cache hits locally and send only the misses to the pool."""
+        keys, records = [], []
+        for path in chunk:
+            key, record = self._cache_lookup(path)
+            keys.append(key)
+            records.append(record)
+        misses = [path for path, record in zip(chunk, records) if record is None]
+        return _PendingChunk(keys, records, misses, pool.submit(self._parse_chunk, misses) if misses else None)
+
+    def _new_pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=_limit_memory, initargs=(self.max_memory_mb,))
+
+    def _parse_isolated(self, paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse `paths` one at a time in a single-worker pool that is replaced whenever a
+        worker dies, so only the file that killed it (segfault, OOM kill) gets an error record.
+        """
+        records = []
+        pool = None
+        try:
+            for path in paths:
+                pool = pool or self._new_pool(1)
+                try:
+                    records.append(pool.submit(self._parse_chunk, [path]).result()[0])
+                except BrokenProcessPool:
+                    pool.shutdown()
+                    pool = None
+                    records.append(_error_record(path, "BrokenProcessPool: worker process died parsing this file"))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return records
+
+    def _complete_chunk(self, chunk: '_PendingChunk') -> List[Dict[str, Any]]:
+        try:
+            results = chunk.future.result() if chunk.future else []
+        except BrokenProcessPool:
+            # A worker died mid-chunk; the pool gives no clue which file caused it
+            results = self._parse_isolated(chunk.misses)
+        parsed = iter(results)
+        for i, record in enumerate(chunk.records):
+            if record is None:
+                chunk.records[i] = next(parsed)
+                self._cache_store(chunk.keys[i], chunk.records[i])
+        return chunk.records
+
+    def _iter_records(self, paths: Iterable[str], workers: int, chunksize: int,
+                      ordered: bool) -> Iterator[Dict[str, Any]]:
+        if workers <= 1 and not self.max_memory_mb:
+            for path in paths:
+                yield self.parse_file(path)
+            return
+        max_in_flight = workers * 2
+        pool = self._new_pool(workers)
+        pending = deque()
+        try:
+            for chunk in _chunked(paths, max(1, chunksize)):
+                try:
+                    pending.append(self._submit_chunk(pool, chunk))
+                except BrokenProcessPool:
+                    # A worker died: chunks already in flight are re-parsed in isolation as they
+                    # complete; new chunks go to a fresh pool
+                    pool.shutdown(cancel_futures=True)
+                    pool = self._new_pool(workers)
+                    pending.append(self._submit_chunk(pool, chunk))
+                while len(pending) >= max_in_flight:
+                    yield from self._complete_chunk(_next_finished(pending, ordered))
+            while pending:
+                yield from self._complete_chunk(_next_finished(pending, ordered))
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def iter_parse(self, workers: Optional[int] = 1, chunksize: int = 4, keep_raw_text: bool = True,
+                   raw_text_dir: Optional[str] = None, ordered: bool = True,
+                   paths: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield parsed resumes one at a time, so arbitrarily large folders parse in flat memory.
+        With `workers` > 1 (None = one per CPU) chunks of `chunksize` files are parsed in a
+        process pool, with only a few chunks in flight at once. Results come in directory
+        order, or as soon as they are ready with `ordered=False`.
+        `keep_raw_text=False` drops each record's 'raw_text'; `raw_text_dir` instead writes it
+        to '<raw_text_dir>/<filename>.txt' and records the path under 'raw_text_path'.
+        `paths` parses the given files instead of the whole directory.
+        """
+        if paths is None:
+            paths = self.iter_resume_files()
+        if raw_text_dir:
+            os.makedirs(raw_text_dir, exist_ok=True)
+        for record in self._iter_records(paths, workers or os.cpu_count() or 1, chunksize, ordered):
+            if raw_text_dir:
+                spill_path = os.path.join(raw_text_dir, record['filename'] + '.txt')
+                with open(spill_path, 'w', encoding='utf-8') as f:
+                    f.write(record.pop('raw_text'))
+                record['raw_text_path'] = spill_path
+            elif not keep_raw_text:
+                record.pop('raw_text')
+            yield record
+
+    def batch_parse(self, workers: Optional[int] = 1, chunksize: int = 4) -> List[Dict[str, Any]]:
+        """
+        Parse all resumes (PDF, DOCX, text) in the directory and return a list of structured results,
+        in directory-listing order. With `workers` > 1 (None = one per CPU), files are
+        distributed across a process pool in chunks of `chunksize`.
+        A file that fails to parse yields a record with an 'error' key instead of
+        aborting the batch. See iter_parse for a streaming variant.
+        """
+        return list(self.iter_parse(workers=workers, chunksize=chunksize))
+
+    def parse_to_jsonl(self, output_path: str, **options: Any) -> int:
+        """
+        Stream parsed resumes to a JSONL file, one record per line, and return the count.
+        Accepts the same options as iter_parse.
+        """
+        count = 0
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for record in self.iter_parse(**options):
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                count += 1
+        return count
+
+
+def _split_skills(lines: List[str]) -> List[str]:
+    """Split comma-separated skills and flatten."""
+    skills = []
+    for line in lines:
+        for skill in line.split(","):
+            s = skill.strip()
+            if s:
+                skills.append(s)
+    return skills
+
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _PendingChunk(NamedTuple):
+    keys: List[Optional[str]]
+    records: List[Optional[Dict[str, Any]]]  # None where the pool is parsing the file
+    misses: List[str]                        # paths sent to the pool
+    future: Optional[Future]
+
+
+def _error_record(path: str, error: str) -> Dict[str, Any]:
+    """Empty record carrying an 'error' message, returned for a file that failed to parse."""
+    return {
+        'name': '', 'education': [], 'experience': [], 'skills': [], 'raw_text': '',
+        'error': error, 'filename': os.path.basename(path),
+    }
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float], path: str) -> Iterator[None]:
+    """
+    Interrupt the enclosed block with ExtractionTimeout after `seconds`, even inside a
+    single slow page. Uses SIGALRM, so it only applies on POSIX in the main thread
+    (which includes pool workers); elsewhere extract_text's between-page check remains.
+    """
+    if not seconds or not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def expire(signum: int, frame: Any) -> None:
+        raise ExtractionTimeout(f"{path}: extraction exceeded {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _limit_memory(max_memory_mb: Optional[int]) -> None:
+    """Pool initializer: cap the worker's address space so a runaway file raises MemoryError."""
+    if not max_memory_mb:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _next_finished(pending: deque, ordered: bool) -> _PendingChunk:
+    """Pop the next finished chunk: the oldest, or whichever completes first."""
+    if ordered:
+        return pending.popleft()
+    ready = next((chunk for chunk in pending if chunk.future is None or chunk.future.done()), None)
+    if ready is None:
+        wait([chunk.future for chunk in pending], return_when=FIRST_COMPLETED)
+        ready = next(chunk for chunk in pending if chunk.future.done())
+    pending.remove(ready)
+    return ready
 
 # For unit testing and CLI usage, see tests/test_resume_parser.py
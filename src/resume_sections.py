@@ -0,0 +1,72 @@
+# resume_sections.py
+"""
+Module for segmenting resume text into sections in a single pass.
+The text is lowercased once and scanned once for all known section headers; the
+resulting index maps each section to the line span it covers, so every extractor
+reads its section directly instead of re-splitting and re-scanning the text.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.keyword_matcher import KeywordMatcher
+
+# Section name -> header phrases. A line containing any phrase (case-insensitive)
+# opens that section; a line containing another section's phrase closes it.
+SECTION_HEADERS: Dict[str, List[str]] = {
+    'education': ["education", "academic background", "degrees"],
+    'experience': ["experience", "work experience", "professional experience"],
+    'skills': ["skills", "technical skills", "core competencies"],
+    'projects': ["projects"],
+    'publications': ["publications"],
+}
+
+_HEADER_SECTION = {phrase: section for section, phrases in SECTION_HEADERS.items() for phrase in phrases}
+_HEADER_MATCHER = KeywordMatcher(_HEADER_SECTION, word_boundary=False)
+
+
+class SectionIndex:
+    """
+    Stripped resume lines plus a map of section name -> (start, end) line span,
+    where `start` is the line after the header and `end` is exclusive.
+    """
+    def __init__(self, lines: List[str], spans: Dict[str, Tuple[int, int]]):
+        self.lines = lines
+        self.spans = spans
+
+    def section(self, name: str) -> List[str]:
+        """Return the non-empty lines of section `name` ([] if the resume lacks it)."""
+        span = self.spans.get(name)
+        if span is None:
+            return []
+        return [line for line in self.lines[span[0]:span[1]] if line]
+
+    def first_line(self) -> str:
+        """Return the first non-empty line of the resume."""
+        return next((line for line in self.lines if line), "")
+
+
+def segment_sections(text: str) -> SectionIndex:
+    """Split `text` into lines and locate every known section in one scan."""
+    raw_lines = text.split('\n')
+    # Lowercase per line (lowercasing can change a line's length) and keep each line's
+    # offset in the joined text to map match positions back to lines
+    lowered = [line.lower() for line in raw_lines]
+    line_starts = list(accumulate((len(line) + 1 for line in lowered[:-1]), initial=0))
+    header_labels: Dict[int, Set[str]] = {}
+    for position, phrase in _HEADER_MATCHER.iter_matches('\n'.join(lowered)):
+        header_labels.setdefault(bisect_right(line_starts, position) - 1, set()).add(_HEADER_SECTION[phrase])
+
+    header_lines = sorted(header_labels)
+    spans: Dict[str, Tuple[int, int]] = {}
+    for section in SECTION_HEADERS:
+        start: Optional[int] = next((i for i in header_lines if section in header_labels[i]), None)
+        if start is None:
+            continue
+        end = next(
+            (j for j in header_lines if j > start and header_labels[j] - {section}),
+            len(raw_lines)
+        )
+        spans[section] = (start + 1, end)
+    return SectionIndex([line.strip() for line in raw_lines], spans)
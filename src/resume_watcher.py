@@ -0,0 +1,127 @@
+# resume_watcher.py
+"""
+Module for incrementally processing a resume inbox directory.
+Each poll stats the directory once and compares it with a persisted manifest of
+(size, mtime) per file, so only new or modified resumes are parsed; the manifest
+survives restarts, so a long-running intake never repeats a full sweep.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.disk_cache import default_cache_dir
+from src.document_readers import sniff_format
+from src.resume_parser import ResumeParser
+
+MANIFEST_VERSION = 2
+
+
+class ResumeEvent(NamedTuple):
+    kind: str  # 'added', 'modified' or 'deleted'
+    path: str
+    record: Optional[Dict[str, Any]]  # parsed resume; None for deletions
+
+
+def default_manifest_path(resume_dir: str) -> str:
+    """Manifest location for `resume_dir`, kept out of the (possibly shared) inbox itself."""
+    digest = hashlib.sha1(os.path.abspath(resume_dir).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(default_cache_dir(), 'watch', f"{digest}.json")
+
+
+class ResumeWatcher:
+    """
+    Polls `parser.resume_dir` and yields a ResumeEvent per added, modified or deleted resume
+    (PDF, DOCX or text; other files are remembered in the manifest but never reported).
+    Files modified less than `settle_seconds` ago are left for the next poll so uploads
+    still being written are not parsed half-finished. Bursts of new files are parsed
+    with `workers` processes (see ResumeParser.iter_parse).
+    """
+    def __init__(self, parser: ResumeParser, manifest_path: Optional[str] = None,
+                 settle_seconds: float = 2.0, workers: int = 1, keep_raw_text: bool = True):
+        self.parser = parser
+        self.manifest_path = manifest_path or default_manifest_path(parser.resume_dir)
+        self.settle_seconds = settle_seconds
+        self.workers = workers
+        self.keep_raw_text = keep_raw_text
+        # filename -> (size, mtime_ns, is_resume)
+        self.manifest: Dict[str, Tuple[int, int, bool]] = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Tuple[int, int, bool]]:
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != MANIFEST_VERSION:
+            return {}
+        return {name: tuple(sig) for name, sig in data.get('files', {}).items()}
+
+    def save_manifest(self) -> None:
+        """Atomically persist the manifest."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.manifest_path)), exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.manifest}, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Return {filename: (size, mtime_ns)} for the regular files currently in the directory."""
+        snapshot = {}
+        with os.scandir(self.parser.resume_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def poll(self) -> Iterator[ResumeEvent]:
+        """
+        Compare the directory with the manifest and yield events for what changed.
+        The manifest is updated as events are yielded and saved when the poll ends.
+        """
+        snapshot = self._snapshot()
+        settled_before = time.time_ns() - int(self.settle_seconds * 1e9)
+        changed: List[str] = [
+            name for name, sig in snapshot.items()
+            if self.manifest.get(name, ())[:2] != sig and sig[1] <= settled_before
+        ]
+        deleted = [name for name in self.manifest if name not in snapshot]
+        if not changed and not deleted:
+            return
+        try:
+            for name in deleted:
+                _, _, is_resume = self.manifest.pop(name)
+                if is_resume:
+                    yield ResumeEvent('deleted', os.path.join(self.parser.resume_dir, name), None)
+            resumes = []
+            for name in changed:
+                is_resume = sniff_format(os.path.join(self.parser.resume_dir, name)) is not None
+                if is_resume:
+                    resumes.append(name)
+                else:
+                    self.manifest[name] = (*snapshot[name], False)
+            paths = [os.path.join(self.parser.resume_dir, name) for name in resumes]
+            records = self.parser.iter_parse(workers=self.workers, keep_raw_text=self.keep_raw_text, paths=paths)
+            for name, path, record in zip(resumes, paths, records):
+                kind = 'modified' if self.manifest.get(name, (0, 0, False))[2] else 'added'
+                self.manifest[name] = (*snapshot[name], True)
+                yield ResumeEvent(kind, path, record)
+        finally:
+            self.save_manifest()
+
+    def watch(self, interval: float = 5.0, stop: Optional[threading.Event] = None) -> Iterator[ResumeEvent]:
+        """Poll every `interval` seconds and yield events until `stop` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            yield from self.poll()
+            stop.wait(interval)
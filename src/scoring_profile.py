@@ -0,0 +1,276 @@
+# scoring_profile.py
+"""
+Module for declarative scoring profiles: the keyword sets, documentation points,
+complexity thresholds, feature weights and caps used to analyze and score candidates.
+Profiles load from JSON or YAML and are compiled once (per content hash) into
+precompiled keyword matchers and weight vectors shared by every analyzer and scorer.
+"""
+
+import hashlib
+import json
+import os
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Mapping, Tuple
+
+import numpy as np
+
+from src.keyword_matcher import KeywordMatcher
+
+MATH_LIBRARIES = [
+    'numpy', 'scipy', 'sympy', 'pandas', 'matplotlib', 'networkx',
+    'statsmodels', 'sklearn', 'tensorflow', 'pytorch', 'jax', 'theano',
+    'cvxpy', 'numba', 'sage', 'gmpy2', 'mpmath', 'random', 'itertools'
+]
+COMPLEXITY_KEYWORDS = [
+    "dynamic programming", "graph", "optimization", "gradient", "convex",
+    "neural network", "regression", "classification", "clustering", "bayesian",
+    "simulation", "eigenvalue", "sparse", "differential", "stochastic",
+    "combinatorial", "cryptography", "probabilistic", "reinforcement",
+    "theory"
+]
+DOC_KEYWORDS = [
+    'theory', 'algorithm', 'proof', 'complexity', 'references',
+    'equation', 'formula', 'notation', 'background', 'analysis', 'derivation',
+    'convergence', 'optimization', 'statistical', 'probability', 'model', 'objective'
+]
+MATH_SKILL_KEYWORDS = list(dict.fromkeys(
+    [lib for lib in MATH_LIBRARIES if lib not in ('random', 'itertools')] + COMPLEXITY_KEYWORDS + [
+        'linear algebra', 'statistics', 'probability', 'calculus', 'machine learning',
+        'deep learning', 'numerical methods', 'discrete mathematics', 'topology',
+        'matlab', 'julia', 'scikit-learn', 'time series', 'signal processing',
+    ]
+))
+
+FEATURES = ['unique_libs', 'avg_complexity_level', 'avg_doc_score', 'math_skills', 'degree_level']
+
+# Feature value that earns full marks; fixed (not cohort-relative) so scores stay
+# comparable between batches. The thresholds mirror the app's summary wording.
+DEFAULT_CAPS: Dict[str, float] = {
+    'unique_libs': 5,            # "Strong math library diversity"
+    'avg_complexity_level': 3,   # research-level
+    'avg_doc_score': 4,          # exceptional documentation
+    'math_skills': 8,
+    'degree_level': 3,           # doctorate
+}
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    'unique_libs': 0.25,
+    'avg_complexity_level': 0.30,
+    'avg_doc_score': 0.15,
+    'math_skills': 0.20,
+    'degree_level': 0.10,
+}
+# Points per documentation signal; 'keyword' is awarded per distinct doc keyword found.
+# 'docs', 'equations' and 'references' need fetched README/docs content (see doc_content).
+DEFAULT_DOC_POINTS: Dict[str, int] = {
+    'long_description': 1, 'keyword': 1, 'wiki': 1, 'pages': 1, 'readme': 2,
+    'docs': 1, 'equations': 1, 'references': 1,
+}
+# Minimum complexity score for levels 1 (basic), 2 (advanced) and 3 (research-level)
+DEFAULT_COMPLEXITY_THRESHOLDS = (1, 2, 4)
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """
+    A named, immutable scoring configuration. Build one with `from_dict` or
+    `load_profile`; any section left out falls back to the defaults above. The
+    mapping fields are copied into read-only views, so the cached `digest` (and the
+    compiled profile keyed by it) cannot go stale.
+    """
+    name: str = 'default'
+    math_libraries: Tuple[str, ...] = tuple(MATH_LIBRARIES)
+    complexity_keywords: Tuple[str, ...] = tuple(COMPLEXITY_KEYWORDS)
+    doc_keywords: Tuple[str, ...] = tuple(DOC_KEYWORDS)
+    math_skill_keywords: Tuple[str, ...] = tuple(MATH_SKILL_KEYWORDS)
+    doc_points: Mapping[str, int] = field(default_factory=lambda: dict(DEFAULT_DOC_POINTS))
+    long_description_chars: int = 40
+    complexity_thresholds: Tuple[int, ...] = DEFAULT_COMPLEXITY_THRESHOLDS
+    weights: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_WEIGHTS))
+    caps: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_CAPS))
+
+    def __post_init__(self) -> None:
+        for name in ('doc_points', 'weights', 'caps'):
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Read-only mapping views cannot be pickled; rebuild from plain dicts instead
+        values = [getattr(self, f.name) for f in fields(self)]
+        return type(self), tuple(dict(v) if isinstance(v, MappingProxyType) else v for v in values)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'ScoringProfile':
+        """
+        Build a profile from its declarative form:
+        {name, keywords: {math_libraries, complexity, documentation, math_skills},
+         documentation: {points, long_description_chars}, complexity_thresholds, weights, caps}.
+        Weights, caps and documentation points are merged over the defaults.
+        """
+        unknown = set(data) - {'name', 'keywords', 'documentation', 'complexity_thresholds', 'weights', 'caps'}
+        if unknown:
+            raise ValueError(f"Unknown profile sections: {sorted(unknown)}")
+        keywords = dict(data.get('keywords') or {})
+        unknown = set(keywords) - {'math_libraries', 'complexity', 'documentation', 'math_skills'}
+        if unknown:
+            raise ValueError(f"Unknown keyword sets: {sorted(unknown)}")
+        documentation = dict(data.get('documentation') or {})
+        unknown = set(documentation.get('points') or {}) - set(DEFAULT_DOC_POINTS)
+        if unknown:
+            raise ValueError(f"Unknown documentation points: {sorted(unknown)}")
+        weights = {**DEFAULT_WEIGHTS, **(data.get('weights') or {})}
+        caps = {**DEFAULT_CAPS, **(data.get('caps') or {})}
+        unknown = (set(weights) | set(caps)) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown features: {sorted(unknown)}")
+        if sum(weights.values()) <= 0:
+            raise ValueError("Weights must sum to a positive value")
+        if any(cap <= 0 for cap in caps.values()):
+            raise ValueError("Caps must be positive")
+        thresholds = tuple(int(t) for t in data.get('complexity_thresholds') or DEFAULT_COMPLEXITY_THRESHOLDS)
+        if len(thresholds) != 3 or list(thresholds) != sorted(thresholds):
+            raise ValueError("complexity_thresholds must be three ascending scores")
+        return cls(
+            name=str(data.get('name', 'custom')),
+            math_libraries=_keyword_tuple(keywords.get('math_libraries', MATH_LIBRARIES)),
+            complexity_keywords=_keyword_tuple(keywords.get('complexity', COMPLEXITY_KEYWORDS)),
+            doc_keywords=_keyword_tuple(keywords.get('documentation', DOC_KEYWORDS)),
+            math_skill_keywords=_keyword_tuple(keywords.get('math_skills', MATH_SKILL_KEYWORDS)),
+            doc_points={**DEFAULT_DOC_POINTS, **(documentation.get('points') or {})},
+            long_description_chars=int(documentation.get('long_description_chars', 40)),
+            complexity_thresholds=thresholds,
+            weights=weights,
+            caps=caps,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the declarative form accepted by `from_dict`."""
+        return {
+            'name': self.name,
+            'keywords': {
+                'math_libraries': list(self.math_libraries),
+                'complexity': list(self.complexity_keywords),
+                'documentation': list(self.doc_keywords),
+                'math_skills': list(self.math_skill_keywords),
+            },
+            'documentation': {'points': dict(self.doc_points), 'long_description_chars': self.long_description_chars},
+            'complexity_thresholds': list(self.complexity_thresholds),
+            'weights': dict(self.weights),
+            'caps': dict(self.caps),
+        }
+
+    @cached_property
+    def digest(self) -> str:
+        """Content hash identifying the profile's settings (the name is not included)."""
+        settings = {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'name'}
+        canonical = json.dumps(settings, sort_keys=True, separators=(',', ':'),
+                               default=lambda v: dict(v) if isinstance(v, Mapping) else list(v))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+
+def _keyword_tuple(keywords: Any) -> Tuple[str, ...]:
+    if isinstance(keywords, str) or not all(isinstance(kw, str) for kw in keywords):
+        raise ValueError("Keyword sets must be lists of strings")
+    return tuple(dict.fromkeys(kw.strip().lower() for kw in keywords if kw.strip()))
+
+
+DEFAULT_PROFILE = ScoringProfile()
+
+
+def load_profile(path: str) -> ScoringProfile:
+    """Load a profile from a .json, .yaml or .yml file (YAML requires PyYAML)."""
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("PyYAML is required to load YAML scoring profiles") from e
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: a scoring profile must be a mapping")
+    return ScoringProfile.from_dict(data)
+
+
+@lru_cache(maxsize=None)
+def _matcher(keywords: Tuple[str, ...], word_boundary: bool) -> KeywordMatcher:
+    # Shared across profiles, so profiles differing only in weights reuse the compiled regexes
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
+
+
+class CompiledProfile:
+    """
+    Evaluation-ready form of a ScoringProfile: precompiled matchers plus weight and
+    cap vectors aligned with FEATURES. Obtain instances via `compile_profile`.
+    """
+    def __init__(self, profile: ScoringProfile):
+        self.profile = profile
+        self.digest = profile.digest
+        self.library_matcher = _matcher(profile.math_libraries, True)
+        self.complexity_matcher = _matcher(profile.complexity_keywords, True)
+        self.doc_matcher = _matcher(profile.doc_keywords, False)  # substring semantics
+        self.skill_matcher = _matcher(profile.math_skill_keywords, True)
+        self.weights = np.array([profile.weights[f] for f in FEATURES], dtype=float)
+        self.caps = np.array([profile.caps[f] for f in FEATURES], dtype=float)
+
+    def score_documentation(self, repo: Dict[str, Any], desc_l: str) -> Dict[str, Any]:
+        """Score one repo's documentation quality from its metadata."""
+        points = self.profile.doc_points
+        notes = []
+        score = 0
+        # Heuristic: longer description = better docs
+        if len(desc_l) > self.profile.long_description_chars:
+            score += points['long_description']
+            notes.append('Long description')
+        # Heuristic: presence of doc-related keywords
+        found = self.doc_matcher.find(desc_l)
+        if found:
+            score += points['keyword'] * len(found)
+            notes.append(f"Keywords: {', '.join(found)}")
+        # Heuristic: has_wiki or has_pages flags
+        if repo.get('has_wiki'):
+            score += points['wiki']
+            notes.append('Wiki enabled')
+        if repo.get('has_pages'):
+            score += points['pages']
+            notes.append('Pages enabled')
+        # Heuristic: README presence (if available in repo data)
+        if repo.get('has_readme', False):
+            score += points['readme']
+            notes.append('README detected')
+        # Content signals, present once README/docs content has been fetched
+        content = repo.get('doc_content')
+        if content:
+            extra = [kw for kw in content.get('keywords', []) if kw not in found]
+            if extra:
+                score += points['keyword'] * len(extra)
+                notes.append(f"README keywords: {', '.join(extra)}")
+            if content.get('docs_index'):
+                score += points['docs']
+                notes.append('docs/ index')
+            if content.get('equations'):
+                score += points['equations']
+                notes.append(f"Equations ({content['equations']})")
+            if content.get('references'):
+                score += points['references']
+                notes.append(f"References ({content['references']})")
+        return {'score': score, 'notes': '; '.join(notes)}
+
+    def __repr__(self) -> str:
+        return f"CompiledProfile({self.profile.name!r}, {self.digest[:12]})"
+
+
+_compiled: Dict[str, CompiledProfile] = {}
+
+
+def compile_profile(profile: ScoringProfile = DEFAULT_PROFILE) -> CompiledProfile:
+    """Return the compiled form of `profile`, compiling it only the first time its content is seen."""
+    digest = profile.digest
+    compiled = _compiled.get(digest)
+    if compiled is None:
+        compiled = _compiled[digest] = CompiledProfile(profile)
+    return compiled
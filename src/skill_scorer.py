@@ -1,6 +1,142 @@
 # skill_scorer.py
 """
 Module for scoring mathematical and technical skills based on extracted resume and GitHub data.
+Each candidate is reduced to a row of numeric features, with the resume keyword columns
+matched for the whole cohort at once; the cohort is then normalized and weighted in a
+single vectorized operation over the feature matrix.
 """
 
-# Implementation will be modular and tested in /tests/test_skill_scorer.py
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.github_analyzer import GitHubAnalysis, analysis_features
+from src.keyword_matcher import KeywordMatcher
+from src.scoring_profile import (  # re-exported: the defaults live with the profile format
+    DEFAULT_CAPS, DEFAULT_PROFILE, DEFAULT_WEIGHTS, FEATURES, MATH_SKILL_KEYWORDS,
+    CompiledProfile, ScoringProfile, compile_profile,
+)
+
+_DEGREE_LEVELS = {
+    'phd': 3, 'ph.d': 3, 'doctorate': 3, 'doctor of philosophy': 3,
+    'master': 2, 'masters': 2, 'msc': 2, 'm.sc': 2, 'm.s': 2, 'mba': 2,
+    'bachelor': 1, 'bachelors': 1, 'bsc': 1, 'b.sc': 1, 'b.s': 1, 'b.a': 1,
+}
+_DEGREE_MATCHER = KeywordMatcher(_DEGREE_LEVELS)
+_DEGREE_COLUMN_LEVELS = np.array([_DEGREE_LEVELS[d] for d in _DEGREE_MATCHER.keywords])
+_GITHUB_FEATURES = ['unique_libs', 'avg_complexity_level', 'avg_doc_score']  # analysis_features columns
+
+
+def _as_analysis(github: Any, scoring: Optional[CompiledProfile] = None) -> Optional[GitHubAnalysis]:
+    if github is None or isinstance(github, GitHubAnalysis):
+        return github
+    scoring = scoring or compile_profile()
+    return GitHubAnalysis(github.get('math_libraries', {}), github.get('complexity', {}),
+                          github.get('documentation', {}), scoring.profile.complexity_thresholds)
+
+
+def github_features(github: Any, scoring: Optional[CompiledProfile] = None) -> Dict[str, float]:
+    """Feature values from a GitHubAnalysis or its to_dict()/analyze_user() form."""
+    github = _as_analysis(github, scoring)
+    if github is None:
+        return {'unique_libs': 0, 'avg_complexity_level': 0, 'avg_doc_score': 0}
+    return {
+        'unique_libs': github.unique_libs,
+        'avg_complexity_level': github.avg_complexity_level,
+        'avg_doc_score': github.avg_doc_score,
+    }
+
+
+def _skills_text(resume: Mapping[str, Any]) -> str:
+    return '\n'.join(resume.get('skills', []) + resume.get('experience', [])).lower()
+
+
+def _education_text(resume: Mapping[str, Any]) -> str:
+    return '\n'.join(resume.get('education', [])).lower()
+
+
+def resume_features(resume: Optional[Mapping[str, Any]],
+                    scoring: Optional[CompiledProfile] = None) -> Dict[str, float]:
+    """Feature values from a parsed resume record (see ResumeParser.parse_resume)."""
+    if not resume:
+        return {'math_skills': 0, 'degree_level': 0}
+    scoring = scoring or compile_profile()
+    skills_text = _skills_text(resume)
+    degrees = _DEGREE_MATCHER.find(_education_text(resume))
+    return {
+        'math_skills': len(scoring.skill_matcher.find(skills_text)),
+        'degree_level': max((_DEGREE_LEVELS[d] for d in degrees), default=0),
+    }
+
+
+def _candidate_id(candidate: Mapping[str, Any], position: int) -> str:
+    github = candidate.get('github')
+    return str(
+        candidate.get('id')
+        or (github.get('username') if isinstance(github, Mapping) else None)
+        or (candidate.get('resume') or {}).get('filename')
+        or position
+    )
+
+
+class SkillScorer:
+    """
+    Scores a cohort of candidates from their parsed resumes and GitHub analyses.
+
+    Each feature is scaled to [0, 1] against a fixed cap and the weighted mean of the
+    scaled features gives a 0-100 score. Caps, weights and the resume skill keywords
+    come from a ScoringProfile; `weights`/`caps` override individual entries. Candidates are mappings with optional
+    'id', 'resume' (parsed resume record) and 'github' (GitHubAnalysis or its dict form).
+    """
+    def __init__(self, weights: Optional[Mapping[str, float]] = None,
+                 caps: Optional[Mapping[str, float]] = None,
+                 profile: Optional[ScoringProfile] = None):
+        profile = profile or DEFAULT_PROFILE
+        if weights or caps:
+            profile = ScoringProfile.from_dict({
+                **profile.to_dict(),
+                'weights': {**profile.weights, **(weights or {})},
+                'caps': {**profile.caps, **(caps or {})},
+            })
+        self.scoring = compile_profile(profile)
+        self.weights = self.scoring.weights
+        self.caps = self.scoring.caps
+
+    def features(self, candidates: Iterable[Mapping[str, Any]]) -> pd.DataFrame:
+        """
+        Build the candidate x feature matrix (one row per candidate, indexed by id).
+        Each column is computed for the whole cohort at once (analysis_features for the
+        GitHub columns, KeywordMatcher.match_matrix for the resume keyword columns).
+        """
+        candidates = list(candidates)
+        ids = [_candidate_id(candidate, position) for position, candidate in enumerate(candidates)]
+        github = analysis_features([_as_analysis(candidate.get('github'), self.scoring) for candidate in candidates])
+        resumes = [candidate.get('resume') or {} for candidate in candidates]
+        skills = self.scoring.skill_matcher.match_matrix([_skills_text(resume) for resume in resumes])
+        degrees = _DEGREE_MATCHER.match_matrix([_education_text(resume) for resume in resumes])
+        columns = {
+            **dict(zip(_GITHUB_FEATURES, github.T)),
+            'math_skills': skills.sum(axis=1),
+            'degree_level': (degrees * _DEGREE_COLUMN_LEVELS).max(axis=1, initial=0),
+        }
+        return pd.DataFrame(columns, index=pd.Index(ids, name='candidate'), columns=FEATURES, dtype=float)
+
+    def score_features(self, features: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score a feature matrix in one vectorized pass. Returns the features plus a
+        scaled '<feature>_norm' column each, the 0-100 'score' and a 1-based 'rank'.
+        """
+        values = features.reindex(columns=FEATURES).fillna(0).to_numpy(dtype=float)
+        normalized = np.clip(values / self.caps, 0.0, 1.0)
+        scores = normalized @ self.weights * (100.0 / self.weights.sum())
+        result = features.copy()
+        for i, feature in enumerate(FEATURES):
+            result[feature + '_norm'] = normalized[:, i]
+        result['score'] = scores
+        result['rank'] = result['score'].rank(method='min', ascending=False).astype(int)
+        return result
+
+    def score(self, candidates: Iterable[Mapping[str, Any]]) -> pd.DataFrame:
+        """Build features for `candidates` and score them as one cohort."""
+        return self.score_features(self.features(candidates))
@@ -0,0 +1,333 @@
+# source_scanner.py
+"""
+Module for source-level math library detection (opt-in "deep" analysis).
+Each repo's tarball at its default-branch commit is streamed and read member by
+member without touching disk; `.py` and `.ipynb` imports are parsed with `ast` in a
+process pool. Results are cached by commit SHA, so unchanged repos are never rescanned.
+"""
+
+import ast
+import json
+import logging
+import os
+import re
+import sys
+import tarfile
+import threading
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from src.disk_cache import DiskCache, default_cache_dir
+from src.github_analyzer import GitHubAnalyzer
+from src.github_client import GitHubAPIError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Bump when import extraction changes so cached scans are not reused
+SCANNER_VERSION = 1
+DEFAULT_MAX_FILE_BYTES = 512 * 1024         # larger files are usually generated or data
+DEFAULT_MAX_TOTAL_BYTES = 64 * 1024 * 1024  # uncompressed archive bytes read per repo
+_BATCH_BYTES = 256 * 1024                   # source handed to one pool task
+SOURCE_EXTENSIONS = ('.py', '.ipynb')
+SCANNED_LANGUAGES = {'Python', 'Jupyter Notebook'}
+# Vendored or generated trees say nothing about the author's own code
+_SKIPPED_DIRS = {'site-packages', 'node_modules', 'venv', '.venv', 'env', '.tox', 'build', 'dist', '__pycache__'}
+
+# Import names that differ from the library names used by scoring profiles
+IMPORT_ALIASES = {
+    'torch': 'pytorch',
+    'jaxlib': 'jax',
+    'pylab': 'matplotlib',
+    'sage_setup': 'sage',
+}
+# Standard-library imports (e.g. random, itertools) are too common in source to be a signal
+_STDLIB = frozenset(getattr(sys, 'stdlib_module_names', ())) | {'__future__'}
+
+_IMPORT_LINE = re.compile(r'^\s*(?:from\s+([A-Za-z_][\w.]*)\s+import|import\s+([A-Za-z_][\w., \t]*))', re.MULTILINE)
+_MAGIC_LINE = re.compile(r'^\s*[%!?].*$', re.MULTILINE)
+
+
+def imports_in_code(source: str) -> Set[str]:
+    """Top-level names of the absolute imports in Python source."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # Python 2 or otherwise unparsable: fall back to matching import statements
+        modules = set()
+        for from_module, imported in _IMPORT_LINE.findall(source):
+            for name in [from_module] if from_module else imported.split(','):
+                name = name.strip().split(' ')[0]
+                if name:
+                    modules.add(name.split('.')[0])
+        return modules
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module.split('.')[0])
+    return modules
+
+
+def imports_in_notebook(data: Union[str, bytes]) -> Set[str]:
+    """Imports in a notebook's code cells (IPython magics and shell lines are ignored)."""
+    try:
+        notebook = json.loads(data)
+    except ValueError:
+        return set()
+    modules = set()
+    for cell in notebook.get('cells', []) if isinstance(notebook, dict) else []:
+        if not isinstance(cell, dict) or cell.get('cell_type') != 'code':
+            continue
+        source = cell.get('source', '')
+        source = ''.join(source) if isinstance(source, list) else str(source)
+        modules |= imports_in_code(_MAGIC_LINE.sub('', source))
+    return modules
+
+
+def scan_source_files(files: List[Tuple[str, bytes]]) -> List[str]:
+    """Imported module names across (path, content) pairs; runs in worker processes."""
+    modules: Set[str] = set()
+    for path, data in files:
+        if path.endswith('.ipynb'):
+            modules |= imports_in_notebook(data)
+        else:
+            modules |= imports_in_code(data.decode('utf-8', errors='replace'))
+    return sorted(modules)
+
+
+def libraries_for_modules(modules: Iterable[str]) -> List[str]:
+    """Map imported modules to library names, dropping the standard library."""
+    return sorted({IMPORT_ALIASES.get(module, module) for module in modules if module not in _STDLIB})
+
+
+def is_source(path: str, extensions: Tuple[str, ...] = SOURCE_EXTENSIONS, in_archive: bool = True) -> bool:
+    """Whether `path` is a source file outside vendored trees (archive paths start with a top-level dir)."""
+    parts = path.split('/')
+    return path.endswith(extensions) and not _SKIPPED_DIRS.intersection(parts[1 if in_archive else 0:-1])
+
+
+def repo_full_name(analyzer: GitHubAnalyzer, repo: Dict[str, Any]) -> str:
+    return repo.get('full_name') or f"{analyzer.username}/{repo.get('name', '')}"
+
+
+def map_repos(function: Callable[[Dict[str, Any]], Any], repos: List[Dict[str, Any]], max_workers: int,
+              failed: Dict[str, str],
+              errors: Tuple[type, ...] = (GitHubAPIError, tarfile.TarError)) -> List[Optional[Any]]:
+    """
+    `function(repo)` for each repo on up to `max_workers` threads, in order. A repo that
+    raises one of `errors` (an empty repo's 409, a 451 tarball, a corrupt archive...)
+    yields None; the failure is logged and recorded in `failed` as {repo name: message}.
+    RateLimitError still propagates, since every remaining repo would fail the same way.
+    """
+    def run(repo: Dict[str, Any]) -> Optional[Any]:
+        try:
+            return function(repo)
+        except RateLimitError:
+            raise
+        except errors as e:
+            name = repo.get('name', '')
+            logger.warning("Skipping repo %s: %s", name, e)
+            failed[name] = str(e)
+            return None
+
+    if not repos:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(repos)))) as threads:
+        return list(threads.map(run, repos))
+
+
+def head_sha(analyzer: GitHubAnalyzer, repo: Dict[str, Any]) -> Optional[str]:
+    """Commit SHA at the tip of the repo's default branch (a cheap, conditionally cached request)."""
+    branch = repo.get('default_branch') or 'HEAD'
+    data = analyzer._get_json(f"{analyzer.api_url}/repos/{repo_full_name(analyzer, repo)}/commits/{branch}")
+    return data.get('sha') if isinstance(data, dict) else None
+
+
+class SourceArchive:
+    """
+    Source files of one repo at commit `sha`, streamed from GitHub's tarball endpoint.
+    Iterating yields (path, content) for files with one of `extensions` that fit under
+    `max_file_bytes`; reading stops once `max_total_bytes` of the uncompressed archive
+    have streamed by, setting `truncated`. A missing repo yields nothing.
+    """
+    def __init__(self, analyzer: GitHubAnalyzer, full_name: str, sha: str,
+                 max_file_bytes: int = DEFAULT_MAX_FILE_BYTES, max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+                 extensions: Tuple[str, ...] = SOURCE_EXTENSIONS):
+        self.analyzer = analyzer
+        self.full_name = full_name
+        self.url = f"{analyzer.api_url}/repos/{full_name}/tarball/{sha}"
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.extensions = extensions
+        self.truncated = False
+
+    def __iter__(self) -> Iterator[Tuple[str, bytes]]:
+        response = self.analyzer._request(self.url, {}, stream=True)
+        try:
+            if response.status_code == 404:
+                return
+            if response.status_code >= 400:
+                raise GitHubAPIError(f"GitHub API returned {response.status_code} for {self.url}",
+                                     status=response.status_code, url=self.url)
+            response.raw.decode_content = True
+            with tarfile.open(fileobj=response.raw, mode='r|gz') as archive:
+                for member in archive:
+                    if member.offset_data + member.size > self.max_total_bytes:
+                        self.truncated = True
+                        break
+                    if member.isfile() and member.size <= self.max_file_bytes and \
+                            is_source(member.name, self.extensions):
+                        yield member.name, archive.extractfile(member).read()
+        except (tarfile.TarError, EOFError, OSError, zlib.error) as e:
+            raise GitHubAPIError(f"Could not read the archive of {self.full_name}: {e}", url=self.url) from e
+        finally:
+            response.close()
+
+
+class BatchPool:
+    """
+    Runs a function over batches of (..., content) items in `workers` processes
+    (inline when 1). Batches are submitted as items arrive, so parsing overlaps the
+    download. Safe to share between threads; `close` shuts the processes down.
+    """
+    def __init__(self, workers: int = 2, batch_bytes: int = _BATCH_BYTES):
+        self.workers = max(1, workers)
+        self.batch_bytes = batch_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _submit(self, function: Callable[[List[Any]], Any], batch: List[Any]) -> Union[Future, Any]:
+        if self.workers == 1:
+            return function(batch)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool.submit(function, batch)
+
+    def map_batches(self, function: Callable[[List[Any]], Any], items: Iterable[Tuple[Any, ...]]) -> List[Any]:
+        """Return `function(batch)` for each batch of `items`, in order."""
+        pending = []
+        batch: List[Any] = []
+        size = 0
+        for item in items:
+            batch.append(item)
+            size += len(item[-1])
+            if size >= self.batch_bytes:
+                pending.append(self._submit(function, batch))
+                batch, size = [], 0
+        if batch:
+            pending.append(self._submit(function, batch))
+        return [result.result() if isinstance(result, Future) else result for result in pending]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+class RepoImports(NamedTuple):
+    repository: str
+    sha: Optional[str]          # scanned commit; None if the repo has no commits
+    modules: Tuple[str, ...]    # top-level imported modules (stdlib included)
+    files: int                  # source files parsed
+    bytes: int                  # source bytes parsed
+    truncated: bool             # the byte budget stopped the scan early
+
+
+class SourceScanner:
+    """
+    Deep-scans a user's repos for imported libraries, reusing `analyzer`'s session,
+    token, rate-limit budget and (if attached) HTTP cache. Only Python and Jupyter
+    repos are scanned; `max_file_bytes` and `max_total_bytes` bound the work per repo
+    (see SourceArchive). Imports are parsed in `workers` processes (inline when 1).
+    Use as a context manager or call `close` to release the process pool (and the
+    default cache).
+    """
+    def __init__(self, analyzer: GitHubAnalyzer, cache: Optional[DiskCache] = None, workers: int = 2,
+                 max_file_bytes: int = DEFAULT_MAX_FILE_BYTES, max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES):
+        self.analyzer = analyzer
+        self._owns_cache = cache is None
+        self.cache = cache if cache is not None else DiskCache(os.path.join(default_cache_dir(), 'source_scan.sqlite'))
+        self.pool = BatchPool(workers)
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.hits = 0
+        self.misses = 0
+        self.failed: Dict[str, str] = {}  # repos that could not be scanned: {name: error}
+
+    def head_sha(self, repo: Dict[str, Any]) -> Optional[str]:
+        return head_sha(self.analyzer, repo)
+
+    def _cache_key(self, sha: str) -> str:
+        # The archive at a commit is immutable, so the SHA (and the limits) fully determine the result
+        return f"imports:v{SCANNER_VERSION}:{sha}:{self.max_file_bytes}:{self.max_total_bytes}"
+
+    def _scan_archive(self, full_name: str, sha: str) -> Tuple[Set[str], int, int, bool]:
+        """Stream the tarball at `sha`, parsing source batches while the download continues."""
+        archive = SourceArchive(self.analyzer, full_name, sha, self.max_file_bytes, self.max_total_bytes)
+        counts = [0, 0]
+
+        def counted() -> Iterator[Tuple[str, bytes]]:
+            for path, data in archive:
+                counts[0] += 1
+                counts[1] += len(data)
+                yield path, data
+
+        modules: Set[str] = set()
+        for found in self.pool.map_batches(scan_source_files, counted()):
+            modules.update(found)
+        return modules, counts[0], counts[1], archive.truncated
+
+    def scan_repo(self, repo: Dict[str, Any]) -> RepoImports:
+        """Imports used in `repo` at its default-branch head, from the cache when already scanned."""
+        name = repo.get('name', '')
+        sha = self.head_sha(repo)
+        if sha is None:
+            return RepoImports(name, None, (), 0, 0, False)
+        key = self._cache_key(sha)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return RepoImports(name, sha, tuple(cached['modules']), cached['files'], cached['bytes'],
+                               cached['truncated'])
+        self.misses += 1
+        modules, files, scanned, truncated = self._scan_archive(repo_full_name(self.analyzer, repo), sha)
+        result = RepoImports(name, sha, tuple(sorted(modules)), files, scanned, truncated)
+        self.cache.set(key, {'modules': list(result.modules), 'files': files, 'bytes': scanned,
+                             'truncated': truncated})
+        return result
+
+    def scan(self, repos: List[Dict[str, Any]]) -> Dict[str, RepoImports]:
+        """
+        Scan the Python/Jupyter repos among `repos` concurrently; returns {repo name: RepoImports}.
+        Repos that cannot be scanned are left out and recorded in `failed`.
+        """
+        targets = [repo for repo in repos if repo.get('language') in SCANNED_LANGUAGES and repo.get('size', 1)]
+        results = map_repos(self.scan_repo, targets, self.analyzer.max_workers, self.failed)
+        return {result.repository: result for result in results if result is not None}
+
+    def annotate(self, repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return copies of `repos` with a 'source_libraries' list, which
+        GitHubAnalyzer.analyze_all counts alongside topics and descriptions.
+        """
+        scans = self.scan(repos)
+        annotated = []
+        for repo in repos:
+            found = scans.get(repo.get('name', ''))
+            annotated.append({**repo, 'source_libraries': libraries_for_modules(found.modules)} if found else repo)
+        return annotated
+
+    def close(self) -> None:
+        self.pool.close()
+        if self._owns_cache:
+            self.cache.close()
+
+    def __enter__(self) -> 'SourceScanner':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
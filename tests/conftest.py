@@ -0,0 +1,140 @@
+"""
+Shared pytest fixtures.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.disk_cache import DiskCache
+from src.github_analyzer import GitHubAnalyzer
+
+
+class MockGitHubServer:
+    """
+    Minimal local stand-in for the GitHub REST API.
+    Register handlers with `route(path, handler)`; a handler receives (query, headers)
+    and returns (status, headers, body). Every request is recorded in `requests`.
+    """
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _dispatch(self):
+                parts = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                with server._lock:
+                    server.requests.append({
+                        'method': self.command, 'path': parts.path, 'query': query,
+                        'headers': dict(self.headers), 'body': body,
+                    })
+                handler = server.routes.get(parts.path)
+                if handler is None:
+                    status, headers, payload = 404, {}, {'message': 'Not Found'}
+                else:
+                    status, headers, payload = handler(query, dict(self.headers))
+                data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if status != 304:
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                if status != 304:
+                    self.wfile.write(data)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def route(self, path, handler):
+        self.routes[path] = handler
+
+    def paths(self):
+        return [r['path'] for r in self.requests]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def github_server():
+    server = MockGitHubServer()
+    yield server
+    server.close()
+
+
+def make_tarball(files, prefix='octo-calc-sha'):
+    """A gzipped tarball like GitHub's archive endpoint returns: `files` under one top-level directory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for path, content in files.items():
+            data = content.encode() if isinstance(content, str) else content
+            info = tarfile.TarInfo(f"{prefix}/{path}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def repo_server(github_server):
+    """
+    github_server serving repo octo/calc: its main branch points at `repo_server.repo['sha']`
+    and the tarball, git tree and blobs at that commit hold `repo_server.repo['files']`
+    ({path: content}).
+    """
+    repo = {'sha': 'abc123', 'files': {}}
+
+    def head(query, headers):
+        sha = repo['sha']
+        github_server.route(f'/repos/octo/calc/tarball/{sha}',
+                            lambda q, h: (200, {}, make_tarball(repo['files'], f'octo-calc-{sha}')))
+        entries = []
+        for path, content in sorted(repo['files'].items()):
+            data = content.encode() if isinstance(content, str) else content
+            digest = hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+            entries.append({'path': path, 'type': 'blob', 'sha': digest, 'size': len(data)})
+            github_server.route(f'/repos/octo/calc/git/blobs/{digest}', lambda q, h, data=data: (
+                200, {}, {'sha': digest, 'encoding': 'base64', 'content': base64.b64encode(data).decode()}))
+        github_server.route(f'/repos/octo/calc/git/trees/{sha}',
+                            lambda q, h: (200, {}, {'sha': sha, 'tree': entries, 'truncated': False}))
+        return 200, {}, {'sha': sha}
+    github_server.route('/repos/octo/calc/commits/main', head)
+    github_server.repo = repo
+    return github_server
+
+
+@pytest.fixture
+def make_stage(tmp_path):
+    """
+    Factory for the repo stages (SourceScanner, CodeComplexityAnalyzer, DocContentFetcher):
+    `make_stage(stage, server, **kwargs)` builds one over an analyzer for octo on `server`,
+    with its own DiskCache under `cache_dir` (default tmp_path). `analyzer_kwargs` go
+    to the GitHubAnalyzer.
+    """
+    def make(stage, server, cache_dir=None, analyzer_kwargs=None, **kwargs):
+        analyzer = GitHubAnalyzer('octo', api_url=server.url, **(analyzer_kwargs or {}))
+        cache = DiskCache(str((cache_dir or tmp_path) / f"{stage.__name__}.sqlite"))
+        return stage(analyzer, cache=cache, **kwargs)
+    return make
@@ -0,0 +1,122 @@
+"""
+Unit tests for async_github_analyzer.py
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from src.async_github_analyzer import AsyncGitHubAnalyzer, analyze_many
+from src.github_analyzer import GitHubAnalyzer
+from src.github_client import RateLimiter, RateLimitError
+from src.http_cache import HTTPCache
+
+def _serve_user(server, username, repos, delay=0.0):
+    def profile(query, headers):
+        time.sleep(delay)
+        return 200, {}, {'login': username, 'public_repos': len(repos)}
+    def repo_page(query, headers):
+        page = int(query.get('page', 1))
+        return 200, {}, repos[(page - 1) * 100:page * 100]
+    server.route(f'/users/{username}', profile)
+    server.route(f'/users/{username}/repos', repo_page)
+
+def _collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
+
+def test_fetch_profile_and_repos(github_server):
+    repos = [{'id': i, 'name': f'r{i}', 'description': 'numpy tools'} for i in range(230)]
+    _serve_user(github_server, 'octo', repos)
+
+    async def run():
+        async with AsyncGitHubAnalyzer('octo', api_url=github_server.url, rate_limiter=RateLimiter()) as analyzer:
+            profile = await analyzer.fetch_profile()
+            fetched = await analyzer.fetch_repos()
+            return profile, fetched
+    profile, fetched = asyncio.run(run())
+    assert profile['public_repos'] == 230
+    assert [r['id'] for r in fetched] == list(range(230))
+
+def test_analyze_many_yields_in_completion_order(github_server):
+    _serve_user(github_server, 'slow', [{'id': 1, 'name': 'a', 'description': 'scipy'}], delay=0.5)
+    _serve_user(github_server, 'fast', [{'id': 2, 'name': 'b', 'description': 'numpy'}])
+    results = _collect(analyze_many(['slow', 'fast'], concurrency=2, api_url=github_server.url,
+                                    rate_limiter=RateLimiter()))
+    assert [r['username'] for r in results] == ['fast', 'slow']
+    assert 'numpy' in results[0]['math_libraries']
+    assert results[1]['repo_count'] == 1
+
+def test_analyze_many_bounds_concurrency(github_server):
+    active, peak, lock = [0], [0], threading.Lock()
+    def profile(query, headers):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return 200, {}, {'public_repos': 0}
+    names = [f'user{i}' for i in range(12)]
+    for name in names:
+        github_server.route(f'/users/{name}', profile)
+        github_server.route(f'/users/{name}/repos', lambda q, h: (200, {}, []))
+    results = _collect(analyze_many(iter(names), concurrency=3, api_url=github_server.url,
+                                    rate_limiter=RateLimiter()))
+    assert sorted(r['username'] for r in results) == sorted(names)
+    assert peak[0] <= 3
+
+def test_analyze_many_reports_errors_per_user(github_server, monkeypatch):
+    monkeypatch.setattr('src.github_analyzer.backoff_delay', lambda attempt: 0)
+    _serve_user(github_server, 'ok', [])
+    github_server.route('/users/bad', lambda q, h: (500, {}, {'message': 'boom'}))
+    results = {r['username']: r for r in _collect(analyze_many(
+        ['ok', 'bad'], api_url=github_server.url, rate_limiter=RateLimiter()))}
+    assert 'error' in results['bad'] and '500' in results['bad']['error']
+    assert results['ok']['repo_count'] == 0
+
+def test_analyze_many_stops_on_rate_limit(github_server):
+    github_server.route('/users/limited', lambda q, h: (
+        403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '4102444800'}, {}
+    ))
+    with pytest.raises(RateLimitError):
+        _collect(analyze_many(['limited'], api_url=github_server.url, rate_limiter=RateLimiter()))
+
+class ThreadRecordingCache(HTTPCache):
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = set()
+
+    def lookup(self, url):
+        self.threads.add(threading.get_ident())
+        return super().lookup(url)
+
+    def store_response(self, url, body, headers):
+        self.threads.add(threading.get_ident())
+        super().store_response(url, body, headers)
+
+def test_cache_io_runs_off_the_event_loop(github_server, tmp_path):
+    _serve_user(github_server, 'octo', [{'id': 1, 'name': 'a', 'description': 'numpy'}])
+    cache = ThreadRecordingCache(str(tmp_path / 'http.sqlite'))
+
+    async def run():
+        loop_thread = threading.get_ident()
+        for _ in range(2):
+            async with AsyncGitHubAnalyzer('octo', api_url=github_server.url, cache=cache,
+                                           rate_limiter=RateLimiter()) as analyzer:
+                result = await analyzer.analyze_user()
+        return loop_thread, result
+    loop_thread, result = asyncio.run(run())
+    assert result['repo_count'] == 1
+    assert cache.threads and loop_thread not in cache.threads
+    assert cache.hits == 2 and len(github_server.paths()) == 2
+    cache.close()
+
+def test_async_analyzer_is_not_a_sync_analyzer():
+    analyzer = AsyncGitHubAnalyzer('octo', rate_limiter=RateLimiter())
+    assert not isinstance(analyzer, GitHubAnalyzer)
+    assert not hasattr(analyzer, 'fetch_freshness_key')
+    assert isinstance(analyzer.analyzer, GitHubAnalyzer) and analyzer.username == 'octo'
+    assert analyzer.analyze_all([{'id': 1, 'name': 'a', 'description': 'numpy'}]).unique_libs == 1
+    asyncio.run(analyzer.aclose())
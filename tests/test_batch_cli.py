@@ -0,0 +1,110 @@
+"""
+Unit tests for batch_cli.py
+"""
+
+import io
+import json
+import pytest
+from src import github_client
+from src.batch_cli import Checkpoint, main, read_usernames, to_csv_row
+
+@pytest.fixture(autouse=True)
+def isolated_rate_limiter(monkeypatch):
+    monkeypatch.setattr(github_client, '_shared_limiter', github_client.RateLimiter())
+
+def _serve_users(server, names):
+    for name in names:
+        server.route(f'/users/{name}', lambda q, h, name=name: (200, {}, {'login': name, 'public_repos': 1}))
+        server.route(f'/users/{name}/repos', lambda q, h: (200, {}, [{'id': 1, 'name': 'x', 'description': 'numpy'}]))
+
+def test_read_usernames_formats():
+    assert list(read_usernames(io.StringIO("alice\nbob\n\n# comment\ncarol\n"))) == ['alice', 'bob', 'carol']
+    assert list(read_usernames(io.StringIO("name,Username\nAlice,alice\nBob,bob\n"))) == ['alice', 'bob']
+    assert list(read_usernames(io.StringIO("alice,extra\nbob\n"))) == ['alice', 'bob']
+
+def test_checkpoint_watermark(tmp_path):
+    ckpt = Checkpoint(str(tmp_path / 'run.ckpt'))
+    for index in (1, 3, 0):
+        ckpt.mark_done(index)
+    assert ckpt.offset == 2 and ckpt.done == {3}
+    ckpt.save()
+    loaded = Checkpoint.load(ckpt.path)
+    assert loaded.is_done(0) and loaded.is_done(3) and not loaded.is_done(2)
+
+def test_checkpoint_retry(tmp_path):
+    ckpt = Checkpoint(str(tmp_path / 'run.ckpt'))
+    for index in (0, 2):
+        ckpt.mark_done(index)
+    ckpt.mark_done(1, retry=True)
+    assert ckpt.offset == 3 and ckpt.retry == {1}
+    ckpt.save()
+    loaded = Checkpoint.load(ckpt.path)
+    assert [loaded.is_done(i) for i in range(3)] == [True, False, True]
+    loaded.mark_done(1)
+    assert loaded.is_done(1) and loaded.offset == 3 and not loaded.retry
+
+def test_to_csv_row():
+    record = {'username': 'a', 'profile': {'name': 'A', 'public_repos': 2}, 'repo_count': 2,
+              'math_libraries': {'numpy': {'count': 1, 'repos': ['x']}},
+              'complexity': {'x': {'complexity_signals': ['graph'], 'score': 1}}, 'documentation': {}}
+    row = to_csv_row(record)
+    assert row['unique_libs'] == 1 and row['libraries'] == 'numpy'
+    assert row['avg_complexity_score'] == 1 and row['avg_doc_score'] == 0
+    assert to_csv_row({'username': 'b', 'error': 'boom'}) == {'username': 'b', 'error': 'boom'}
+
+def test_main_streams_jsonl(github_server, tmp_path):
+    names = ['u0', 'u1', 'u2']
+    _serve_users(github_server, names)
+    (tmp_path / 'in.txt').write_text('\n'.join(names))
+    out = tmp_path / 'out.jsonl'
+    assert main([str(tmp_path / 'in.txt'), '-o', str(out), '--api-url', github_server.url]) == 0
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(r['username'] for r in records) == names
+    assert all('numpy' in r['math_libraries'] for r in records)
+    assert json.loads((tmp_path / 'out.jsonl.ckpt').read_text()) == {'offset': 3, 'done': [], 'retry': []}
+
+def test_main_resumes_from_checkpoint(github_server, tmp_path):
+    names = ['u0', 'u1', 'u2', 'u3']
+    _serve_users(github_server, names)
+    (tmp_path / 'in.csv').write_text('username\n' + '\n'.join(names))
+    out = tmp_path / 'out.csv'
+    out.write_text('username,name\nu0,\n')
+    Checkpoint(str(out) + '.ckpt', offset=1, done={2}).save()
+    assert main([str(tmp_path / 'in.csv'), '-o', str(out), '--resume', '--api-url', github_server.url]) == 0
+    assert sorted(p for p in github_server.paths() if p.count('/') == 2) == ['/users/u1', '/users/u3']
+    lines = out.read_text().splitlines()
+    assert lines[0].startswith('username') and len(lines) == 4
+
+def test_main_stops_on_rate_limit(github_server, tmp_path):
+    github_server.route('/users/limited', lambda q, h: (
+        403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '4102444800'}, {}
+    ))
+    (tmp_path / 'in.txt').write_text('limited\n')
+    assert main([str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'o.jsonl'), '--api-url', github_server.url]) == 3
+
+def test_main_retries_transient_errors_on_resume(github_server, tmp_path):
+    _serve_users(github_server, ['u0'])
+    github_server.route('/users/gone', lambda q, h: (451, {}, {}))
+    flaky = {'status': 401}
+    github_server.route('/users/flaky', lambda q, h: (flaky['status'], {}, {'login': 'flaky'}))
+    github_server.route('/users/flaky/repos', lambda q, h: (200, {}, []))
+    (tmp_path / 'in.txt').write_text('u0\ngone\nflaky\n')
+    out = tmp_path / 'out.jsonl'
+    args = [str(tmp_path / 'in.txt'), '-o', str(out), '--api-url', github_server.url]
+    assert main(args) == 0
+    errors = {r['username']: r['status'] for r in map(json.loads, out.read_text().splitlines()) if 'error' in r}
+    assert errors == {'gone': 451, 'flaky': 401}
+    assert json.loads((tmp_path / 'out.jsonl.ckpt').read_text())['retry'] == [2]
+    flaky['status'] = 200
+    assert main(args + ['--resume']) == 0
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r['username'] for r in records[3:]] == ['flaky'] and 'error' not in records[3]
+    assert json.loads((tmp_path / 'out.jsonl.ckpt').read_text()) == {'offset': 3, 'done': [], 'retry': []}
+
+def test_main_resume_refuses_output_without_checkpoint(github_server, tmp_path, capsys):
+    (tmp_path / 'in.txt').write_text('u0\n')
+    out = tmp_path / 'out.jsonl'
+    out.write_text('{"username":"u0"}\n')
+    assert main([str(tmp_path / 'in.txt'), '-o', str(out), '--resume', '--api-url', github_server.url]) == 2
+    assert 'no checkpoint' in capsys.readouterr().err
+    assert out.read_text() == '{"username":"u0"}\n' and not github_server.paths()
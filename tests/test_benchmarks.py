@@ -0,0 +1,43 @@
+"""
+Smoke tests for the benchmark suite (keeps the benchmarks runnable; not a timing test)
+"""
+
+import inspect
+import json
+import os
+from benchmarks.generators import make_repos, make_resume_texts
+from benchmarks.run import compare, main, run_suite
+from benchmarks.suite import BENCHMARKS
+
+def test_generators_are_deterministic():
+    assert make_repos(20) == make_repos(20)
+    assert make_resume_texts(5, seed=3) == make_resume_texts(5, seed=3)
+    assert all('Skills' in text for text in make_resume_texts(5))
+
+def test_every_benchmark_runs_at_smallest_size():
+    for bench in BENCHMARKS:
+        size = None if bench.sizes == (None,) else min(bench.sizes)
+        with bench.prepare(size) as fn:
+            fn()
+
+def test_parse_to_jsonl_output_is_removed():
+    bench = next(b for b in BENCHMARKS if b.name.startswith('resume.parse_to_jsonl'))
+    with bench.prepare(None) as fn:
+        fn()
+        output = inspect.getclosurevars(fn).nonlocals['output']
+        assert os.path.exists(output)
+    assert not os.path.exists(os.path.dirname(output))
+
+def test_results_file_and_compare(tmp_path):
+    output = tmp_path / 'run.json'
+    assert main(['--sizes', '10', '--filter', 'github.analyze_all', '--repeat', '1', '--output', str(output)]) == 0
+    record = json.loads(output.read_text())
+    assert set(record['results']['github.analyze_all']) == {'10'}
+    slower = {'results': {'github.analyze_all': {'10': {'median': record['results']['github.analyze_all']['10']['median'] * 10}}}}
+    lines, regressions = compare(record, slower, threshold=1.2)
+    assert regressions == 1 and 'REGRESSION' in lines[0]
+    assert compare(slower, record, threshold=1.2)[1] == 0
+
+def test_run_suite_filters():
+    results = run_suite(sizes=(10,), name_filter='resume.extract_skills', repeat=1)
+    assert list(results) == ['resume.extract_skills']
@@ -0,0 +1,73 @@
+"""
+Unit tests for candidate_index.py
+"""
+
+import pytest
+from src.candidate_index import CandidateIndex, to_fts_query
+
+ADA = {'skills': ['PyTorch', 'Convex Optimization', 'C++'], 'education': ['PhD Mathematics'],
+       'experience': ['Built convex optimization solvers for logistics']}
+GRACE = {'skills': ['COBOL', 'Compilers'], 'education': ['PhD Mathematics'],
+         'experience': ['Optimization of convex compilers']}
+ALAN_REPOS = [{'name': 'enigma', 'description': 'Cryptanalysis with pytorch', 'topics': ['cryptography'], 'language': 'Python'}]
+
+@pytest.fixture
+def index(tmp_path):
+    idx = CandidateIndex(str(tmp_path / 'candidates.sqlite'))
+    idx.add('ada', resume=ADA)
+    idx.add('grace', resume=GRACE)
+    idx.add('alan', repos=ALAN_REPOS)
+    yield idx
+    idx.close()
+
+def test_boolean_and_phrase_queries(index):
+    assert index.match('pytorch') == ['ada', 'alan']
+    assert index.match('"convex optimization" pytorch') == ['ada']
+    # Phrase matching uses positions: 'optimization of convex' is not the phrase
+    assert index.match('"convex optimization"') == ['ada']
+    assert index.match('convex optimization') == ['ada', 'grace']
+    assert index.match('cobol OR cryptography') == ['alan', 'grace']
+    assert index.match('mathematics -cobol') == ['ada']
+    assert index.match('skills:pytorch') == ['ada']
+    assert index.match('c++') == ['ada']
+
+def test_ranked_search(index):
+    results = index.search('convex optimization')
+    assert [candidate for candidate, _ in results] == ['ada', 'grace']
+    assert results[0][1] > results[1][1] > 0
+    assert len(index.search('mathematics', limit=1)) == 1
+
+def test_reindex_and_delete(index, tmp_path):
+    index.add('grace', resume={**GRACE, 'skills': ['PyTorch']})
+    assert index.match('pytorch') == ['ada', 'alan', 'grace']
+    assert index.match('cobol') == []
+    assert index.delete('alan') and not index.delete('alan')
+    assert 'alan' not in index and len(index) == 2
+    index.close()
+    reopened = CandidateIndex(str(tmp_path / 'candidates.sqlite'))
+    assert reopened.match('pytorch') == ['ada', 'grace']
+    reopened.close()
+
+def test_query_translation():
+    assert to_fts_query('a "b c"') == '"a" AND "b c"'
+    assert to_fts_query('a OR b -c') == '(("a" OR "b")) NOT "c"'
+    assert to_fts_query('AND NEAR(') == '"AND" AND "NEAR("'
+    assert to_fts_query('python ! ml - "..."') == '"python" AND "ml"'
+    assert to_fts_query('c++ c#') == '"c++" AND "c#"'
+    with pytest.raises(ValueError):
+        to_fts_query('-only')
+    with pytest.raises(ValueError):
+        to_fts_query('salary:high')
+    with pytest.raises(ValueError):
+        to_fts_query('! -')
+
+def test_punctuation_terms_do_not_empty_the_match(index):
+    assert index.match('pytorch !') == index.match('pytorch') == ['ada', 'alan']
+    index.close()
+
+def test_bulk_add(tmp_path):
+    idx = CandidateIndex(str(tmp_path / 'bulk.sqlite'))
+    count = idx.add_many((f"c{i}", {'skills': ['numpy' if i % 2 else 'scipy']}, None) for i in range(500))
+    idx.optimize()
+    assert count == 500 and len(idx.match('numpy')) == 250
+    idx.close()
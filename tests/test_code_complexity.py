@@ -0,0 +1,118 @@
+"""
+Unit tests for code_complexity.py
+"""
+
+import pytest
+
+pytest.importorskip('radon')
+
+from src.code_complexity import (
+    EMPTY_METRICS, CodeComplexityAnalyzer, blob_sha, combine, source_metrics,
+)
+
+BRANCHY = '''
+def classify(x):
+    if x < 0:
+        return "negative"
+    elif x == 0:
+        return "zero"
+    for i in range(x):
+        if i % 7 == 0:
+            return "lucky"
+    return "positive"
+
+class Solver:
+    def solve(self, a, b):
+        return a / b if b else None
+'''
+SIMPLE = 'def add(a, b):\n    return a + b\n'
+
+
+@pytest.fixture
+def repo_server(repo_server):
+    repo_server.repo.update(sha='c1', files={'branchy.py': BRANCHY, 'simple.py': SIMPLE, 'broken.py': 'def (:\n'})
+    return repo_server
+
+
+CALC = {'name': 'calc', 'full_name': 'octo/calc', 'default_branch': 'main', 'language': 'Python'}
+
+
+def test_source_metrics():
+    metrics = source_metrics(BRANCHY)
+    assert metrics.functions == 2
+    assert metrics.max_complexity == 5 and metrics.complexity_total == 7
+    assert 0 < metrics.maintainability <= 100
+    assert metrics.halstead_volume > 0 and metrics.sloc == 12
+    assert source_metrics('def (:') is None
+    assert source_metrics('x = 1' + ' + 1' * 200_000 + '\n') is None  # generated code nested too deeply
+
+
+def test_combine_weights_maintainability_by_sloc():
+    big, small = source_metrics(BRANCHY), source_metrics(SIMPLE)
+    total = combine([big, small])
+    assert total.files == 2 and total.functions == 3
+    assert total.avg_complexity == pytest.approx(8 / 3)
+    expected = (big.maintainability * big.sloc + small.maintainability * small.sloc) / (big.sloc + small.sloc)
+    assert total.maintainability == pytest.approx(expected)
+    assert combine([]) == EMPTY_METRICS and EMPTY_METRICS.rank == 'A'
+
+
+def test_blob_sha_matches_git():
+    assert blob_sha(b'hello\n') == 'ce013625030ba8dba906f756967f9e9ca394464a'
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_analyze_repo(repo_server, make_stage, workers):
+    with make_stage(CodeComplexityAnalyzer, repo_server, workers=workers) as analyzer:
+        result = analyzer.analyze_repo(CALC)
+    assert result.sha == 'c1' and not result.truncated
+    assert result.metrics == combine([source_metrics(BRANCHY), source_metrics(SIMPLE)])
+    assert analyzer.files_analyzed == 3
+
+
+def test_push_only_reanalyzes_changed_files(repo_server, tmp_path, make_stage):
+    with make_stage(CodeComplexityAnalyzer, repo_server) as analyzer:
+        first = analyzer.analyze_repo(CALC)
+        assert analyzer.analyze_repo(CALC) == first
+        assert repo_server.paths().count('/repos/octo/calc/tarball/c1') == 1
+        repo_server.repo['sha'] = 'c2'
+        repo_server.repo['files'] = {**repo_server.repo['files'], 'simple.py': SIMPLE + SIMPLE.replace('add', 'sub')}
+        analyzer.files_analyzed = 0
+        second = analyzer.analyze_repo(CALC)
+    assert analyzer.files_analyzed == 1 and analyzer.files_reused == 2
+    assert second.metrics.functions == first.metrics.functions + 1
+    # Only the changed blob is downloaded; the archive is not streamed again
+    assert analyzer.blobs_fetched == 1 and '/repos/octo/calc/tarball/c2' not in repo_server.paths()
+    assert sum('/git/blobs/' in path for path in repo_server.paths()) == 1
+    with make_stage(CodeComplexityAnalyzer, repo_server, cache_dir=tmp_path / 'cold') as cold:
+        assert cold.analyze_repo(CALC) == second  # same result as streaming the whole archive
+
+
+def test_tree_listing_applies_the_archive_limits(repo_server, make_stage):
+    with make_stage(CodeComplexityAnalyzer, repo_server) as analyzer:
+        analyzer.analyze_repo(CALC)
+    repo_server.repo['sha'] = 'c2'
+    repo_server.repo['files'] = {**repo_server.repo['files'], 'venv/lib/dep.py': SIMPLE, 'z.py': SIMPLE + '#' * 4096}
+    with make_stage(CodeComplexityAnalyzer, repo_server, max_file_bytes=1024) as analyzer:
+        result = analyzer.analyze_repo(CALC)
+    assert result.metrics.files == 2 and analyzer.blobs_fetched == 0
+    repo_server.repo['sha'] = 'c3'
+    with make_stage(CodeComplexityAnalyzer, repo_server, max_total_bytes=len(BRANCHY) + 20) as analyzer:
+        assert analyzer.analyze_repo(CALC).truncated
+
+
+def test_analyze_candidate_skips_other_languages(repo_server, make_stage):
+    repos = [CALC, {'name': 'site', 'language': 'JavaScript'}]
+    with make_stage(CodeComplexityAnalyzer, repo_server) as analyzer:
+        assert set(analyzer.analyze(repos)) == {'calc'}
+        assert analyzer.analyze_candidate(repos) == analyzer.analyze_repo(CALC).metrics
+
+
+def test_failing_repo_does_not_abort_the_analysis(repo_server, make_stage):
+    repo_server.route('/repos/octo/gone/commits/main', lambda q, h: (200, {}, {'sha': 'g1'}))
+    repo_server.route('/repos/octo/gone/tarball/g1', lambda q, h: (451, {}, {'message': 'Unavailable'}))
+    gone = {**CALC, 'name': 'gone', 'full_name': 'octo/gone'}
+    with make_stage(CodeComplexityAnalyzer, repo_server) as analyzer:
+        results = analyzer.analyze([gone, CALC])
+    assert set(results) == {'calc'} and results['calc'].metrics.functions == 3
+    assert set(analyzer.failed) == {'gone'} and '451' in analyzer.failed['gone']
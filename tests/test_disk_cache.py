@@ -0,0 +1,53 @@
+"""
+Unit tests for disk_cache.py
+"""
+
+import pytest
+from src.disk_cache import DiskCache
+
+@pytest.fixture
+def cache(tmp_path):
+    c = DiskCache(str(tmp_path / 'cache.sqlite'), max_bytes=10_000)
+    yield c
+    c.close()
+
+def test_set_get_roundtrip(cache):
+    assert cache.get('missing') is None
+    cache.set('k', {'a': [1, 2, 3]})
+    assert cache.get('k') == {'a': [1, 2, 3]}
+    entry = cache.get_entry('k')
+    assert entry.value == {'a': [1, 2, 3]} and entry.stored_at > 0
+    stats = cache.stats()
+    assert stats['hits'] == 2 and stats['misses'] == 1
+    assert stats['entries'] == 1
+
+def test_overwrite_tracks_size(cache):
+    cache.set('k', 'x' * 100)
+    size = cache.size_bytes
+    cache.set('k', 'x' * 10)
+    assert cache.size_bytes < size
+    cache.delete('k')
+    assert cache.size_bytes == 0 and len(cache) == 0
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = DiskCache(str(tmp_path / 'small.sqlite'), max_bytes=1000)
+    for i in range(4):
+        cache.set(f'k{i}', 'v' * 200)
+    # Touch the oldest entry so it survives eviction
+    assert cache.get('k0') is not None
+    cache.set('k4', 'v' * 200)
+    assert cache.size_bytes <= 1000
+    assert cache.get('k0') is not None
+    assert cache.get('k1') is None
+    assert cache.stats()['evictions'] >= 1
+    cache.close()
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / 'persist.sqlite')
+    first = DiskCache(path)
+    first.set('k', 42)
+    first.close()
+    second = DiskCache(path)
+    assert second.get('k') == 42
+    assert second.size_bytes > 0
+    second.close()
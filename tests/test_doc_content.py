@@ -0,0 +1,119 @@
+"""
+Unit tests for doc_content.py
+"""
+
+import base64
+
+import pytest
+
+from src.doc_content import DocContentFetcher, count_equations, count_references, decode_content
+from src.http_cache import HTTPCache
+
+README = r"""
+# Convex solver
+
+Background and theory: we solve $\min_x f(x)$ subject to constraints, see the proof of convergence.
+
+$$
+x_{k+1} = x_k - \alpha \nabla f(x_k)
+$$
+
+Costs $5 and $10 are not math.
+
+## References
+- Boyd & Vandenberghe, https://doi.org/10.1017/CBO9780511804441
+- arXiv:1405.4980 and https://arxiv.org/abs/1405.4980v2
+"""
+DOCS_INDEX = r"""
+Derivation in \cite{nesterov2004} uses
+\begin{equation} L = \sum_i \ell_i \end{equation}
+"""
+
+
+def encoded(text, sha):
+    return {'sha': sha, 'encoding': 'base64', 'content': base64.b64encode(text.encode()).decode()}
+
+
+def test_equation_and_reference_counts():
+    assert count_equations(README) == 2
+    assert count_equations('Prices: $5 and $10, or $ x $.') == 0
+    assert count_equations(DOCS_INDEX) == 1
+    assert count_equations('```math\na^2 + b^2\n```\nand \\(e^{i\\pi}\\)') == 2
+    assert count_references(README) == 3
+    assert count_references(DOCS_INDEX) == 1
+    assert decode_content(encoded('hi', 'x')) == 'hi' and decode_content(None) is None
+
+
+@pytest.fixture
+def docs_server(github_server):
+    github_server.route('/repos/octo/solver/readme', lambda q, h: (200, {'ETag': '"r1"'}, encoded(README, 'r1')))
+    github_server.route('/repos/octo/solver/contents/docs', lambda q, h: (200, {}, [
+        {'name': 'api', 'type': 'dir', 'sha': 'd0'},
+        {'name': 'index.md', 'type': 'file', 'sha': 'd1', 'path': 'docs/index.md'},
+    ]))
+    github_server.route('/repos/octo/solver/contents/docs/index.md', lambda q, h: (200, {}, encoded(DOCS_INDEX, 'd1')))
+    github_server.route('/repos/octo/solver/git/blobs/r1', lambda q, h: (200, {}, encoded(README, 'r1')))
+    github_server.route('/repos/octo/solver/git/blobs/d1', lambda q, h: (200, {}, encoded(DOCS_INDEX, 'd1')))
+    return github_server
+
+
+def test_fetch_repo_over_rest(docs_server, make_stage):
+    with make_stage(DocContentFetcher, docs_server) as fetcher:
+        content = fetcher.fetch_repo({'name': 'solver'})
+    assert content.has_readme and content.readme_sha == 'r1'
+    assert content.docs_index == 'docs/index.md'
+    assert {'theory', 'proof', 'convergence', 'background', 'references', 'derivation'} <= set(content.keywords)
+    assert (content.equations, content.references) == (3, 4)
+
+
+def test_missing_docs(github_server, make_stage):
+    with make_stage(DocContentFetcher, github_server) as fetcher:
+        content = fetcher.fetch_repo({'name': 'bare'})
+    assert not content.has_readme and content.docs_index is None and content.keywords == ()
+
+
+def test_known_blob_shas_need_no_requests_once_cached(docs_server, make_stage):
+    repo = {'name': 'solver', 'has_readme': True, 'readme_sha': 'r1',
+            'docs_index_path': 'docs/index.md', 'docs_index_sha': 'd1'}
+    with make_stage(DocContentFetcher, docs_server) as fetcher:
+        first = fetcher.fetch_repo(repo)
+    assert sorted(docs_server.paths()) == ['/repos/octo/solver/git/blobs/d1', '/repos/octo/solver/git/blobs/r1']
+    docs_server.requests.clear()
+    with make_stage(DocContentFetcher, docs_server) as fetcher:
+        assert fetcher.fetch_repo(repo) == first
+        assert fetcher.fetch_repo({**repo, 'has_readme': False, 'docs_index_path': None}).keywords == ()
+    assert docs_server.requests == []
+
+
+def test_unchanged_readme_is_revalidated_not_rescanned(docs_server, tmp_path, make_stage):
+    cache = HTTPCache(str(tmp_path / 'http.sqlite'), ttl=0)
+    with make_stage(DocContentFetcher, docs_server, analyzer_kwargs={'cache': cache}) as fetcher:
+        fetcher.fetch_repo({'name': 'solver', 'docs_index_path': None})
+        fetcher.fetch_repo({'name': 'solver', 'docs_index_path': None})
+    readme_requests = [r for r in docs_server.requests if r['path'] == '/repos/octo/solver/readme']
+    assert len(readme_requests) == 2 and readme_requests[1]['headers'].get('If-None-Match') == '"r1"'
+
+
+def test_annotate_feeds_documentation_score(docs_server, make_stage):
+    repos = [{'name': 'solver', 'description': 'Solver'}, {'name': 'bare', 'description': ''}]
+    with make_stage(DocContentFetcher, docs_server) as fetcher:
+        annotated = fetcher.annotate(repos)
+        documentation = fetcher.analyzer.analyze_all(annotated).documentation
+    assert annotated[0]['has_readme'] and not annotated[1]['has_readme']
+    notes = documentation['solver']['notes']
+    assert 'README detected' in notes and 'docs/ index' in notes
+    assert 'Equations (3)' in notes and 'References (4)' in notes
+    keywords = len(annotated[0]['doc_content']['keywords'])
+    assert documentation['solver']['score'] == 2 + keywords + 1 + 1 + 1
+    assert 'bare' not in documentation
+
+
+def test_failing_readme_falls_back_to_empty_content(docs_server, make_stage):
+    docs_server.route('/repos/octo/broken/git/blobs/b1', lambda q, h: (500, {}, {'message': 'Server Error'}))
+    broken = {'name': 'broken', 'has_readme': True, 'readme_sha': 'b1', 'docs_index_path': None}
+    with make_stage(DocContentFetcher, docs_server) as fetcher:
+        fetcher.analyzer.max_retries = 0
+        contents = fetcher.fetch([broken, {'name': 'solver'}])
+    assert contents['broken'].keywords == () and contents['broken'].equations == 0
+    assert contents['solver'].has_readme and contents['solver'].references == 4
+    assert set(fetcher.failed) == {'broken'} and '500' in fetcher.failed['broken']
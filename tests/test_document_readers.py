@@ -0,0 +1,83 @@
+"""
+Unit tests for document_readers.py
+"""
+
+import shutil
+import zipfile
+import pytest
+from src.document_readers import DOCX, PDF, TEXT, decode_text, iter_docx_paragraphs, read_text_file, sniff_format
+from src.resume_parser import ResumeParser
+
+DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    '<w:p><w:r><w:t>Ada Lovelace</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>Education</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t xml:space="preserve">B.Sc. </w:t></w:r><w:r><w:t>Mathematics</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>Skills</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>Python,</w:t><w:tab/><w:t>NumPy</w:t></w:r></w:p>'
+    '</w:body></w:document>'
+)
+
+def write_docx(path, xml=DOCUMENT_XML):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('[Content_Types].xml', '<Types/>')
+        archive.writestr('word/document.xml', xml)
+    return str(path)
+
+def test_sniff_binary_formats_by_content(tmp_path):
+    assert sniff_format(write_docx(tmp_path / 'resume.pdf')) == DOCX
+    (tmp_path / 'resume.docx').write_bytes(b'\n\n%PDF-1.7 ...')
+    assert sniff_format(str(tmp_path / 'resume.docx')) == PDF
+    (tmp_path / 'image.png').write_bytes(b'\x89PNG\r\n\x1a\n\x00\x00')
+    assert sniff_format(str(tmp_path / 'image.png')) is None
+    with zipfile.ZipFile(tmp_path / 'other.zip', 'w') as archive:
+        archive.writestr('readme.txt', 'hi')
+    assert sniff_format(str(tmp_path / 'other.zip')) is None
+    (tmp_path / 'empty.txt').write_bytes(b'')
+    assert sniff_format(str(tmp_path / 'empty.txt')) is None
+
+def test_sniff_text_needs_text_extension(tmp_path):
+    for name in ('resume.txt', 'RESUME.MD', 'resume.bin', 'data.csv', 'package.json', 'noext'):
+        (tmp_path / name).write_text('Ada Lovelace\nSkills\nPython', encoding='utf-8')
+    found = sorted(p.name for p in tmp_path.iterdir() if sniff_format(str(p)) == TEXT)
+    assert found == ['RESUME.MD', 'resume.txt']
+    (tmp_path / 'utf16.txt').write_text('Ada Lovelace\nSkills\nPython', encoding='utf-16')
+    assert sniff_format(str(tmp_path / 'utf16.txt')) == TEXT
+    (tmp_path / 'blob.txt').write_bytes(b'\x00\x01\x02binary')
+    assert sniff_format(str(tmp_path / 'blob.txt')) is None
+
+def test_docx_paragraphs(tmp_path):
+    lines = list(iter_docx_paragraphs(write_docx(tmp_path / 'a.docx')))
+    assert lines == ['Ada Lovelace\n', 'Education\n', 'B.Sc. Mathematics\n', 'Skills\n', 'Python,\tNumPy\n']
+
+def test_read_text_file(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_bytes('﻿Ada — Lovelace\n'.encode('utf-8') + b'\xff')
+    assert read_text_file(str(path)) == 'Ada — Lovelace\n�'
+
+def test_decode_text_encodings():
+    text = 'José Núñez\nSkills\nÉtale cohomology\n'
+    assert decode_text(text.encode('utf-16')) == text
+    assert decode_text(b'\xfe\xff' + text.encode('utf-16-be')) == text
+    assert decode_text(text.encode('latin-1')) == text
+    assert decode_text('Ada’s résumé'.encode('cp1252')) == 'Ada’s résumé'
+    assert decode_text(b'\x81\x8d Ada') == '\x81\x8d Ada'
+
+def test_mixed_format_folder(tmp_path):
+    pdfs = ResumeParser().get_pdf_files()
+    if not pdfs:
+        pytest.skip("No sample PDF resumes present for mixed-format test.")
+    shutil.copy(pdfs[0], tmp_path / 'scan')
+    write_docx(tmp_path / 'ada.docx')
+    (tmp_path / 'grace.txt').write_text('Grace Hopper\nSkills\nCOBOL, Compilers\n', encoding='utf-8')
+    (tmp_path / 'photo.jpg').write_bytes(b'\xff\xd8\xff\xe0\x00\x10JFIF\x00')
+    parser = ResumeParser(str(tmp_path))
+    assert sorted(p.rsplit('/', 1)[-1] for p in parser.get_resume_files()) == ['ada.docx', 'grace.txt', 'scan']
+    for workers in (1, 2):
+        results = {r['filename']: r for r in parser.batch_parse(workers=workers)}
+        assert set(results) == {'ada.docx', 'grace.txt', 'scan'}
+        assert not any('error' in r for r in results.values())
+        assert results['ada.docx']['education'] == ['B.Sc. Mathematics']
+        assert results['ada.docx']['skills'] == ['Python', 'NumPy']
+        assert results['grace.txt']['skills'] == ['COBOL', 'Compilers']
@@ -0,0 +1,67 @@
+"""
+Unit tests for extraction_cache.py
+"""
+
+import os
+import shutil
+import pytest
+from src.extraction_cache import ExtractionCache
+from src.resume_parser import ResumeParser, SAMPLE_RESUME_DIR
+
+@pytest.fixture
+def resume_dir(tmp_path):
+    target = tmp_path / 'resumes'
+    target.mkdir()
+    for name in sorted(os.listdir(SAMPLE_RESUME_DIR))[:2]:
+        if name.lower().endswith('.pdf'):
+            shutil.copy(os.path.join(SAMPLE_RESUME_DIR, name), target / name)
+    if not os.listdir(target):
+        pytest.skip("No sample PDF resumes present for cache tests.")
+    return target
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ExtractionCache(str(tmp_path / 'extraction.sqlite'))
+    yield c
+    c.close()
+
+def test_rerun_hits_cache(resume_dir, cache, monkeypatch):
+    parser = ResumeParser(str(resume_dir), cache=cache)
+    first = parser.batch_parse()
+    assert cache.stats()['misses'] == len(first) and cache.stats()['hits'] == 0
+
+    def fail(*args):
+        raise AssertionError("extract_text should not run on a cache hit")
+    monkeypatch.setattr(ResumeParser, 'extract_text', fail)
+    assert parser.batch_parse() == first
+    assert cache.stats()['hits'] == len(first)
+    assert 'hits' in cache.report()
+
+def test_copied_file_hits_and_modified_file_misses(resume_dir, cache):
+    parser = ResumeParser(str(resume_dir), cache=cache)
+    original = parser.get_pdf_files()[0]
+    parser.parse_file(original)
+    copy = str(resume_dir / 'copy.pdf')
+    shutil.copy(original, copy)
+    record = parser.parse_file(copy)
+    assert cache.hits == 1 and record['filename'] == 'copy.pdf'
+    with open(copy, 'ab') as f:
+        f.write(b'\n% trailing bytes\n')
+    parser.parse_file(copy)
+    assert cache.hits == 1 and cache.misses == 2
+
+def test_errors_are_not_cached(tmp_path, cache):
+    (tmp_path / 'broken.pdf').write_bytes(b'%PDF-1.4 truncated')
+    parser = ResumeParser(str(tmp_path), cache=cache)
+    assert 'error' in parser.parse_file(str(tmp_path / 'broken.pdf'))
+    assert 'error' in parser.parse_file(str(tmp_path / 'broken.pdf'))
+    assert cache.hits == 0
+
+def test_parallel_parse_uses_cache(resume_dir, cache):
+    parser = ResumeParser(str(resume_dir), cache=cache)
+    serial = parser.batch_parse()
+    parallel = parser.batch_parse(workers=2, chunksize=1)
+    assert parallel == serial
+    assert cache.hits == len(serial)
+    records = list(parser.iter_parse(workers=2, keep_raw_text=False, ordered=False))
+    assert all('raw_text' not in r for r in records)
@@ -167,3 +167,170 @@ def test_analyze_documentation(analyzer):
     }]
     out = analyzer.analyze_documentation(repos)
     assert out == {}
+
+def _serve_repos(server, username, total, per_page_limit=100):
+    """Serve `total` fake repos for `username` with GitHub-style Link headers."""
+    repos = [{'id': i, 'name': f'repo{i}', 'html_url': f'https://github.com/{username}/repo{i}'} for i in range(total)]
+
+    def profile(query, headers):
+        return 200, {}, {'login': username, 'public_repos': total}
+
+    def repo_page(query, headers):
+        per_page = min(int(query.get('per_page', 30)), per_page_limit)
+        page = int(query.get('page', 1))
+        last = max(1, -(-total // per_page))
+        links = []
+        base = f"{server.url}/users/{username}/repos?per_page={per_page}"
+        if page < last:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}&page={last}>; rel="last"')
+        return 200, {'Link': ', '.join(links)} if links else {}, repos[(page - 1) * per_page:page * per_page]
+
+    server.route(f'/users/{username}', profile)
+    server.route(f'/users/{username}/repos', repo_page)
+    return repos
+
+def test_fetch_repos_paginates_with_known_count(github_server):
+    expected = _serve_repos(github_server, 'prolific', 450)
+    analyzer = GitHubAnalyzer('prolific', api_url=github_server.url, max_workers=4)
+    assert analyzer.fetch_profile()['public_repos'] == 450
+    repos = analyzer.fetch_repos()
+    assert [r['id'] for r in repos] == [r['id'] for r in expected]
+    pages = sorted(int(r['query']['page']) for r in github_server.requests if r['path'].endswith('/repos'))
+    assert pages == [1, 2, 3, 4, 5]
+    assert all(r['query']['per_page'] == '100' for r in github_server.requests if r['path'].endswith('/repos'))
+
+def test_fetch_repos_uses_last_link_without_profile(github_server):
+    expected = _serve_repos(github_server, 'nocount', 250)
+    analyzer = GitHubAnalyzer('nocount', api_url=github_server.url)
+    repos = analyzer.fetch_repos()
+    assert len(repos) == len(expected) == 250
+    assert github_server.paths().count('/users/nocount/repos') == 3
+
+def test_fetch_repos_follows_next_past_stale_count(github_server):
+    _serve_repos(github_server, 'growing', 230)
+    analyzer = GitHubAnalyzer('growing', api_url=github_server.url)
+    # Profile count is stale: only two pages expected, but a third exists
+    repos = analyzer.fetch_repos(public_repos=150)
+    assert len(repos) == 230
+    assert len({r['id'] for r in repos}) == 230
+
+def test_fetch_repos_empty_and_missing_user(github_server):
+    _serve_repos(github_server, 'newbie', 0)
+    assert GitHubAnalyzer('newbie', api_url=github_server.url).fetch_repos() == []
+    assert GitHubAnalyzer('ghost', api_url=github_server.url).fetch_repos() == []
+
+from src.github_client import GitHubAPIError, RateLimiter, RateLimitError, create_session
+
+def _isolated(server, username, **kwargs):
+    """Analyzer with its own session and budget so tests don't share rate-limit state."""
+    return GitHubAnalyzer(username, api_url=server.url, session=create_session(),
+                          rate_limiter=RateLimiter(), token='', **kwargs)
+
+def test_rate_limited_profile_raises_structured_error(github_server):
+    github_server.route('/users/limited', lambda q, h: (
+        403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '4102444800'}, {'message': 'API rate limit exceeded'}
+    ))
+    analyzer = _isolated(github_server, 'limited')
+    with pytest.raises(RateLimitError) as excinfo:
+        analyzer.fetch_profile()
+    assert excinfo.value.reset_at == 4102444800
+    assert len(github_server.requests) == 1
+    # The exhausted budget is remembered: no further requests are sent
+    with pytest.raises(RateLimitError):
+        analyzer.fetch_repos()
+    assert len(github_server.requests) == 1
+
+def test_transient_errors_are_retried(github_server, monkeypatch):
+    monkeypatch.setattr('src.github_analyzer.backoff_delay', lambda attempt: 0)
+    calls = []
+    def flaky(query, headers):
+        calls.append(1)
+        return (502, {}, {'message': 'bad gateway'}) if len(calls) < 3 else (200, {}, {'login': 'flaky'})
+    github_server.route('/users/flaky', flaky)
+    assert _isolated(github_server, 'flaky').fetch_profile() == {'login': 'flaky'}
+    assert len(calls) == 3
+
+def test_persistent_errors_raise(github_server, monkeypatch):
+    monkeypatch.setattr('src.github_analyzer.backoff_delay', lambda attempt: 0)
+    github_server.route('/users/broken', lambda q, h: (500, {}, {'message': 'boom'}))
+    with pytest.raises(GitHubAPIError) as excinfo:
+        _isolated(github_server, 'broken', max_retries=2).fetch_profile()
+    assert excinfo.value.status == 500
+    assert github_server.paths().count('/users/broken') == 3
+
+def test_missing_user_returns_empty_profile(github_server):
+    assert _isolated(github_server, 'nobody').fetch_profile() == {}
+
+def test_token_is_sent(github_server):
+    github_server.route('/users/octo', lambda q, h: (200, {}, {'login': 'octo'}))
+    GitHubAnalyzer('octo', api_url=github_server.url, token='secret').fetch_profile()
+    assert github_server.requests[-1]['headers'].get('Authorization') == 'Bearer secret'
+
+import dataclasses
+
+def test_analyze_all_matches_individual_metrics(analyzer):
+    repos = [
+        {'name': 'solver', 'topics': ['convex', 'cvxpy'], 'description': 'Convex optimization with numpy; proofs of convergence.',
+         'language': 'Python', 'has_wiki': True},
+        {'name': 'graph-theory', 'topics': [], 'description': None, 'language': None},
+        {'name': 'plain', 'description': ''},
+    ]
+    analysis = analyzer.analyze_all(repos)
+    assert analysis.math_libraries == analyzer.analyze_math_libraries(repos)
+    assert analysis.complexity == analyzer.analyze_repo_complexity(repos)
+    assert analysis.documentation == analyzer.analyze_documentation(repos)
+    assert set(analysis.math_libraries) == {'cvxpy', 'numpy'}
+    assert analysis.complexity['solver']['complexity_signals'] == ['optimization', 'convex']
+    assert analysis.complexity['graph-theory']['score'] == 2
+    assert 'plain' not in analysis.documentation
+
+def test_analyze_all_aggregates_and_immutability(analyzer):
+    repos = [
+        {'name': 'a', 'description': 'graph', 'topics': []},
+        {'name': 'b', 'description': 'convex optimization theory stochastic', 'topics': [], 'has_readme': True},
+    ]
+    analysis = analyzer.analyze_all(repos)
+    assert analysis.complexity_levels == [1, 3]
+    assert analysis.avg_complexity_level == 2
+    assert analysis.avg_doc_score == (2 + 2) / 1
+    assert analysis.unique_libs == 0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        analysis.complexity = {}
+    assert set(analysis.to_dict()) == {'math_libraries', 'complexity', 'documentation'}
+
+def test_fetch_freshness_key_tracks_pushes(github_server):
+    state = {'pushed_at': '2024-01-01T00:00:00Z'}
+    github_server.route('/users/octo', lambda q, h: (200, {}, {'updated_at': '2023-05-01T00:00:00Z', 'public_repos': 3}))
+    github_server.route('/users/octo/repos', lambda q, h: (200, {}, [{'id': 1, 'pushed_at': state['pushed_at']}]))
+    analyzer = GitHubAnalyzer('octo', api_url=github_server.url)
+    first = analyzer.fetch_freshness_key()
+    assert first == '2023-05-01T00:00:00Z|3|2024-01-01T00:00:00Z'
+    assert github_server.requests[-1]['query'] == {'sort': 'pushed', 'per_page': '1'}
+    state['pushed_at'] = '2024-02-01T00:00:00Z'
+    assert analyzer.fetch_freshness_key() != first
+
+def test_repo_frame_has_one_row_per_repo(analyzer):
+    repos = [
+        {'name': 'solver', 'description': 'convex optimization with numpy', 'topics': ['cvxpy'],
+         'created_at': '2023-03-01T00:00:00Z', 'has_readme': True},
+        {'name': 'plain', 'description': '', 'topics': [], 'created_at': '2021-01-01T00:00:00Z'},
+        {'name': 'undated', 'description': 'graph tools', 'topics': []},
+    ]
+    analysis = analyzer.analyze_all(repos)
+    frame = analysis.repo_frame
+    assert list(frame['repository']) == ['solver', 'plain', 'undated']
+    solver = frame.iloc[0]
+    assert solver['math'] == 2 and set(solver['libraries']) == {'numpy', 'cvxpy'}
+    assert solver['complexity'] == len(analysis.complexity['solver']['complexity_signals'])
+    assert solver['documentation'] == analysis.documentation['solver']['score']
+    assert solver['total'] == solver['math'] + solver['complexity'] + solver['documentation']
+    assert frame.iloc[1][['math', 'complexity', 'documentation', 'total']].tolist() == [0, 0, 0, 0]
+    assert frame.iloc[2]['complexity_level'] == 1
+    assert str(frame['created_at'].dtype).startswith('datetime64')
+    assert frame['created_at'].isna().tolist() == [False, False, True]
+    assert analysis.repo_frame is frame
+
+def test_repo_frame_empty_analysis(analyzer):
+    frame = analyzer.analyze_all([]).repo_frame
+    assert frame.empty and 'total' in frame.columns
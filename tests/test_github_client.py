@@ -0,0 +1,64 @@
+"""
+Unit tests for github_client.py
+"""
+
+import pytest
+from src.github_client import (
+    RateLimiter, RateLimitError, backoff_delay, parse_links, rate_limit_reset,
+)
+
+def test_backoff_delay_is_jittered_and_capped():
+    for attempt in range(8):
+        delay = backoff_delay(attempt, base=0.5, cap=4.0)
+        assert 0 <= delay <= min(4.0, 0.5 * 2 ** attempt)
+
+def test_parse_links():
+    header = '<https://x/repos?page=2>; rel="next", <https://x/repos?page=5>; rel="last"'
+    assert parse_links(header) == {'next': 'https://x/repos?page=2', 'last': 'https://x/repos?page=5'}
+    assert parse_links(None) == {}
+
+def test_rate_limit_reset_detection():
+    now = 1000.0
+    assert rate_limit_reset(200, {}, now) is None
+    # Forbidden for reasons other than rate limiting
+    assert rate_limit_reset(403, {'X-RateLimit-Remaining': '12'}, now) is None
+    assert rate_limit_reset(403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1600'}, now) == 1600.0
+    assert rate_limit_reset(403, {'Retry-After': '30'}, now) == 1030.0
+    assert rate_limit_reset(429, {}, now) == 1060.0
+
+def test_rate_limiter_paces_low_budget():
+    limiter = RateLimiter(pace_below=100, max_wait=60)
+    assert limiter.delay(now=0) == 0.0  # no budget information yet
+    limiter.update({'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': '3600'})
+    assert limiter.delay(now=0) == 0.0
+    limiter.update({'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': '3600'})
+    assert limiter.delay(now=3500) == pytest.approx(10.0)
+    assert limiter.remaining == 9
+
+def test_rate_limiter_ignores_stale_windows():
+    limiter = RateLimiter()
+    limiter.update({'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '2000'})
+    limiter.update({'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': '1000'})
+    assert (limiter.remaining, limiter.reset_at) == (50, 2000.0)
+    limiter.update({'X-RateLimit-Remaining': '40', 'X-RateLimit-Reset': '2000'})
+    assert limiter.remaining == 40
+
+def test_rate_limiter_exhausted():
+    limiter = RateLimiter(max_wait=60)
+    limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1000'})
+    assert limiter.delay(now=990) == pytest.approx(10.0)
+    with pytest.raises(RateLimitError) as excinfo:
+        limiter.delay(now=0)
+    assert excinfo.value.reset_at == 1000.0
+    assert 'retry at 1970-01-01T00:16:40' in str(excinfo.value)
+    # Window has reset
+    assert limiter.delay(now=1001) == 0.0
+
+def test_rate_limiter_keeps_a_budget_per_resource():
+    limiter = RateLimiter(max_wait=60)
+    limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '5000', 'X-RateLimit-Resource': 'graphql'})
+    limiter.update({'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': '3600', 'X-RateLimit-Resource': 'core'})
+    assert limiter.budget('graphql') == (0, 5000.0) and limiter.budget('search') == (None, None)
+    assert limiter.delay(now=0) == 0.0 and limiter.remaining == 3999
+    with pytest.raises(RateLimitError):
+        limiter.delay(now=0, resource='graphql')
@@ -0,0 +1,145 @@
+"""
+Unit tests for github_graphql.py
+"""
+
+import json
+import os
+
+import pytest
+
+from src.github_analyzer import GitHubAnalyzer
+from src.github_client import GitHubAPIError, RateLimiter, RateLimitError
+from src.github_graphql import GitHubGraphQLAnalyzer, create_analyzer, graphql_url
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def serve(server, *, pages=('graphql_owner_page1.json', 'graphql_repos_page2.json')):
+    """Answer GraphQL queries from recorded responses, picking the page by cursor."""
+    by_cursor = {None: fixture(pages[0]), 'Y3Vyc29yOjI=': fixture(pages[-1])}
+
+    def handler(query, headers):
+        variables = json.loads(server.requests[-1]['body'])['variables']
+        return 200, {}, by_cursor[variables['after']]
+    server.route('/graphql', handler)
+
+
+def graphql_requests(server):
+    return [json.loads(r['body']) for r in server.requests if r['path'] == '/graphql']
+
+
+def test_profile_and_repos_in_two_requests(github_server):
+    serve(github_server)
+    analyzer = GitHubGraphQLAnalyzer('octo', api_url=github_server.url, token='t0ken')
+    profile = analyzer.fetch_profile()
+    repos = analyzer.fetch_repos()
+    assert profile['name'] == 'Octo Cat' and profile['public_repos'] == 3 and profile['followers'] == 120
+    assert profile['html_url'] == 'https://github.com/octo'
+    assert [r['name'] for r in repos] == ['convex-solver', 'dotfiles', 'graph-theory']
+    sent = graphql_requests(github_server)
+    assert len(sent) == 2
+    assert sent[0]['variables'] == {'login': 'octo', 'first': 100, 'after': None}
+    assert sent[1]['variables']['after'] == 'Y3Vyc29yOjI='
+    assert github_server.requests[0]['method'] == 'POST'
+    assert github_server.requests[0]['headers']['Authorization'] == 'Bearer t0ken'
+
+
+def test_repos_use_rest_field_names(github_server):
+    serve(github_server)
+    analyzer = GitHubGraphQLAnalyzer('octo', api_url=github_server.url, token='t')
+    solver, dotfiles, graphs = analyzer.fetch_repos()
+    assert solver['topics'] == ['optimization', 'cvxpy'] and solver['language'] == 'Python'
+    assert solver['created_at'] == '2019-04-01T09:00:00Z' and solver['pushed_at'] == '2024-02-28T17:30:00Z'
+    assert solver['has_readme'] and solver['readme_path'] == 'README.md'
+    assert solver['readme_sha'] == '9daeafb9864cf43055ae93beb0afd6c7d144bfa4'
+    assert solver['default_branch'] == 'main' and solver['full_name'] == 'octo/convex-solver'
+    assert not dotfiles['has_readme'] and 'readme_path' not in dotfiles
+    # Matched case-insensitively, Markdown first
+    assert graphs['readme_path'] == 'Readme.markdown' and graphs['language'] is None
+    assert graphs['readme_sha'] == 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+    assert solver['has_pages'] and not dotfiles['has_pages'] and not graphs['has_pages']
+    assert solver['docs_index_path'] == 'docs/index.md'
+    assert solver['docs_index_sha'] == '2c3f0b3e1a5c7d9e8f6a4b2c0d1e3f5a7b9c8d6e'
+    assert dotfiles['docs_index_path'] is None and dotfiles['docs_index_sha'] is None
+
+
+def test_readme_presence_reaches_documentation_score(github_server):
+    serve(github_server)
+    analyzer = GitHubGraphQLAnalyzer('octo', api_url=github_server.url, token='t')
+    documentation = analyzer.analyze_all(analyzer.fetch_repos()).documentation
+    assert 'README detected' in documentation['convex-solver']['notes']
+    assert 'README detected' in documentation['graph-theory']['notes']
+    assert 'dotfiles' not in documentation
+
+
+def test_pages_deployments_earn_the_pages_point(github_server):
+    serve(github_server)
+    analyzer = GitHubGraphQLAnalyzer('octo', api_url=github_server.url, token='t')
+    documentation = analyzer.analyze_all(analyzer.fetch_repos()).documentation
+    assert 'Pages enabled' in documentation['convex-solver']['notes']
+    assert 'Pages enabled' not in documentation['graph-theory']['notes']
+
+
+def test_single_page_user(github_server):
+    page = fixture('graphql_repos_page2.json')
+    page['data']['repositoryOwner'].update(login='solo', name='Solo')
+    github_server.route('/graphql', lambda q, h: (200, {}, page))
+    analyzer = GitHubGraphQLAnalyzer('solo', api_url=github_server.url, token='t')
+    analyzer.fetch_profile()
+    assert [r['name'] for r in analyzer.fetch_repos()] == ['graph-theory']
+    assert len(graphql_requests(github_server)) == 1
+
+
+def test_missing_user(github_server):
+    github_server.route('/graphql', lambda q, h: (200, {}, fixture('graphql_owner_missing.json')))
+    analyzer = GitHubGraphQLAnalyzer('ghost', api_url=github_server.url, token='t')
+    assert analyzer.fetch_profile() == {}
+    assert analyzer.fetch_repos() == []
+
+
+def test_errors(github_server):
+    github_server.route('/graphql', lambda q, h: (200, {'X-RateLimit-Reset': '4102444800'},
+                                                  fixture('graphql_rate_limited.json')))
+    analyzer = GitHubGraphQLAnalyzer('octo', api_url=github_server.url, token='t')
+    with pytest.raises(RateLimitError) as excinfo:
+        analyzer.fetch_profile()
+    assert excinfo.value.reset_at == 4102444800
+    github_server.route('/graphql', lambda q, h: (200, {}, {'errors': [{'message': 'Parse error'}]}))
+    with pytest.raises(GitHubAPIError, match='Parse error'):
+        analyzer.fetch_repos()
+    github_server.route('/graphql', lambda q, h: (401, {}, {'message': 'Bad credentials'}))
+    with pytest.raises(GitHubAPIError) as excinfo:
+        analyzer.fetch_profile()
+    assert excinfo.value.status == 401
+
+
+def test_exhausted_graphql_budget_does_not_delay_rest(github_server, monkeypatch):
+    serve(github_server)
+    github_server.routes['/graphql'] = lambda q, h, handler=github_server.routes['/graphql']: (
+        200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '4102444800', 'X-RateLimit-Resource': 'graphql'},
+        handler(q, h)[2]
+    )
+    github_server.route('/users/octo', lambda q, h: (200, {'X-RateLimit-Remaining': '4999', 'X-RateLimit-Reset':
+                                                           '4102444800', 'X-RateLimit-Resource': 'core'}, {}))
+    limiter = RateLimiter(max_wait=60)
+    analyzer = GitHubGraphQLAnalyzer('octo', api_url=github_server.url, token='t', rate_limiter=limiter)
+    analyzer.fetch_profile()
+    sleeps = []
+    monkeypatch.setattr('src.github_analyzer.time.sleep', sleeps.append)
+    analyzer._request(f"{github_server.url}/users/octo", {})
+    assert sleeps == [] and limiter.budget('graphql')[0] == 0
+    with pytest.raises(RateLimitError):
+        analyzer.fetch_repos()
+
+
+def test_graphql_url_and_factory():
+    assert graphql_url('https://api.github.com') == 'https://api.github.com/graphql'
+    assert graphql_url('https://ghe.example.com/api/v3/') == 'https://ghe.example.com/api/graphql'
+    assert isinstance(create_analyzer('octo', token='t'), GitHubGraphQLAnalyzer)
+    rest = create_analyzer('octo', token='')
+    assert type(rest) is GitHubAnalyzer
@@ -0,0 +1,64 @@
+"""
+Unit tests for http_cache.py
+"""
+
+import pytest
+from src.github_analyzer import GitHubAnalyzer
+from src.http_cache import HTTPCache
+
+@pytest.fixture
+def cache(tmp_path):
+    c = HTTPCache(str(tmp_path / 'http.sqlite'), ttl=60)
+    yield c
+    c.close()
+
+def _serve_profile(server, etag='"v1"'):
+    def profile(query, headers):
+        if headers.get('If-None-Match') == etag:
+            return 304, {'ETag': etag}, b''
+        return 200, {'ETag': etag, 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}, {'login': 'octo', 'public_repos': 0}
+    server.route('/users/octo', profile)
+
+def test_fresh_entries_skip_network(github_server, cache):
+    _serve_profile(github_server)
+    analyzer = GitHubAnalyzer('octo', api_url=github_server.url, cache=cache)
+    assert analyzer.fetch_profile()['login'] == 'octo'
+    assert analyzer.fetch_profile()['login'] == 'octo'
+    assert github_server.paths().count('/users/octo') == 1
+    stats = cache.stats()
+    assert stats['misses'] == 1 and stats['hits'] == 1 and stats['hit_rate'] == 0.5
+
+def test_stale_entries_revalidate_with_etag(github_server, cache):
+    _serve_profile(github_server)
+    analyzer = GitHubAnalyzer('octo', api_url=github_server.url, cache=cache)
+    analyzer.fetch_profile()
+    cache.ttl = 0
+    assert analyzer.fetch_profile()['login'] == 'octo'
+    second = github_server.requests[-1]
+    assert second['headers'].get('If-None-Match') == '"v1"'
+    assert second['headers'].get('If-Modified-Since') == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert cache.stats()['revalidated'] == 1
+
+def test_changed_resource_is_refetched(github_server, cache):
+    _serve_profile(github_server, etag='"v1"')
+    analyzer = GitHubAnalyzer('octo', api_url=github_server.url, cache=cache)
+    analyzer.fetch_profile()
+    _serve_profile(github_server, etag='"v2"')
+    cache.ttl = 0
+    analyzer.fetch_profile()
+    assert cache.stats()['misses'] == 2
+    assert cache.lookup(f"{github_server.url}/users/octo").value['headers']['ETag'] == '"v2"'
+
+def test_cached_pages_keep_link_headers(github_server, cache):
+    repos = [{'id': i, 'name': f'r{i}'} for i in range(150)]
+    def page(query, headers):
+        n = int(query['page'])
+        link = {'Link': f'<{github_server.url}/users/octo/repos?per_page=100&page=2>; rel="next", '
+                        f'<{github_server.url}/users/octo/repos?per_page=100&page=2>; rel="last"'} if n == 1 else {}
+        return 200, link, repos[(n - 1) * 100:n * 100]
+    github_server.route('/users/octo/repos', page)
+    analyzer = GitHubAnalyzer('octo', api_url=github_server.url, cache=cache)
+    assert len(analyzer.fetch_repos()) == 150
+    requests_before = len(github_server.requests)
+    assert len(analyzer.fetch_repos()) == 150
+    assert len(github_server.requests) == requests_before
@@ -0,0 +1,61 @@
+"""
+Unit tests for keyword_matcher.py
+"""
+
+import random
+import re
+from src.keyword_matcher import KeywordMatcher
+
+def test_word_boundary_semantics():
+    matcher = KeywordMatcher(['graph', 'algorithm', 'dynamic programming'])
+    assert matcher.find('graph algorithms') == ['graph']
+    assert matcher.find('graphs and paragraph') == []
+    assert matcher.find('uses dynamic programming on a graph') == ['graph', 'dynamic programming']
+    assert matcher.find('') == []
+
+def test_substring_semantics():
+    matcher = KeywordMatcher(['model', 'proof', 'analysis'], word_boundary=False)
+    assert matcher.find('models with proofs') == ['model', 'proof']
+    assert matcher.find('reanalysis') == ['analysis']
+
+def test_overlapping_and_prefix_keywords():
+    matcher = KeywordMatcher(['programming', 'dynamic programming', 'grad', 'gradient', 'neural', 'neural network'])
+    assert matcher.find('dynamic programming') == ['programming', 'dynamic programming']
+    assert matcher.find('gradient descent') == ['gradient']
+    assert matcher.find('grad student') == ['grad']
+    assert matcher.find('neural network') == ['neural', 'neural network']
+    substrings = KeywordMatcher(['theory', 'the'], word_boundary=False)
+    assert substrings.find('theory') == ['theory', 'the']
+
+def test_matches_reference_scan_on_random_texts():
+    rng = random.Random(7)
+    vocab = [''.join(rng.choice('abcde') for _ in range(rng.randint(1, 5))) for _ in range(120)]
+    keywords = list(dict.fromkeys(vocab[:60] + [f'{a} {b}' for a, b in zip(vocab[60:80], vocab[80:100])]))
+    for word_boundary in (True, False):
+        matcher = KeywordMatcher(keywords, word_boundary=word_boundary)
+        for _ in range(500):
+            text = ' '.join(rng.choice(vocab + ['-', '.']) for _ in range(rng.randint(0, 20)))
+            expected = [
+                kw for kw in keywords
+                if (re.search(r'\b' + re.escape(kw) + r'\b', text) if word_boundary else kw in text)
+            ]
+            assert matcher.find(text) == expected
+
+def test_special_characters_are_escaped():
+    matcher = KeywordMatcher(['c++', 'a.b'], word_boundary=False)
+    assert matcher.find('c++ and a.b') == ['c++', 'a.b']
+    assert matcher.find('axb') == []
+
+def test_match_matrix_matches_find(monkeypatch):
+    from src import keyword_matcher
+    monkeypatch.setattr(keyword_matcher, '_CHUNK_CHARS', 64)  # exercise several chunks
+    rng = random.Random(11)
+    vocab = ['graph', 'graphs', 'grad', 'gradient', 'c++', 'g', 'ph.d', 'x_y', 'neural', 'network', 'é', '-', '.', '\n']
+    keywords = ['graph', 'grad', 'gradient', 'c++', 'g', 'ph.d', 'neural network', 'neural', '+']
+    texts = [''.join(rng.choice(vocab + [' ', ' ']) for _ in range(rng.randint(0, 25))) for _ in range(400)]
+    for word_boundary in (True, False):
+        matcher = KeywordMatcher(keywords, word_boundary=word_boundary)
+        matrix = matcher.match_matrix(texts)
+        assert matrix.shape == (len(texts), len(keywords))
+        assert [[kw for kw, hit in zip(keywords, row) if hit] for row in matrix] == [matcher.find(t) for t in texts]
+    assert KeywordMatcher([]).match_matrix(['graph']).shape == (1, 0)
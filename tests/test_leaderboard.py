@@ -0,0 +1,68 @@
+"""
+Unit tests for leaderboard.py
+"""
+
+import random
+import pandas as pd
+import pytest
+from src.leaderboard import Leaderboard
+
+def brute_force_order(scores):
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+def test_matches_full_sort_under_random_updates():
+    rng = random.Random(7)
+    board = Leaderboard()
+    scores = {}
+    for step in range(3000):
+        candidate = f"c{rng.randrange(400)}"
+        if candidate in scores and rng.random() < 0.2:
+            board.remove(candidate)
+            del scores[candidate]
+        else:
+            scores[candidate] = float(rng.randrange(50))
+            board.add(candidate, scores[candidate])
+        if step % 250 == 0:
+            order = brute_force_order(scores)
+            assert [(c, s) for c, s, _ in board.top(25)] == order[:25]
+            for position, (c, _) in enumerate(order[::17]):
+                assert board.rank(c) == position * 17 + 1
+    assert len(board) == len(scores)
+
+def test_top_k_with_records():
+    board = Leaderboard([('a', 10), ('b', 30), ('c', 20)])
+    board.add('d', 25, record={'name': 'Dana'})
+    assert board.top(2) == [('b', 30.0, None), ('d', 25.0, {'name': 'Dana'})]
+    board.add('a', 40)  # re-score moves the candidate
+    assert board.top(1)[0][0] == 'a' and board.rank('b') == 2
+    assert board.top(10)[-1][0] == 'c'
+
+def test_percentiles():
+    board = Leaderboard((f"c{i}", float(i)) for i in range(101))
+    assert board.percentile('c100') == 100.0
+    assert board.percentile('c0') == 0.0
+    assert board.percentile('c50') == 50.0
+    assert board.score_at_percentile(90) == 90.0
+    board.add('tie', 50.0)
+    assert board.percentile('tie') == board.percentile('c50')
+    assert Leaderboard([('solo', 1)]).percentile('solo') == 100.0
+    with pytest.raises(ValueError):
+        Leaderboard().score_at_percentile(50)
+
+def test_from_scorer_frame():
+    frame = pd.DataFrame({'score': [12.5, 80.0, 40.0]}, index=pd.Index(['x', 'y', 'z'], name='candidate'))
+    board = Leaderboard.from_frame(frame)
+    assert [c for c, _, _ in board.top(3)] == ['y', 'z', 'x']
+    assert 'y' in board and board.score('x') == 12.5
+
+def test_bulk_load_then_incremental():
+    rng = random.Random(3)
+    scores = {f"c{i}": float(rng.randrange(1000)) for i in range(2000)}
+    board = Leaderboard(scores.items())
+    for i in range(200):
+        scores[f"n{i}"] = float(rng.randrange(1000))
+        board.add(f"n{i}", scores[f"n{i}"])
+    order = brute_force_order(scores)
+    assert [c for c, _, _ in board.top(100)] == [c for c, _ in order[:100]]
+    for position in range(0, len(order), 97):
+        assert board.rank(order[position][0]) == position + 1
@@ -87,3 +87,123 @@ def test_extract_skills_nonstandard_header(parser):
     sample_text = "Core Competencies\nLeadership, Communication, Problem Solving"
     expected_skills = ["Leadership", "Communication", "Problem Solving"]
     assert parser.extract_skills(sample_text) == expected_skills
+
+def test_batch_parse_parallel_matches_serial(parser):
+    if len(parser.get_pdf_files()) < 2:
+        pytest.skip("Need several sample PDF resumes for the parallel batch test.")
+    serial = parser.batch_parse()
+    parallel = parser.batch_parse(workers=2, chunksize=2)
+    assert parallel == serial
+
+def test_batch_parse_isolates_failures(tmp_path):
+    pdfs = ResumeParser().get_pdf_files()
+    if not pdfs:
+        pytest.skip("No sample PDF resumes present for batch parse test.")
+    with open(pdfs[0], 'rb') as src:
+        (tmp_path / 'good.pdf').write_bytes(src.read())
+    (tmp_path / 'broken.pdf').write_bytes(b'%PDF-1.4 truncated')
+    for workers in (1, 2):
+        results = {r['filename']: r for r in ResumeParser(str(tmp_path)).batch_parse(workers=workers)}
+        assert set(results) == {'good.pdf', 'broken.pdf'}
+        assert 'error' not in results['good.pdf'] and results['good.pdf']['raw_text']
+        assert results['broken.pdf']['error']
+        assert results['broken.pdf']['skills'] == []
+
+def test_iter_parse_streams_records(parser):
+    pdfs = parser.get_pdf_files()
+    if not pdfs:
+        pytest.skip("No sample PDF resumes present for streaming parse test.")
+    stream = parser.iter_parse(keep_raw_text=False)
+    first = next(stream)
+    assert 'raw_text' not in first and 'name' in first
+    rest = list(stream)
+    assert len(rest) == len(pdfs) - 1
+    unordered = list(parser.iter_parse(workers=2, chunksize=1, ordered=False))
+    assert sorted(r['filename'] for r in unordered) == sorted(os.path.basename(p) for p in pdfs)
+
+def test_iter_parse_spills_raw_text(parser, tmp_path):
+    if not parser.get_pdf_files():
+        pytest.skip("No sample PDF resumes present for streaming parse test.")
+    for record in parser.iter_parse(raw_text_dir=str(tmp_path / 'text')):
+        assert 'raw_text' not in record
+        with open(record['raw_text_path'], encoding='utf-8') as f:
+            assert f.read() == parser.extract_text(os.path.join(parser.resume_dir, record['filename']))
+
+def test_parse_to_jsonl(parser, tmp_path):
+    pdfs = parser.get_pdf_files()
+    if not pdfs:
+        pytest.skip("No sample PDF resumes present for JSONL sink test.")
+    out = tmp_path / 'resumes.jsonl'
+    assert parser.parse_to_jsonl(str(out), workers=2, keep_raw_text=False) == len(pdfs)
+    import json
+    records = [json.loads(line) for line in out.read_text(encoding='utf-8').splitlines()]
+    assert [r['filename'] for r in records] == [os.path.basename(p) for p in pdfs]
+
+def multi_page_pdf(path, copies=3):
+    import pypdf
+    writer = pypdf.PdfWriter()
+    for _ in range(copies):
+        writer.append(sorted(ResumeParser().get_pdf_files())[0])
+    with open(path, 'wb') as f:
+        writer.write(f)
+    return str(path)
+
+def test_extract_text_page_and_char_limits(parser, tmp_path):
+    if not parser.get_pdf_files():
+        pytest.skip("No sample PDF resumes present for extraction limit tests.")
+    pdf = multi_page_pdf(tmp_path / 'long.pdf')
+    full = parser.extract_text(pdf)
+    one_page = ResumeParser(max_pages=1).extract_text(pdf)
+    assert 0 < len(one_page) < len(full) and full.startswith(one_page)
+    assert ResumeParser(max_chars=50).extract_text(pdf) == full[:50]
+
+def test_extract_timeout_isolated(tmp_path, monkeypatch):
+    import time
+    from resume_parser import ExtractionTimeout
+    (tmp_path / 'slow.pdf').write_bytes(b'%PDF-')
+
+    def slow_pages(self, pdf_path):
+        for _ in range(100):
+            time.sleep(0.02)
+            yield 'page'
+    monkeypatch.setattr(ResumeParser, 'iter_page_text', slow_pages)
+    slow = ResumeParser(str(tmp_path), timeout=0.1)
+    with pytest.raises(ExtractionTimeout):
+        slow.extract_text(str(tmp_path / 'slow.pdf'))
+    assert slow.parse_file(str(tmp_path / 'slow.pdf'))['error'].startswith('ExtractionTimeout')
+
+def test_memory_guarded_workers(parser):
+    if not parser.get_pdf_files():
+        pytest.skip("No sample PDF resumes present for memory guard test.")
+    guarded = ResumeParser(max_memory_mb=2048, timeout=30)
+    assert guarded.batch_parse(workers=2) == parser.batch_parse()
+
+class CrashingParser(ResumeParser):
+    """Kills its worker process on files named crash*, like a segfault in a PDF library."""
+    def extract_text(self, path):
+        if os.path.basename(path).startswith('crash'):
+            os._exit(1)
+        return super().extract_text(path)
+
+def test_crashed_worker_only_loses_its_file(tmp_path):
+    for name in ('a.txt', 'b.txt', 'crash.txt', 'c.txt', 'd.txt', 'e.txt'):
+        (tmp_path / name).write_text(f"{name}\nSkills\nnumpy\n", encoding='utf-8')
+    paths = [str(tmp_path / name) for name in ('a.txt', 'b.txt', 'crash.txt', 'c.txt', 'd.txt', 'e.txt')]
+    records = list(CrashingParser(str(tmp_path)).iter_parse(workers=2, chunksize=2, paths=paths))
+    assert [r['filename'] for r in records] == [os.path.basename(p) for p in paths]
+    errors = {r['filename']: r['error'] for r in records if 'error' in r}
+    assert list(errors) == ['crash.txt'] and errors['crash.txt'].startswith('BrokenProcessPool')
+    assert all(r['skills'] == ['numpy'] for r in records if r['filename'] != 'crash.txt')
+
+class LimitReportingParser(ResumeParser):
+    def parse_resume(self, text):
+        import resource
+        return {**super().parse_resume(text), 'pid': os.getpid(), 'limit': resource.getrlimit(resource.RLIMIT_AS)[0]}
+
+def test_memory_guard_applies_to_single_worker(tmp_path):
+    pytest.importorskip('resource')
+    (tmp_path / 'a.txt').write_text("Ada\nSkills\nnumpy\n", encoding='utf-8')
+    records = list(LimitReportingParser(str(tmp_path), max_memory_mb=2048).iter_parse(workers=1))
+    assert records[0]['pid'] != os.getpid() and records[0]['limit'] <= 2048 * 1024 * 1024
+    unguarded = list(LimitReportingParser(str(tmp_path)).iter_parse(workers=1))
+    assert unguarded[0]['pid'] == os.getpid()
@@ -0,0 +1,52 @@
+"""
+Unit tests for resume_sections.py
+"""
+
+from src.resume_sections import segment_sections
+
+SAMPLE = """Ada Lovelace
+Mathematician
+
+EDUCATION
+B.S. Mathematics, University of London
+Professional Experience
+Analyst, Analytical Engines
+Technical Skills
+Mathematics, Programming
+Projects
+Difference engine notes
+Publications
+Notes on the Analytical Engine, 1843
+"""
+
+def test_section_spans():
+    index = segment_sections(SAMPLE)
+    assert index.first_line() == "Ada Lovelace"
+    assert index.section('education') == ["B.S. Mathematics, University of London"]
+    assert index.section('experience') == ["Analyst, Analytical Engines"]
+    assert index.section('skills') == ["Mathematics, Programming"]
+    assert index.section('projects') == ["Difference engine notes"]
+    assert index.section('publications') == ["Notes on the Analytical Engine, 1843"]
+    assert index.lines[index.spans['education'][0]] == "B.S. Mathematics, University of London"
+
+def test_missing_and_unknown_sections():
+    index = segment_sections("Jane Doe\nSkills\nPython")
+    assert index.section('education') == []
+    assert index.section('hobbies') == []
+    assert segment_sections("").first_line() == ""
+
+def test_first_header_wins_and_shared_header_lines_close_sections():
+    index = segment_sections("Education\nB.S.\nEducation & Experience\nPhD\nSkills\nR")
+    # A line naming another section ends the current one, even if it names this one too
+    assert index.section('education') == ["B.S."]
+    assert index.section('experience') == ["PhD"]
+
+def test_core_competencies_is_a_skills_header():
+    index = segment_sections("Experience\nEngineer\nCore Competencies\nLeadership")
+    assert index.section('experience') == ["Engineer"]
+    assert index.section('skills') == ["Leadership"]
+
+def test_unicode_lowercasing_keeps_line_mapping():
+    index = segment_sections("İİİİ Skills\nPython\nEducation\nB.S.")
+    assert index.section('skills') == ["Python"]
+    assert index.section('education') == ["B.S."]
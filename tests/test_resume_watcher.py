@@ -0,0 +1,84 @@
+"""
+Unit tests for resume_watcher.py
+"""
+
+import os
+import shutil
+import threading
+import pytest
+from src.resume_parser import ResumeParser
+from src.resume_watcher import ResumeWatcher
+
+@pytest.fixture
+def sample_pdfs():
+    pdfs = ResumeParser().get_pdf_files()
+    if len(pdfs) < 2:
+        pytest.skip("Not enough sample PDF resumes present for watcher tests.")
+    return sorted(pdfs)[:2]
+
+def make_watcher(inbox, manifest, **options):
+    return ResumeWatcher(ResumeParser(str(inbox)), manifest_path=str(manifest), settle_seconds=0, **options)
+
+def test_poll_reports_only_changes(tmp_path, sample_pdfs):
+    inbox = tmp_path / 'inbox'
+    inbox.mkdir()
+    manifest = tmp_path / 'manifest.json'
+    shutil.copy(sample_pdfs[0], inbox / 'a.pdf')
+    watcher = make_watcher(inbox, manifest)
+
+    events = list(watcher.poll())
+    assert [(e.kind, os.path.basename(e.path)) for e in events] == [('added', 'a.pdf')]
+    assert events[0].record['filename'] == 'a.pdf' and 'name' in events[0].record
+    assert list(watcher.poll()) == []
+
+    shutil.copy(sample_pdfs[1], inbox / 'b.pdf')
+    with open(inbox / 'a.pdf', 'ab') as f:
+        f.write(b'\n% appended\n')
+    events = {os.path.basename(e.path): e.kind for e in watcher.poll()}
+    assert events == {'a.pdf': 'modified', 'b.pdf': 'added'}
+
+    os.remove(inbox / 'b.pdf')
+    events = list(watcher.poll())
+    assert [(e.kind, e.record) for e in events] == [('deleted', None)]
+
+def test_manifest_survives_restart(tmp_path, sample_pdfs):
+    inbox = tmp_path / 'inbox'
+    inbox.mkdir()
+    manifest = tmp_path / 'manifest.json'
+    shutil.copy(sample_pdfs[0], inbox / 'a.pdf')
+    assert len(list(make_watcher(inbox, manifest).poll())) == 1
+    assert list(make_watcher(inbox, manifest).poll()) == []
+
+def test_unsettled_files_wait(tmp_path, sample_pdfs):
+    inbox = tmp_path / 'inbox'
+    inbox.mkdir()
+    shutil.copy(sample_pdfs[0], inbox / 'a.pdf')
+    watcher = ResumeWatcher(ResumeParser(str(inbox)), manifest_path=str(tmp_path / 'm.json'), settle_seconds=60)
+    assert list(watcher.poll()) == []
+    watcher.settle_seconds = 0
+    assert len(list(watcher.poll())) == 1
+
+def test_watch_parallel_until_stopped(tmp_path, sample_pdfs):
+    inbox = tmp_path / 'inbox'
+    inbox.mkdir()
+    for i, pdf in enumerate(sample_pdfs):
+        shutil.copy(pdf, inbox / f'{i}.pdf')
+    watcher = make_watcher(inbox, tmp_path / 'm.json', workers=2, keep_raw_text=False)
+    stop = threading.Event()
+    seen = []
+    for event in watcher.watch(interval=0.01, stop=stop):
+        seen.append(event)
+        if len(seen) == len(sample_pdfs):
+            stop.set()
+    assert sorted(e.record['filename'] for e in seen) == ['0.pdf', '1.pdf']
+    assert all('raw_text' not in e.record for e in seen)
+
+def test_non_resume_files_are_ignored(tmp_path):
+    inbox = tmp_path / 'inbox'
+    inbox.mkdir()
+    (inbox / 'photo.jpg').write_bytes(b'\xff\xd8\xff\xe0\x00\x10JFIF\x00')
+    (inbox / 'note.txt').write_text('Grace Hopper\nSkills\nCOBOL\n', encoding='utf-8')
+    watcher = make_watcher(inbox, tmp_path / 'm.json')
+    assert [os.path.basename(e.path) for e in watcher.poll()] == ['note.txt']
+    os.remove(inbox / 'photo.jpg')
+    assert list(watcher.poll()) == []
@@ -0,0 +1,87 @@
+"""
+Unit tests for scoring_profile.py
+"""
+
+import json
+import pickle
+import pytest
+from src.github_analyzer import GitHubAnalyzer, normalize_repos
+from src.scoring_profile import DEFAULT_PROFILE, ScoringProfile, compile_profile, load_profile
+from src.skill_scorer import SkillScorer
+
+REPOS = [
+    {'name': 'solver', 'description': 'Convex optimization with cvxpy and numpy', 'topics': ['optimization'],
+     'language': 'Python', 'has_wiki': True},
+    {'name': 'qc', 'description': 'Quantum circuits simulator in qiskit', 'topics': ['quantum'], 'language': 'Python'},
+]
+
+QUANTUM = {
+    'name': 'quantum',
+    'keywords': {'math_libraries': ['qiskit', 'numpy'], 'complexity': ['quantum', 'simulator']},
+    'documentation': {'points': {'wiki': 3}},
+    'complexity_thresholds': [1, 2, 3],
+    'weights': {'unique_libs': 1.0},
+}
+
+def test_default_profile_reproduces_builtin_analysis():
+    analysis = GitHubAnalyzer('octocat').analyze_all(REPOS)
+    assert set(analysis.math_libraries) == {'cvxpy', 'numpy'}
+    assert analysis.complexity['solver']['complexity_signals'] == ['optimization', 'convex']
+    assert analysis.documentation['solver']['score'] == 1 + 1  # doc keyword + wiki
+
+def test_custom_profile_changes_keywords_points_and_thresholds():
+    profile = ScoringProfile.from_dict(QUANTUM)
+    analysis = GitHubAnalyzer('octocat', scoring_profile=profile).analyze_all(REPOS)
+    assert set(analysis.math_libraries) == {'qiskit', 'numpy'}
+    assert analysis.complexity == {'qc': {'complexity_signals': ['quantum', 'simulator'], 'score': 2}}
+    assert analysis.complexity_levels == [2]
+    assert analysis.documentation['solver']['score'] == 1 + 3
+
+def test_compiled_once_per_content():
+    a = ScoringProfile.from_dict(QUANTUM)
+    b = ScoringProfile.from_dict({**QUANTUM, 'name': 'renamed'})
+    assert a.digest == b.digest
+    assert compile_profile(a) is compile_profile(b)
+    assert compile_profile(a) is not compile_profile(DEFAULT_PROFILE)
+    # Weight-only changes reuse the compiled matchers
+    reweighted = ScoringProfile.from_dict({**QUANTUM, 'weights': {'unique_libs': 2.0}})
+    assert compile_profile(reweighted).library_matcher is compile_profile(a).library_matcher
+
+def test_profile_mappings_are_read_only():
+    weights = {'unique_libs': 2.0}
+    profile = ScoringProfile(weights=weights)
+    digest = profile.digest
+    weights['unique_libs'] = 9.0  # the caller's dict is copied
+    with pytest.raises(TypeError):
+        profile.weights['unique_libs'] = 9.0
+    assert profile.weights['unique_libs'] == 2.0 and profile.digest == digest
+    assert pickle.loads(pickle.dumps(profile)) == profile
+
+def test_reanalyze_from_normalized_texts():
+    texts = normalize_repos(REPOS)
+    default = GitHubAnalyzer('octocat').analyze_all(REPOS, texts=texts)
+    quantum = GitHubAnalyzer('octocat', scoring_profile=ScoringProfile.from_dict(QUANTUM)).analyze_all(REPOS, texts=texts)
+    assert default == GitHubAnalyzer('octocat').analyze_all(REPOS)
+    assert 'qiskit' in quantum.math_libraries
+
+def test_load_json_and_yaml_roundtrip(tmp_path):
+    json_path = tmp_path / 'quantum.json'
+    json_path.write_text(json.dumps(QUANTUM))
+    profile = load_profile(str(json_path))
+    assert profile.name == 'quantum' and profile.math_libraries == ('qiskit', 'numpy')
+    yaml = pytest.importorskip('yaml')
+    yaml_path = tmp_path / 'quantum.yaml'
+    yaml_path.write_text(yaml.safe_dump(profile.to_dict()))
+    assert load_profile(str(yaml_path)) == profile
+
+def test_invalid_profiles_rejected():
+    for bad in ({'weights': {'charisma': 1}}, {'keywords': {'colors': ['red']}}, {'complexity_thresholds': [3, 1, 2]},
+                {'caps': {'unique_libs': 0}}, {'documentation': {'points': {'stars': 1}}}, {'scoring': {}}):
+        with pytest.raises(ValueError):
+            ScoringProfile.from_dict(bad)
+
+def test_scorer_uses_profile_weights():
+    scorer = SkillScorer(profile=ScoringProfile.from_dict({'weights': {f: 0 for f in
+                         ['avg_complexity_level', 'avg_doc_score', 'math_skills', 'degree_level']}}))
+    result = scorer.score([{'id': 'a', 'github': {'math_libraries': {'numpy': {}, 'scipy': {}}}}])
+    assert result.loc['a', 'score'] == pytest.approx(2 / 5 * 100)
@@ -3,4 +3,85 @@
 Unit tests for skill_scorer.py
 """
 
-# Add test cases for skill scoring logic
+import numpy as np
+import pandas as pd
+import pytest
+from src.github_analyzer import GitHubAnalysis
+from src.skill_scorer import FEATURES, SkillScorer, github_features, resume_features
+
+STRONG_GITHUB = {
+    'username': 'ada',
+    'math_libraries': {lib: ['repo'] for lib in ['numpy', 'scipy', 'sympy', 'networkx', 'jax', 'cvxpy']},
+    'complexity': {'repo': {'score': 5, 'keywords': []}},
+    'documentation': {'repo': {'score': 4}},
+}
+STRONG_RESUME = {
+    'filename': 'ada.pdf',
+    'education': ['Ph.D. in Applied Mathematics', 'B.Sc. Physics'],
+    'experience': ['Built bayesian optimization and stochastic simulation tools'],
+    'skills': ['Python', 'NumPy', 'Linear Algebra', 'Statistics', 'Probability', 'Machine Learning'],
+}
+
+def test_github_features_accepts_analysis_or_dict():
+    analysis = GitHubAnalysis(STRONG_GITHUB['math_libraries'], STRONG_GITHUB['complexity'], STRONG_GITHUB['documentation'])
+    assert github_features(analysis) == github_features(STRONG_GITHUB)
+    assert github_features(STRONG_GITHUB) == {'unique_libs': 6, 'avg_complexity_level': 3, 'avg_doc_score': 4}
+    assert github_features(None)['unique_libs'] == 0
+
+def test_resume_features():
+    features = resume_features(STRONG_RESUME)
+    assert features['degree_level'] == 3
+    assert features['math_skills'] >= 6
+    assert resume_features({'education': ['B.S. Biology'], 'skills': [], 'experience': []}) == {'math_skills': 0, 'degree_level': 1}
+    assert resume_features(None) == {'math_skills': 0, 'degree_level': 0}
+
+def test_score_cohort_ranks_candidates():
+    scorer = SkillScorer()
+    result = scorer.score([
+        {'github': STRONG_GITHUB, 'resume': STRONG_RESUME},
+        {'id': 'empty'},
+        {'resume': {'filename': 'bob.pdf', 'education': ['MSc Statistics'], 'skills': ['R', 'Statistics'], 'experience': []}},
+    ])
+    assert list(result.index) == ['ada', 'empty', 'bob.pdf']
+    assert result.loc['ada', 'score'] == pytest.approx(100.0)
+    assert result.loc['empty', 'score'] == 0.0
+    assert list(result['rank']) == [1, 3, 2]
+    assert result[[f + '_norm' for f in FEATURES]].to_numpy().max() <= 1.0
+
+def test_custom_weights_and_validation():
+    features = pd.DataFrame([[5, 0, 0, 0, 0]], columns=FEATURES, index=['libs_only'])
+    assert SkillScorer(weights={f: 0 for f in FEATURES} | {'unique_libs': 1}).score_features(features)['score'].iloc[0] == 100.0
+    with pytest.raises(ValueError):
+        SkillScorer(weights={'charisma': 1})
+    with pytest.raises(ValueError):
+        SkillScorer(weights={f: 0 for f in FEATURES})
+
+def test_score_features_matches_per_row_arithmetic():
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.random((1000, len(FEATURES))) * 6, columns=FEATURES)
+    scorer = SkillScorer()
+    scores = scorer.score_features(features)['score'].to_numpy()
+    row = features.iloc[7]
+    expected = sum(min(row[f] / cap, 1.0) * w for f, cap, w in zip(FEATURES, scorer.caps, scorer.weights)) / scorer.weights.sum() * 100
+    assert scores[7] == pytest.approx(expected)
+
+def test_cohort_features_match_per_candidate_features():
+    from benchmarks.generators import make_repos, make_resume_texts
+    from src.github_analyzer import GitHubAnalyzer
+    from src.resume_parser import ResumeParser
+    parser, analyzer = ResumeParser(), GitHubAnalyzer('cohort')
+    resumes = [parser.parse_resume(text) for text in make_resume_texts(60, seed=2)]
+    resumes[3]['skills'].append('Éléments de statistics')  # non-ASCII text takes the fallback path
+    candidates = []
+    for i, resume in enumerate(resumes):
+        github = analyzer.analyze_all(make_repos(i % 7, seed=i))
+        if i % 3 == 1:
+            github = github.to_dict()
+        elif i % 5 == 2:
+            github = GitHubAnalysis(github.math_libraries, github.complexity, github.documentation, (2, 1, 5))
+        candidates.append({'id': f'c{i}', 'resume': resume if i % 4 else None, 'github': github if i % 6 else None})
+    scorer = SkillScorer()
+    expected = [[*github_features(c['github'], scorer.scoring).values(), *resume_features(c['resume'], scorer.scoring).values()]
+                for c in candidates]
+    assert scorer.features(candidates).to_numpy().tolist() == expected
+    assert scorer.features([]).shape == (0, len(FEATURES))
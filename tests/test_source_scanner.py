@@ -0,0 +1,103 @@
+"""
+Unit tests for source_scanner.py
+"""
+
+import json
+
+import pytest
+
+from src.github_analyzer import GitHubAnalyzer
+from src.source_scanner import (
+    SourceScanner, imports_in_code, imports_in_notebook, libraries_for_modules,
+)
+
+
+NOTEBOOK = json.dumps({'cells': [
+    {'cell_type': 'markdown', 'source': ['import fake_markdown_module']},
+    {'cell_type': 'code', 'source': ['%matplotlib inline\n', '!pip install cvxpy\n', 'import sympy as sp\n']},
+]})
+
+
+@pytest.fixture
+def repo_server(repo_server):
+    repo_server.repo['files'] = {
+        'solver.py': 'import numpy as np\nfrom scipy.optimize import minimize\nfrom . import utils\nimport random\n',
+        'model/net.py': 'import torch.nn as nn\n',
+        'legacy.py': 'print "hi"\nimport networkx\n',
+        'analysis.ipynb': NOTEBOOK,
+        'venv/lib/site-packages/jax/core.py': 'import jax\n',
+        'README.md': 'import pandas',
+    }
+    return repo_server
+
+
+CALC = {'name': 'calc', 'full_name': 'octo/calc', 'default_branch': 'main', 'language': 'Python', 'description': ''}
+
+
+def test_imports_in_code_and_notebook():
+    assert imports_in_code('import os.path, numpy as np\nfrom .local import x\nfrom scipy import linalg') == \
+        {'os', 'numpy', 'scipy'}
+    assert imports_in_code('print "py2"\nimport sympy\nfrom mpmath import mp') == {'sympy', 'mpmath'}
+    assert imports_in_notebook(NOTEBOOK) == {'sympy'}
+    assert imports_in_notebook('not json') == set()
+    assert libraries_for_modules(['torch', 'random', 'itertools', 'numpy']) == ['numpy', 'pytorch']
+
+
+def test_scan_repo_streams_archive(repo_server, make_stage):
+    with make_stage(SourceScanner, repo_server, workers=1) as scanner:
+        result = scanner.scan_repo(CALC)
+    assert result.sha == 'abc123'
+    assert set(result.modules) == {'numpy', 'scipy', 'random', 'torch', 'networkx', 'sympy'}
+    assert result.files == 4 and not result.truncated
+
+
+def test_scan_uses_process_pool(repo_server, make_stage):
+    with make_stage(SourceScanner, repo_server, workers=2) as scanner:
+        assert 'torch' in scanner.scan_repo(CALC).modules
+
+
+def test_unchanged_repo_is_not_rescanned(repo_server, make_stage):
+    with make_stage(SourceScanner, repo_server) as scanner:
+        first = scanner.scan_repo(CALC)
+    with make_stage(SourceScanner, repo_server) as scanner:
+        assert scanner.scan_repo(CALC) == first
+        assert (scanner.hits, scanner.misses) == (1, 0)
+    assert repo_server.paths().count('/repos/octo/calc/tarball/abc123') == 1
+
+
+def test_file_cap_and_byte_budget(repo_server, make_stage):
+    repo_server.repo['files'] = {
+        'a.py': 'import numpy\n',
+        'big.py': 'import sympy\n' + '#' * 4096,
+        'data.bin': b'\0' * 20000,
+        'z.py': 'import scipy\n',
+    }
+    with make_stage(SourceScanner, repo_server, max_file_bytes=1024) as scanner:
+        result = scanner.scan_repo(CALC)
+    assert set(result.modules) == {'numpy', 'scipy'} and not result.truncated
+    with make_stage(SourceScanner, repo_server, max_total_bytes=10000) as scanner:
+        result = scanner.scan_repo(CALC)
+    assert set(result.modules) == {'numpy', 'sympy'} and result.truncated
+
+
+def test_annotate_feeds_library_analysis(repo_server, make_stage):
+    repos = [CALC, {'name': 'site', 'language': 'JavaScript', 'description': 'uses numpy'}]
+    with make_stage(SourceScanner, repo_server) as scanner:
+        annotated = scanner.annotate(repos)
+    assert annotated[0]['source_libraries'] == ['networkx', 'numpy', 'pytorch', 'scipy', 'sympy']
+    assert 'source_libraries' not in annotated[1]
+    assert not any('/repos/octo/site' in path for path in repo_server.paths())
+    libraries = GitHubAnalyzer('octo').analyze_all(annotated).math_libraries
+    assert libraries['pytorch']['repos'] == ['calc']
+    assert libraries['numpy']['repos'] == ['calc', 'site']
+
+
+def test_failing_repo_does_not_abort_the_scan(repo_server, make_stage):
+    repo_server.route('/repos/octo/empty/commits/main',
+                      lambda q, h: (409, {}, {'message': 'Git Repository is empty.'}))
+    empty = {**CALC, 'name': 'empty', 'full_name': 'octo/empty'}
+    with make_stage(SourceScanner, repo_server) as scanner:
+        annotated = scanner.annotate([empty, CALC])
+    assert 'source_libraries' not in annotated[0]
+    assert 'numpy' in annotated[1]['source_libraries']
+    assert set(scanner.failed) == {'empty'} and '409' in scanner.failed['empty']